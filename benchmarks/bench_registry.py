@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Registry index, search, and server throughput benchmarks.
+
+Runs offline against synthetic registries. End-to-end cases fetch from a local
+`http.server` stand-in for the official Registry, then drive JSON-RPC requests
+through `handle_request` in process and through `main()` over stdio.
+
+    python benchmarks/bench_registry.py --output registry.json
+    python benchmarks/bench_registry.py --sizes 1000 --baseline registry.json
+
+Copyright 2024 James Dominguez
+Licensed under the Apache License, Version 2.0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from synthetic import ROOT, RegistryStub, synthetic_servers  # also puts ROOT on sys.path
+
+import describe
+
+QUERIES = ("github", "kafka embeddings", "org42/", "no-such-capability")
+
+
+def timed(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"medianMs": round(statistics.median(samples), 3), "minMs": round(min(samples), 3)}
+
+
+async def timed_async(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"medianMs": round(statistics.median(samples), 3), "minMs": round(min(samples), 3)}
+
+
+async def bench_manager(size: int, servers: list[dict[str, Any]], repeat: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as home:
+        manager = describe.MCPPackageManager(home=home, registry_url="builtin")
+        results: dict[str, Any] = {
+            "index": timed(lambda: manager._index_registry(servers, "bench"), repeat)
+        }
+
+        sample = [manager.registry[key] for key in list(manager.registry)[:: max(1, size // 50)]]
+        names = [server["shortName"] for server in sample] + [server["name"] for server in sample]
+        results["resolve"] = timed(
+            lambda: [manager._resolve_server(name) for name in names], repeat
+        )
+        results["resolve"]["lookups"] = len(names)
+
+        results["search"] = {
+            query: await timed_async(lambda query=query: manager.search_page(query), repeat)
+            for query in QUERIES
+        }
+        results["listAvailable"] = await timed_async(manager.list_available, repeat)
+        results["listAvailablePage"] = await timed_async(manager.list_available_page, repeat)
+
+        results["cacheSave"] = await timed_async(
+            lambda: manager._save_cached_registry(servers, "bench"), repeat
+        )
+        results["cacheLoad"] = await timed_async(manager._load_cached_registry, repeat)
+        results["cacheBytes"] = manager.registry_cache.stat().st_size
+    return results
+
+
+REQUESTS = [
+    {"jsonrpc": "2.0", "method": "tools/list"},
+    {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "list", "arguments": {}}},
+    {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": "search", "arguments": {"query": "github"}},
+    },
+    {
+        "jsonrpc": "2.0",
+        "method": "resources/read",
+        "params": {"uri": "describe://registry/available?fields=minimal"},
+    },
+]
+
+
+def request_stream(count: int) -> list[dict[str, Any]]:
+    return [{**REQUESTS[index % len(REQUESTS)], "id": index} for index in range(count)]
+
+
+def bench_end_to_end(size: int, servers: list[dict[str, Any]], count: int) -> dict[str, Any]:
+    with RegistryStub(servers) as stub, tempfile.TemporaryDirectory() as home:
+        env = {
+            "DESCRIBE_HOME": home,
+            "DESCRIBE_REGISTRY": stub.url,
+            "DESCRIBE_REGISTRY_LIMIT": str(size),
+        }
+        saved = {key: os.environ.get(key) for key in env}
+        os.environ.update(env)
+        try:
+            started = time.perf_counter()
+            asyncio.run(describe.MCPPackageManager().refresh_registry())
+            cold_fetch_ms = (time.perf_counter() - started) * 1000
+
+            async def drive() -> None:
+                for request in request_stream(count):
+                    await describe.handle_request(request)
+
+            started = time.perf_counter()
+            asyncio.run(drive())
+            in_process = count / (time.perf_counter() - started)
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+        stdin = "".join(json.dumps(request) + "\n" for request in request_stream(count))
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(ROOT / "describe.py")],
+            input=stdin,
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        stdio = count / (time.perf_counter() - started)
+
+    return {
+        "requests": count,
+        "coldFetchMs": round(cold_fetch_ms, 1),
+        "registryHttpRequests": stub.requests,
+        "handleRequestPerSecond": round(in_process, 1),
+        "stdioPerSecond": round(stdio, 1),
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], path: str = "") -> list[str]:
+    """Lines of `metric: baseline -> current (ratio)` for every shared timing."""
+    lines = []
+    for key, value in current.items():
+        other = baseline.get(key) if isinstance(baseline, dict) else None
+        label = f"{path}.{key}" if path else key
+        if isinstance(value, dict):
+            lines.extend(compare(value, other or {}, label))
+        elif isinstance(value, (int, float)) and isinstance(other, (int, float)) and other:
+            lines.append(f"{label}: {other} -> {value} ({value / other:.2f}x)")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per timing.")
+    parser.add_argument("--requests", type=int, default=40, help="JSON-RPC requests per size.")
+    parser.add_argument("--skip-e2e", action="store_true", help="Skip end-to-end throughput.")
+    parser.add_argument("--output", help="Write JSON results to this file.")
+    parser.add_argument("--baseline", help="Earlier results file to compare against.")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "benchmark": "registry",
+        "describeVersion": describe.VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": {},
+    }
+    for size in args.sizes:
+        servers = synthetic_servers(size)
+        entry = asyncio.run(bench_manager(size, servers, args.repeat))
+        if not args.skip_e2e:
+            entry["endToEnd"] = bench_end_to_end(size, servers, args.requests)
+        results["sizes"][str(size)] = entry
+        print(f"{size} servers done", file=sys.stderr)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        print("\n".join(compare(results["sizes"], baseline.get("sizes", {}))), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Bytes on the wire and CPU per `tools/call list` response.
+
+Compares the current single-pass encoder against the previous encoding
+(pretty-printed, key-sorted text content, then a second full json.dumps of the
+response) over synthetic registries. `list` is paged, so each size walks every
+page at the largest page size and reports totals for the whole listing.
+
+    python benchmarks/bench_serialization.py --sizes 100 1000 10000
+
+Copyright 2024 James Dominguez
+Licensed under the Apache License, Version 2.0
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import synthetic_servers  # also puts the repo root on sys.path
+
+import describe
+
+
+def legacy_encode(request_id, payload) -> str:
+    structured = payload if isinstance(payload, dict) else {"result": payload}
+    result = {
+        "content": [{"type": "text", "text": json.dumps(payload, indent=2, sort_keys=True)}],
+        "structuredContent": structured,
+    }
+    return json.dumps(describe.jsonrpc_result(request_id, result))
+
+
+def current_encode(request_id, payload) -> str:
+    return describe.encode_response(
+        describe.jsonrpc_result(request_id, describe.tool_call_result(payload))
+    )
+
+
+def measure(encode, pages: list, repeat: int) -> dict:
+    started = time.process_time()
+    for request_id in range(repeat):
+        lines = [encode(request_id, payload) for payload in pages]
+    cpu_ms = (time.process_time() - started) * 1000 / repeat
+    return {
+        "bytes": sum(len(line.encode("utf-8")) for line in lines),
+        "cpuMsPerListing": round(cpu_ms, 3),
+    }
+
+
+async def list_pages(manager) -> list:
+    """Every page of `list` at the largest page size, as a client walking the listing sees it."""
+    pages, args = [], {"limit": describe.MAX_PAGE_SIZE}
+    while True:
+        payload = await describe.call_tool("list", args, manager)
+        pages.append(payload)
+        if "nextCursor" not in payload:
+            return pages
+        args = {**args, "cursor": payload["nextCursor"]}
+
+
+async def bench_size(size: int, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as home:
+        manager = describe.MCPPackageManager(home=home, registry_url="builtin")
+        manager._index_registry(synthetic_servers(size), "synthetic")
+        pages = await list_pages(manager)
+    return {
+        "servers": size,
+        "entries": sum(payload["count"] for payload in pages),
+        "pages": len(pages),
+        "legacy": measure(legacy_encode, pages, repeat),
+        "current": measure(current_encode, pages, repeat),
+    }
+
+
+async def run(sizes: list[int], repeat: int) -> list[dict]:
+    return [await bench_size(size, repeat) for size in sizes]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5, help="Encodes per measurement.")
+    parser.add_argument("--output", help="Write JSON results to this file.")
+    args = parser.parse_args()
+
+    results = {"benchmark": "serialization", "results": asyncio.run(run(args.sizes, args.repeat))}
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
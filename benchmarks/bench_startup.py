@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the describe CLI and stdio server.
+
+Each case launches a fresh Python process, so the numbers include interpreter
+startup and every module describe imports on that path. Runs offline against
+the built-in registry.
+
+    python benchmarks/bench_startup.py --runs 20 --output startup.json
+
+Copyright 2024 James Dominguez
+Licensed under the Apache License, Version 2.0
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DESCRIBE = ROOT / "describe.py"
+
+INITIALIZE = {"jsonrpc": "2.0", "id": 1, "method": "initialize"}
+TOOLS_LIST = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+CASES = {
+    "import": ([sys.executable, "-c", "import describe"], None),
+    "--version": ([sys.executable, str(DESCRIBE), "--version"], None),
+    "installed": ([sys.executable, str(DESCRIBE), "installed"], None),
+    "list": ([sys.executable, str(DESCRIBE), "list"], None),
+    "tools/list": (
+        [sys.executable, str(DESCRIBE)],
+        "\n".join(json.dumps(message) for message in (INITIALIZE, TOOLS_LIST)) + "\n",
+    ),
+}
+
+
+def run_case(command: list[str], stdin: str, env: dict[str, str], runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            command,
+            input=stdin,
+            env=env,
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "runs": runs,
+        "minMs": round(min(samples), 2),
+        "medianMs": round(statistics.median(samples), 2),
+        "maxMs": round(max(samples), 2),
+    }
+
+
+def import_profile(env: dict[str, str], top: int) -> list[dict]:
+    """Largest cumulative imports for `import describe`, from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import describe"],
+        env=env,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_part, cumulative_part, module = line.split("|")
+        self_us = int(self_part.split(":")[1])
+        rows.append(
+            {"module": module.strip(), "selfUs": self_us, "cumulativeUs": int(cumulative_part)}
+        )
+    return sorted(rows, key=lambda row: row["cumulativeUs"], reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Launches per case.")
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="Cases to run.")
+    parser.add_argument("--output", help="Write JSON results to this file.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        env = {
+            **os.environ,
+            "DESCRIBE_HOME": home,
+            "DESCRIBE_REGISTRY": "builtin",
+            "PYTHONPATH": str(ROOT),
+            "PYTHONDONTWRITEBYTECODE": "",
+        }
+        # Warm the bytecode cache so every case measures imports, not compilation.
+        subprocess.run([sys.executable, "-c", "import describe"], env=env, cwd=ROOT, check=True)
+
+        results = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cases": {
+                name: run_case(*CASES[name], env=env, runs=args.runs)
+                for name in (args.case or CASES)
+            },
+            "imports": import_profile(env, top=15),
+        }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Synthetic MCP Registry payloads for offline benchmarks.
+
+Entries follow the official Registry's `{"server": ..., "_meta": ...}` shape so
+they exercise the same normalization path as real registry data.
+
+Copyright 2024 James Dominguez
+Licensed under the Apache License, Version 2.0
+"""
+
+import json
+import random
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+WORDS = [
+    "github",
+    "git",
+    "filesystem",
+    "postgres",
+    "sqlite",
+    "search",
+    "browser",
+    "slack",
+    "notion",
+    "jira",
+    "linear",
+    "memory",
+    "fetch",
+    "docs",
+    "calendar",
+    "email",
+    "drive",
+    "maps",
+    "weather",
+    "metrics",
+    "logs",
+    "deploy",
+    "kubernetes",
+    "docker",
+    "terraform",
+    "stripe",
+    "shopify",
+    "figma",
+    "sentry",
+    "redis",
+    "kafka",
+    "s3",
+    "vector",
+    "embeddings",
+]
+
+
+def synthetic_servers(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    """Return `count` registry entries with realistic names, packages, and metadata."""
+    rng = random.Random(seed)
+    servers = []
+    for index in range(count):
+        topic = rng.choice(WORDS)
+        name = f"io.github.org{index % 997}/{topic}-mcp-{index}"
+        package: dict[str, Any] = {
+            "registryType": rng.choice(("npm", "npm", "pypi", "oci")),
+            "identifier": f"@org{index % 997}/{topic}-server-{index}",
+            "version": f"1.{index % 10}.{index % 7}",
+            "transport": {"type": "stdio"},
+            "environmentVariables": [
+                {"name": f"{topic.upper()}_TOKEN", "isSecret": True},
+                {"name": f"{topic.upper()}_REGION", "default": "us-east-1"},
+            ],
+        }
+        server: dict[str, Any] = {
+            "name": name,
+            "title": f"{topic.title()} {index}",
+            "description": " ".join(rng.choice(WORDS) for _ in range(18)),
+            "version": package["version"],
+            "repository": {"url": f"https://github.com/org{index % 997}/{topic}-{index}"},
+            "packages": [package],
+        }
+        if index % 5 == 0:
+            server["remotes"] = [{"type": "streamable-http", "url": f"https://{topic}.test/mcp"}]
+        servers.append(
+            {
+                "server": server,
+                "_meta": {
+                    "io.modelcontextprotocol.registry/official": {
+                        "status": "active",
+                        "isLatest": True,
+                    }
+                },
+            }
+        )
+    return servers
+
+
+class RegistryStub:
+    """A local `http.server` that serves servers in the official Registry API shape.
+
+    Supports the `limit`, `cursor`, and `search` query parameters describe sends.
+    Use as a context manager; `url` is the `/v0.1/servers` endpoint.
+    """
+
+    def __init__(self, servers: list[dict[str, Any]]):
+        self.servers = servers
+        self.requests = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v0.1/servers"
+
+    def __enter__(self) -> "RegistryStub":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                stub.requests += 1
+                params = parse_qs(urlparse(self.path).query)
+                limit = int(params.get("limit", ["100"])[0])
+                offset = int(params.get("cursor", ["0"])[0])
+                servers = stub.servers
+                if "search" in params:
+                    query = params["search"][0].lower()
+                    servers = [item for item in servers if query in item["server"]["name"]]
+                page = servers[offset : offset + limit]
+                metadata = {"count": len(page)}
+                if offset + limit < len(servers):
+                    metadata["nextCursor"] = str(offset + limit)
+                body = json.dumps({"servers": page, "metadata": metadata}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
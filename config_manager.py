@@ -5,17 +5,226 @@ Copyright 2024 James Dominguez
 Licensed under the Apache License, Version 2.0
 """
 
+import asyncio
 import json
 import logging
 import os
 import platform
-import shutil
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, Union
 
+from io_pool import run_io
+from metrics import METRICS
+
+# shutil, tempfile, and datetime are imported inside the methods that write or
+# list files; describe imports this module on its startup path.
 logger = logging.getLogger("describe.config")
 
+DEFAULT_CLIENT = "claude-desktop"
+
+
+def _app_config_dir() -> Path:
+    """Per-user application config directory for the current platform."""
+    if platform.system() == "Darwin":
+        return Path.home() / "Library" / "Application Support"
+    if platform.system() == "Windows":
+        return Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
+    return Path.home() / ".config"
+
+
+class MCPClientAdapter:
+    """Where an MCP client keeps its config and how it shapes server entries.
+
+    describe generates one client-neutral entry (``command``/``args``/``env`` for
+    local servers, ``type``/``url`` for remote ones). Adapters translate that entry
+    into each client's schema and back again for listing.
+    """
+
+    name = ""
+    title = ""
+    servers_key = "mcpServers"
+
+    def candidate_paths(self) -> list[Path]:
+        return []
+
+    def default_path(self) -> Path:
+        return self.candidate_paths()[0]
+
+    def marker_path(self) -> Optional[Path]:
+        """Directory whose presence means the client is installed."""
+        return None
+
+    def find_path(self) -> Path:
+        for path in self.candidate_paths():
+            try:
+                if path.exists():
+                    return path
+            except OSError as e:
+                logger.debug(f"Cannot inspect {self.name} config candidate {path}: {e}")
+        return self.default_path()
+
+    def is_present(self) -> bool:
+        try:
+            if any(path.exists() for path in self.candidate_paths()):
+                return True
+            marker = self.marker_path()
+            return bool(marker and marker.is_dir())
+        except OSError:
+            return False
+
+    def to_client(self, config: dict[str, Any]) -> dict[str, Any]:
+        return dict(config)
+
+    def from_client(self, entry: dict[str, Any]) -> dict[str, Any]:
+        return dict(entry)
+
+
+class ClaudeDesktopAdapter(MCPClientAdapter):
+    name = "claude-desktop"
+    title = "Claude Desktop"
+
+    def candidate_paths(self) -> list[Path]:
+        if platform.system() == "Darwin":  # macOS
+            return [
+                _app_config_dir() / "Claude" / "claude_desktop_config.json",
+                Path.home() / ".config" / "claude" / "claude_desktop_config.json",
+            ]
+        if platform.system() == "Windows":
+            return [
+                Path(os.environ.get("APPDATA", "")) / "Claude" / "claude_desktop_config.json",
+                Path.home() / "AppData" / "Roaming" / "Claude" / "claude_desktop_config.json",
+            ]
+        return [  # Linux
+            Path.home() / ".config" / "claude" / "claude_desktop_config.json",
+            Path.home() / ".claude" / "claude_desktop_config.json",
+        ]
+
+    def default_path(self) -> Path:
+        if platform.system() == "Linux":
+            return Path.home() / ".config" / "claude" / "claude_desktop_config.json"
+        return _app_config_dir() / "Claude" / "claude_desktop_config.json"
+
+    def marker_path(self) -> Optional[Path]:
+        return self.default_path().parent
+
+
+class _TypedEntryAdapter(MCPClientAdapter):
+    """Clients that require an explicit ``type`` on every server entry."""
+
+    def to_client(self, config: dict[str, Any]) -> dict[str, Any]:
+        if "url" in config:
+            return {"type": _remote_type(config), "url": config["url"]}
+        return {"type": "stdio", **config}
+
+    def from_client(self, entry: dict[str, Any]) -> dict[str, Any]:
+        entry = dict(entry)
+        if entry.get("type") == "stdio":
+            entry.pop("type")
+        return entry
+
+
+class ClaudeCodeAdapter(_TypedEntryAdapter):
+    name = "claude-code"
+    title = "Claude Code"
+
+    def candidate_paths(self) -> list[Path]:
+        return [Path.home() / ".claude.json"]
+
+
+class CursorAdapter(MCPClientAdapter):
+    name = "cursor"
+    title = "Cursor"
+
+    def candidate_paths(self) -> list[Path]:
+        return [Path.home() / ".cursor" / "mcp.json"]
+
+    def marker_path(self) -> Optional[Path]:
+        return Path.home() / ".cursor"
+
+    def to_client(self, config: dict[str, Any]) -> dict[str, Any]:
+        if "url" in config:
+            return {"url": config["url"]}
+        return dict(config)
+
+
+class VSCodeAdapter(_TypedEntryAdapter):
+    name = "vscode"
+    title = "Visual Studio Code"
+    servers_key = "servers"
+
+    def candidate_paths(self) -> list[Path]:
+        return [_app_config_dir() / "Code" / "User" / "mcp.json"]
+
+    def marker_path(self) -> Optional[Path]:
+        return _app_config_dir() / "Code" / "User"
+
+
+class WindsurfAdapter(MCPClientAdapter):
+    name = "windsurf"
+    title = "Windsurf"
+
+    def candidate_paths(self) -> list[Path]:
+        return [Path.home() / ".codeium" / "windsurf" / "mcp_config.json"]
+
+    def marker_path(self) -> Optional[Path]:
+        return Path.home() / ".codeium" / "windsurf"
+
+    def to_client(self, config: dict[str, Any]) -> dict[str, Any]:
+        if "url" in config:
+            return {"serverUrl": config["url"]}
+        return dict(config)
+
+    def from_client(self, entry: dict[str, Any]) -> dict[str, Any]:
+        entry = dict(entry)
+        if "serverUrl" in entry:
+            entry["url"] = entry.pop("serverUrl")
+        return entry
+
+
+def _remote_type(config: dict[str, Any]) -> str:
+    """Map describe's remote transport names onto the `http`/`sse` pair clients use."""
+    return "sse" if config.get("type") == "sse" else "http"
+
+
+CLIENT_ADAPTERS: dict[str, MCPClientAdapter] = {
+    adapter.name: adapter
+    for adapter in (
+        ClaudeDesktopAdapter(),
+        ClaudeCodeAdapter(),
+        CursorAdapter(),
+        VSCodeAdapter(),
+        WindsurfAdapter(),
+    )
+}
+
+
+def split_package_version(package: str) -> tuple[str, Optional[str]]:
+    """Split ``pkg@1.2.3`` or ``pkg==1.2.3`` into the package and its pinned version."""
+    if "==" in package:
+        name, _, version = package.partition("==")
+        return name, version or None
+    name, separator, version = package.rpartition("@")
+    if not separator or not name:
+        # Unpinned, including scoped npm names such as @scope/pkg.
+        return package, None
+    return name, version or None
+
+
+def backup_filename(client: str, timestamp: str) -> str:
+    """Backup file name for a client; Claude Desktop keeps the original naming."""
+    if client == DEFAULT_CLIENT:
+        return f"config_backup_{timestamp}.json"
+    return f"config_backup_{client}_{timestamp}.json"
+
+
+def client_for_backup(backup_name: str) -> str:
+    """Infer which client a backup belongs to from its file name."""
+    stem = Path(backup_name).name
+    for client in CLIENT_ADAPTERS:
+        if client != DEFAULT_CLIENT and stem.startswith(f"config_backup_{client}_"):
+            return client
+    return DEFAULT_CLIENT
+
 
 class MCPConfigManager:
     """Manages MCP configuration files across different platforms."""
@@ -24,8 +233,13 @@ class MCPConfigManager:
         self,
         home: Optional[Union[Path, str]] = None,
         config_path: Optional[Union[Path, str]] = None,
+        client: str = DEFAULT_CLIENT,
     ):
+        if client not in CLIENT_ADAPTERS:
+            raise ValueError(f"Unknown MCP client: {client}")
         self.home = Path(home or os.environ.get("DESCRIBE_HOME", Path.home() / ".describe"))
+        self.client = CLIENT_ADAPTERS[client]
+        self.servers_key = self.client.servers_key
         self.config_path = (
             Path(config_path).expanduser() if config_path else self._find_config_path()
         )
@@ -36,96 +250,60 @@ class MCPConfigManager:
     def _find_config_path(self) -> Optional[Path]:
         """Find the MCP config file based on platform"""
         override = os.environ.get("DESCRIBE_MCP_CONFIG")
-        if override:
+        if override and self.client.name == DEFAULT_CLIENT:
             return Path(override).expanduser()
 
-        possible_paths = []
-
-        if platform.system() == "Darwin":  # macOS
-            possible_paths.extend(
-                [
-                    Path.home()
-                    / "Library"
-                    / "Application Support"
-                    / "Claude"
-                    / "claude_desktop_config.json",
-                    Path.home() / ".config" / "claude" / "claude_desktop_config.json",
-                ]
-            )
-        elif platform.system() == "Windows":
-            possible_paths.extend(
-                [
-                    Path(os.environ.get("APPDATA", "")) / "Claude" / "claude_desktop_config.json",
-                    Path.home() / "AppData" / "Roaming" / "Claude" / "claude_desktop_config.json",
-                ]
-            )
-        else:  # Linux
-            possible_paths.extend(
-                [
-                    Path.home() / ".config" / "claude" / "claude_desktop_config.json",
-                    Path.home() / ".claude" / "claude_desktop_config.json",
-                ]
-            )
-
-        # Check each path
-        for path in possible_paths:
-            try:
-                if path.exists():
-                    logger.info(f"Found MCP config at: {path}")
-                    return path
-            except OSError as e:
-                logger.debug(f"Cannot inspect MCP config candidate {path}: {e}")
-
-        # If not found, return the most likely path for the platform
-        if platform.system() == "Darwin":
-            default = (
-                Path.home()
-                / "Library"
-                / "Application Support"
-                / "Claude"
-                / "claude_desktop_config.json"
-            )
-        elif platform.system() == "Windows":
-            default = (
-                Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
-                / "Claude"
-                / "claude_desktop_config.json"
-            )
+        path = self.client.find_path()
+        if path.exists():
+            logger.info(f"Found {self.client.title} MCP config at: {path}")
         else:
-            default = Path.home() / ".config" / "claude" / "claude_desktop_config.json"
-
-        logger.info(f"No config found, will create at: {default}")
-        return default
+            logger.info(f"No {self.client.title} config found, will create at: {path}")
+        return path
 
     async def load_config(self) -> dict[str, Any]:
         """Load the current MCP configuration"""
-        if not self.config_path or not self.config_path.exists():
+        with METRICS.span("config.load", client=self.client.name):
+            text = await run_io(self._read_config) if self.config_path else None
+        if text is None:
             logger.info("No existing config file, starting with empty config")
-            return {"mcpServers": {}}
+            return {self.servers_key: {}}
 
         try:
-            with open(self.config_path, encoding="utf-8") as f:
-                self.config = json.load(f)
+            self.config = json.loads(text)
 
-            # Ensure mcpServers key exists
-            if "mcpServers" not in self.config:
-                self.config["mcpServers"] = {}
+            # Ensure the client's servers key exists
+            if self.servers_key not in self.config:
+                self.config[self.servers_key] = {}
 
             return self.config
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             raise Exception(f"Failed to load MCP config: {e}") from e
 
+    def _read_config(self) -> Optional[str]:
+        try:
+            with open(self.config_path, encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.error(f"Failed to load config: {e}")
+            raise Exception(f"Failed to load MCP config: {e}") from e
+
     async def backup_config(self) -> str:
         """Create a backup of the current config"""
-        if not self.config_path or not self.config_path.exists():
+        if not self.config_path or not await run_io(self.config_path.exists):
             return "No config to backup"
 
+        import shutil
+        from datetime import datetime
+
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = self.backup_dir / f"config_backup_{timestamp}.json"
+        backup_path = self.backup_dir / backup_filename(self.client.name, timestamp)
 
         try:
-            shutil.copy2(self.config_path, backup_path)
+            with METRICS.span("config.backup", client=self.client.name):
+                await run_io(shutil.copy2, self.config_path, backup_path)
             logger.info(f"Created backup at: {backup_path}")
             return str(backup_path)
         except Exception as e:
@@ -137,33 +315,53 @@ class MCPConfigManager:
         if not self.config_path:
             raise Exception("No config path available")
 
-        # Ensure directory exists
-        self.config_path.parent.mkdir(exist_ok=True, parents=True)
-
         try:
-            # Write with pretty formatting
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2)
+            text = json.dumps(self.config, indent=2)
+            with METRICS.span("config.save", client=self.client.name):
+                await run_io(self._write_config, text)
             logger.info(f"Saved config to: {self.config_path}")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
             raise Exception(f"Failed to save config: {e}") from e
 
+    def _write_config(self, text: str) -> None:
+        import shutil
+        import tempfile
+
+        # Ensure directory exists
+        self.config_path.parent.mkdir(exist_ok=True, parents=True)
+
+        # Write to a sibling temp file and swap it in, so a crash or a
+        # concurrent reader never sees a half-written client config.
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{self.config_path.name}.", suffix=".tmp", dir=self.config_path.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            if self.config_path.exists():
+                shutil.copymode(self.config_path, tmp_name)
+            os.replace(tmp_name, self.config_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
     async def add_server(self, name: str, server_config: dict[str, Any]) -> dict[str, Any]:
         """Add a server to the configuration"""
         await self.load_config()
 
-        if name in self.config.get("mcpServers", {}):
+        if name in self.config.get(self.servers_key, {}):
             return {"error": f"Server '{name}' already exists in config"}
 
         # Backup before making changes
         backup_path = await self.backup_config()
 
-        # Add the server
-        if "mcpServers" not in self.config:
-            self.config["mcpServers"] = {}
+        # Add the server in the client's own entry shape
+        if self.servers_key not in self.config:
+            self.config[self.servers_key] = {}
 
-        self.config["mcpServers"][name] = server_config
+        server_config = self.client.to_client(server_config)
+        self.config[self.servers_key][name] = server_config
 
         # Save the updated config
         await self.save_config()
@@ -180,14 +378,14 @@ class MCPConfigManager:
         """Remove a server from the configuration"""
         await self.load_config()
 
-        if name not in self.config.get("mcpServers", {}):
+        if name not in self.config.get(self.servers_key, {}):
             return {"error": f"Server '{name}' not found in config"}
 
         # Backup before making changes
         backup_path = await self.backup_config()
 
         # Remove the server
-        removed_config = self.config["mcpServers"].pop(name)
+        removed_config = self.config[self.servers_key].pop(name)
 
         # Save the updated config
         await self.save_config()
@@ -197,6 +395,7 @@ class MCPConfigManager:
             "name": name,
             "removed_config": removed_config,
             "backup": backup_path,
+            "config_path": str(self.config_path),
         }
 
     async def list_configured(self) -> list[dict[str, Any]]:
@@ -204,7 +403,8 @@ class MCPConfigManager:
         await self.load_config()
 
         servers = []
-        for name, config in self.config.get("mcpServers", {}).items():
+        for name, entry in self.config.get(self.servers_key, {}).items():
+            config = self.client.from_client(entry)
             server = {
                 "name": name,
                 "command": config.get("command", ""),
@@ -222,16 +422,16 @@ class MCPConfigManager:
     async def get_server_config(self, name: str) -> Optional[dict[str, Any]]:
         """Get configuration for a specific server"""
         await self.load_config()
-        return self.config.get("mcpServers", {}).get(name)
+        return self.config.get(self.servers_key, {}).get(name)
 
     async def restore_backup(self, backup_name: str) -> dict[str, Any]:
         """Restore a configuration backup"""
         backup_path = self.backup_dir / backup_name
 
-        if not backup_path.exists():
+        if not await run_io(backup_path.exists):
             # Try full path
             backup_path = Path(backup_name)
-            if not backup_path.exists():
+            if not await run_io(backup_path.exists):
                 return {"error": f"Backup not found: {backup_name}"}
 
         try:
@@ -239,7 +439,9 @@ class MCPConfigManager:
             current_backup = await self.backup_config()
 
             # Copy backup to config location
-            shutil.copy2(backup_path, self.config_path)
+            import shutil
+
+            await run_io(shutil.copy2, backup_path, self.config_path)
 
             # Reload config
             await self.load_config()
@@ -254,6 +456,11 @@ class MCPConfigManager:
 
     async def list_backups(self) -> list[dict[str, Any]]:
         """List all available backups"""
+        return await run_io(self._scan_backups)
+
+    def _scan_backups(self) -> list[dict[str, Any]]:
+        from datetime import datetime
+
         backups = []
 
         for backup_file in sorted(self.backup_dir.glob("config_backup_*.json"), reverse=True):
@@ -261,6 +468,7 @@ class MCPConfigManager:
             backups.append(
                 {
                     "name": backup_file.name,
+                    "client": client_for_backup(backup_file.name),
                     "path": str(backup_file),
                     "size": stat.st_size,
                     "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
@@ -275,9 +483,20 @@ class MCPConfigManager:
         env = self._environment_from_registry(server_info)
         package_args = self._package_args_from_registry(server_info)
 
+        entry_point = server_info.get("entryPoint") or {}
+        if method in {"npm", "pypi"} and Path(entry_point.get("command") or "").is_file():
+            # Launch the installed executable; the client skips npx/uvx resolution.
+            config: dict[str, Any] = {
+                "command": entry_point["command"],
+                "args": [*entry_point.get("args", []), *package_args],
+            }
+            if env:
+                config["env"] = env
+            return config
+
         if method == "npm":
-            package = server_info.get("package", "")
-            config: dict[str, Any] = {"command": "npx", "args": ["-y", package, *package_args]}
+            package = self._pinned_package(server_info)
+            config = {"command": "npx", "args": ["-y", package, *package_args]}
             if env:
                 config["env"] = env
             return config
@@ -288,7 +507,7 @@ class MCPConfigManager:
                 config["env"] = env
             return config
         elif method == "pypi":
-            package = server_info.get("package", "")
+            package = self._pinned_package(server_info)
             config = {"command": "uvx", "args": [package, *package_args]}
             if env:
                 config["env"] = env
@@ -311,6 +530,13 @@ class MCPConfigManager:
             # Generic config
             return {"command": "echo", "args": ["Server needs manual configuration"]}
 
+    @staticmethod
+    def _pinned_package(server_info: dict[str, Any]) -> str:
+        """``package@version`` for the installed version, so npx/uvx skip the latest lookup."""
+        package, pinned = split_package_version(server_info.get("package", ""))
+        version = server_info.get("installedVersion") or pinned
+        return f"{package}@{version}" if version else package
+
     @staticmethod
     def _environment_from_registry(server_info: dict[str, Any]) -> dict[str, str]:
         env: dict[str, str] = {}
@@ -336,3 +562,54 @@ class MCPConfigManager:
             else:
                 args.append(str(value))
         return args
+
+
+class MultiClientConfigManager:
+    """Applies one config change to every MCP client present on this machine.
+
+    Clients are discovered once, when the manager is created. Each change runs
+    concurrently against every client config and is reported per client.
+    """
+
+    def __init__(
+        self,
+        home: Optional[Union[Path, str]] = None,
+        clients: Optional[list[str]] = None,
+    ):
+        self.managers = [
+            MCPConfigManager(home=home, client=client)
+            for client in (clients or self.discover_clients())
+        ]
+
+    @staticmethod
+    def discover_clients() -> list[str]:
+        """Names of the MCP clients whose config or install directory exists."""
+        if os.environ.get("DESCRIBE_MCP_CONFIG"):
+            return [DEFAULT_CLIENT]
+        present = [name for name, adapter in CLIENT_ADAPTERS.items() if adapter.is_present()]
+        return present or [DEFAULT_CLIENT]
+
+    async def add_server(self, name: str, server_config: dict[str, Any]) -> dict[str, Any]:
+        """Add a server to every discovered client config"""
+        return await self._fan_out(
+            "added", name, lambda manager: manager.add_server(name, server_config)
+        )
+
+    async def remove_server(self, name: str) -> dict[str, Any]:
+        """Remove a server from every discovered client config"""
+        return await self._fan_out("removed", name, lambda manager: manager.remove_server(name))
+
+    async def _fan_out(self, status: str, name: str, operation) -> dict[str, Any]:
+        async def run(manager: MCPConfigManager) -> dict[str, Any]:
+            try:
+                return await operation(manager)
+            except Exception as e:
+                return {"error": str(e), "config_path": str(manager.config_path)}
+
+        results = await asyncio.gather(*(run(manager) for manager in self.managers))
+        clients = {manager.client.name: result for manager, result in zip(self.managers, results)}
+
+        if all("error" in result for result in results):
+            errors = [f"{client}: {result['error']}" for client, result in clients.items()]
+            return {"error": "; ".join(errors), "name": name, "clients": clients}
+        return {"status": status, "name": name, "clients": clients}
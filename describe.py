@@ -20,40 +20,67 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import argparse
+# Startup matters: MCP clients spawn describe on every session and scripts run
+# one command per process. Keep module-level imports to what every code path
+# needs; argparse, urllib, shutil, and config_manager are imported where used.
 import asyncio
+import base64
+import bisect
+import contextlib
+import functools
 import json
 import logging
 import os
-import shutil
-import subprocess
+import signal
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Any, Optional, Union
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING, Any, Optional, Union
 
-from config_manager import MCPConfigManager
+from io_pool import run_io
+from metrics import METRICS
+
+if TYPE_CHECKING:
+    import argparse
 
 VERSION = "1.1.0"
 MCP_PROTOCOL_VERSION = os.environ.get("DESCRIBE_MCP_PROTOCOL_VERSION", "2025-11-25")
 DEFAULT_REGISTRY_URL = "https://registry.modelcontextprotocol.io/v0.1/servers"
 DEFAULT_REGISTRY_LIMIT = 250
 DEFAULT_CACHE_TTL_SECONDS = 60 * 60
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_SOURCE_TIMEOUT = 20.0
+BENCH_TIMEOUT_SECONDS = 60.0
+BENCH_CONCURRENCY = 4
+SLOW_START_MS = 5000
+PROBE_STOP_GRACE_SECONDS = 5.0
+CLIENT_DETECTION_TTL_SECONDS = 60.0
+BREAKER_BASE_SECONDS = 30.0
+BREAKER_MAX_SECONDS = 15 * 60.0
+SNAPSHOT_FORMAT = "describe-registry-snapshot"
+SNAPSHOT_FORMAT_VERSION = 1
 
 DESCRIBE_HOME = Path(os.environ.get("DESCRIBE_HOME", Path.home() / ".describe")).expanduser()
 INSTALLED_DB = DESCRIBE_HOME / "installed.json"
 CACHE_DIR = DESCRIBE_HOME / "cache"
 REGISTRY_URL = os.environ.get("DESCRIBE_REGISTRY", DEFAULT_REGISTRY_URL)
+# Longest tool-result text content, in characters, before describe sends a
+# summary and leaves the full payload to structuredContent. 0 means no limit.
+TEXT_CONTENT_LIMIT = int(os.environ.get("DESCRIBE_TEXT_CONTENT_LIMIT") or 0)
 
-logging.basicConfig(
-    level=os.environ.get("DESCRIBE_LOG_LEVEL", "WARNING").upper(),
-    stream=sys.stderr,
-)
 logger = logging.getLogger("describe")
 
 
+def _configure_logging() -> None:
+    logging.basicConfig(
+        level=os.environ.get("DESCRIBE_LOG_LEVEL", "WARNING").upper(),
+        stream=sys.stderr,
+    )
+
+
+@functools.cache
 def _fallback_registry() -> dict[str, dict[str, Any]]:
     """Small, known-good catalog used when the official Registry is unavailable."""
     servers = {
@@ -139,13 +166,22 @@ def _fallback_registry() -> dict[str, dict[str, Any]]:
     }
 
 
-FALLBACK_REGISTRY = _fallback_registry()
+def __getattr__(name: str) -> Any:
+    # FALLBACK_REGISTRY is built on first access rather than at import time.
+    if name == "FALLBACK_REGISTRY":
+        return _fallback_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _json_dumps(value: Any) -> str:
     return json.dumps(value, indent=2, sort_keys=True)
 
 
+def _compact_dumps(value: Any) -> str:
+    """Wire encoding for text the model reads: no indentation, no key sorting."""
+    return json.dumps(value, separators=(",", ":"))
+
+
 def _safe_int(value: Optional[str], default: int) -> int:
     if value is None:
         return default
@@ -155,10 +191,595 @@ def _safe_int(value: Optional[str], default: int) -> int:
         return default
 
 
+def _safe_float(value: Optional[str], default: float) -> float:
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
 def _now() -> float:
     return time.time()
 
 
+def summarize_trace(path: Union[Path, str]) -> dict[str, Any]:
+    """Aggregate a DESCRIBE_TRACE JSONL file into per-span percentiles and counter totals."""
+    durations: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    counters: dict[str, float] = {}
+    with open(path, encoding="utf-8") as trace:
+        for line in trace:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if "span" in record:
+                durations.setdefault(record["span"], []).append(float(record.get("ms", 0)))
+                errors[record["span"]] = errors.get(record["span"], 0) + int(
+                    bool(record.get("error"))
+                )
+            elif "counter" in record:
+                counters[record["counter"]] = counters.get(record["counter"], 0) + record["value"]
+
+    def percentile(samples: list[float], fraction: float) -> float:
+        return round(samples[min(len(samples) - 1, int(len(samples) * fraction))], 3)
+
+    spans = {}
+    for name, samples in sorted(durations.items()):
+        samples.sort()
+        spans[name] = {
+            "count": len(samples),
+            "errors": errors[name],
+            "totalMs": round(sum(samples), 3),
+            "p50Ms": percentile(samples, 0.5),
+            "p95Ms": percentile(samples, 0.95),
+            "maxMs": round(samples[-1], 3),
+        }
+    return {"trace": str(path), "counters": counters, "spans": spans}
+
+
+class Profiler:
+    """Opt-in cProfile capture for slow requests.
+
+    DESCRIBE_PROFILE=<ms> profiles every JSON-RPC request and CLI command and
+    keeps a pstats file under DESCRIBE_HOME/profiles for each one slower than
+    the threshold (any non-numeric value means the default 250 ms). Only the
+    newest DESCRIBE_PROFILE_KEEP files are kept.
+    """
+
+    DEFAULT_THRESHOLD_MS = 250.0
+    DEFAULT_KEEP = 20
+
+    def __init__(
+        self,
+        threshold_ms: Optional[float] = None,
+        keep: int = DEFAULT_KEEP,
+        directory: Optional[Union[Path, str]] = None,
+    ):
+        self.threshold_ms = threshold_ms
+        self.keep = keep
+        self._directory = Path(directory) if directory else None
+        self._active = False
+        self.last_path: Optional[Path] = None
+
+    @classmethod
+    def from_env(cls) -> "Profiler":
+        setting = os.environ.get("DESCRIBE_PROFILE", "").strip().lower()
+        threshold = None
+        if setting and setting not in {"0", "false", "off"}:
+            try:
+                threshold = float(setting)
+            except ValueError:
+                threshold = cls.DEFAULT_THRESHOLD_MS
+        keep = _safe_int(os.environ.get("DESCRIBE_PROFILE_KEEP"), cls.DEFAULT_KEEP)
+        return cls(threshold_ms=threshold, keep=keep)
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms is not None
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is None:
+            home = Path(os.environ.get("DESCRIBE_HOME", DESCRIBE_HOME)).expanduser()
+            self._directory = home / "profiles"
+        return self._directory
+
+    @contextlib.contextmanager
+    def profile(self, label: str) -> Any:
+        # cProfile allows one active profiler per process; nested or concurrent
+        # requests run unprofiled rather than failing.
+        if not self.enabled or self._active:
+            yield
+            return
+        import cProfile
+
+        profiler = cProfile.Profile()
+        self._active = True
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._active = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms >= self.threshold_ms:
+                self._save(profiler, label, elapsed_ms)
+
+    def _save(self, profiler: Any, label: str, elapsed_ms: float) -> Optional[Path]:
+        import pstats
+
+        safe_label = "".join(char if char.isalnum() else "-" for char in label).strip("-")
+        now = _now()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"{now % 1:.3f}"[1:]
+        path = self.directory / f"{stamp}-{os.getpid()}-{safe_label or 'request'}.prof"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(path))
+            self._prune()
+        except OSError as exc:
+            logger.warning("Cannot save profile for %s: %s", label, exc)
+            return None
+        self.last_path = path
+        logger.info("%s took %.0f ms; profile saved to %s", label, elapsed_ms, path)
+        if logger.isEnabledFor(logging.DEBUG):
+            import io
+
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(15)
+            logger.debug("Hot functions for %s:\n%s", label, report.getvalue())
+        return path
+
+    def _prune(self) -> None:
+        profiles = sorted(self.directory.glob("*.prof"), key=lambda path: path.stat().st_mtime)
+        for stale in profiles[: max(0, len(profiles) - self.keep)]:
+            stale.unlink(missing_ok=True)
+
+
+PROFILER = Profiler.from_env()
+
+
+def _etagged(payload: dict[str, Any], version: str) -> tuple[str, str]:
+    """Encode a detail resource with an etag that changes whenever its content does."""
+    from hashlib import blake2b
+
+    encoded = _compact_dumps(payload)
+    etag = f"{version}-{blake2b(encoded.encode(), digest_size=8).hexdigest()}"
+    return f'{{"etag": {json.dumps(etag)}, "server": {encoded}}}', etag
+
+
+# Run in the interpreter that pip installed into; prints the installed version,
+# console scripts, and the --user scripts directory they were written to.
+PYPI_ENTRY_PROBE = """\
+import json, os, sys, sysconfig
+from importlib import metadata
+dist = metadata.distribution(sys.argv[1])
+get_scheme = getattr(sysconfig, "get_preferred_scheme", None)
+scheme = get_scheme("user") if get_scheme else os.name + "_user"
+print(json.dumps({
+    "version": dist.version,
+    "scripts": [ep.name.lower() for ep in dist.entry_points if ep.group == "console_scripts"],
+    "bin": sysconfig.get_path("scripts", scheme),
+}))
+"""
+
+
+def _cold_start_summary(result: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: result[key]
+        for key in ("status", "readyMs", "rssKb", "tools", "slow", "measuredAt")
+        if key in result
+    }
+
+
+def _process_rss_kb(pid: int) -> Optional[int]:
+    """Resident set size of a running process, from /proc where available."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii", errors="replace") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _session_rss_kb(session_id: int) -> Optional[int]:
+    """Total resident set size of every process in a session, from /proc where available.
+
+    Servers are commonly launched through npx, uvx, or a shell wrapper whose own
+    footprint is tiny next to the server it starts, so the whole tree is counted.
+    """
+    total = None
+    try:
+        pids = [entry for entry in os.listdir("/proc") if entry.isdigit()]
+    except OSError:
+        return _process_rss_kb(session_id)
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", encoding="ascii", errors="replace") as stat:
+                # Fields after the parenthesised command: state, ppid, pgrp, session, ...
+                fields = stat.read().rsplit(")", 1)[1].split()
+            if int(fields[3]) != session_id:
+                continue
+        except (OSError, ValueError, IndexError):
+            continue
+        rss = _process_rss_kb(int(pid))
+        if rss is not None:
+            total = (total or 0) + rss
+    return total
+
+
+def _signal_process_group(proc: asyncio.subprocess.Process, sig: int) -> None:
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, sig)
+        elif proc.returncode is None:
+            proc.send_signal(sig)
+    except ProcessLookupError:
+        pass
+
+
+async def _stop_probe(proc: asyncio.subprocess.Process) -> None:
+    """Stop a probed server and anything it spawned, giving it a chance to exit cleanly."""
+    if proc.stdin is not None:
+        proc.stdin.close()
+    if proc.returncode is None:
+        _signal_process_group(proc, signal.SIGTERM)
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(proc.wait(), PROBE_STOP_GRACE_SECONDS)
+    # Wrappers often exit on SIGTERM while the server they started is still running.
+    _signal_process_group(proc, getattr(signal, "SIGKILL", signal.SIGTERM))
+    await proc.wait()
+
+
+async def probe_server(config: dict[str, Any], timeout: float) -> dict[str, Any]:
+    """Launch a stdio MCP server and time initialize + tools/list until it is usable."""
+    env = {**os.environ, **config.get("env", {})}
+    started = time.perf_counter()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            config["command"],
+            *config.get("args", []),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+            # Its own process group, so wrapper-launched servers are measured and stopped whole.
+            start_new_session=True,
+        )
+    except OSError as exc:
+        return {"status": "error", "error": str(exc)}
+
+    async def call(request_id: int, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        proc.stdin.write((json.dumps(message) + "\n").encode())
+        await proc.stdin.drain()
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                raise ConnectionError("server exited before responding")
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue  # servers that log to stdout
+            if isinstance(response, dict) and response.get("id") == request_id:
+                if "error" in response:
+                    error = response["error"]
+                    message = error.get("message") if isinstance(error, dict) else None
+                    raise ConnectionError(str(message or "error response"))
+                return response.get("result") or {}
+
+    async def handshake() -> dict[str, Any]:
+        await call(
+            1,
+            "initialize",
+            {
+                "protocolVersion": MCP_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "describe-bench", "version": VERSION},
+            },
+        )
+        initialize_ms = (time.perf_counter() - started) * 1000
+        notification = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+        proc.stdin.write((json.dumps(notification) + "\n").encode())
+        tools = await call(2, "tools/list", {})
+        return {
+            "status": "ok",
+            "initializeMs": round(initialize_ms, 1),
+            "readyMs": round((time.perf_counter() - started) * 1000, 1),
+            "rssKb": _session_rss_kb(proc.pid),
+            "tools": len(tools.get("tools", [])),
+        }
+
+    try:
+        return await asyncio.wait_for(handshake(), timeout)
+    except asyncio.TimeoutError:
+        return {"status": "timeout", "error": f"not ready after {timeout:g}s"}
+    except (ConnectionError, OSError, ValueError) as exc:
+        return {"status": "error", "error": str(exc)}
+    finally:
+        await _stop_probe(proc)
+
+
+class InvalidArgumentError(ValueError):
+    """A tool, CLI, or resource argument describe cannot act on."""
+
+
+class InvalidCursorError(InvalidArgumentError):
+    """A pagination cursor that describe did not issue."""
+
+
+def encode_cursor(position: Any) -> str:
+    """Opaque, URL-safe cursor for a position in a sorted listing."""
+    raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Any:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except ValueError as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from exc
+
+
+# Field projection for registry and installed-server payloads. Each field maps
+# to the function that builds it, so only requested fields are computed.
+REGISTRY_FIELDS: dict[str, Any] = {
+    "name": lambda server: server["shortName"],
+    "registryName": lambda server: server["name"],
+    "title": lambda server: server["title"],
+    "description": lambda server: server["description"],
+    "version": lambda server: server["version"],
+    "status": lambda server: server["status"],
+    "source": lambda server: server["source"],
+    "installMethods": lambda server: server["installMethods"],
+    "installed": None,  # needs installed state; filled in by the manager
+    "isLatest": lambda server: server["isLatest"],
+    "repository": lambda server: server["repository"],
+    "packages": lambda server: server["packages"],
+    "remotes": lambda server: server["remotes"],
+    "aliases": lambda server: server["aliases"],
+}
+LIST_FIELD_PRESETS = {
+    "minimal": ("name", "title"),
+    "standard": (
+        "name",
+        "registryName",
+        "title",
+        "description",
+        "version",
+        "status",
+        "source",
+        "installMethods",
+        "installed",
+    ),
+}
+LIST_FIELD_PRESETS["full"] = (
+    *LIST_FIELD_PRESETS["standard"],
+    "isLatest",
+    "repository",
+    "packages",
+    "remotes",
+    "aliases",
+)
+SEARCH_FIELD_PRESETS = {
+    **LIST_FIELD_PRESETS,
+    "standard": tuple(
+        field for field in LIST_FIELD_PRESETS["standard"] if field not in {"source", "installed"}
+    ),
+}
+
+INSTALLED_FIELDS: dict[str, Any] = {
+    "method": lambda record: record.get("method"),
+    "registryName": lambda record: record.get("details", {}).get("server", {}).get("name"),
+    "title": lambda record: record.get("details", {}).get("server", {}).get("title"),
+    "version": lambda record: record.get("details", {}).get("server", {}).get("version"),
+    "details": lambda record: {
+        key: value for key, value in record.get("details", {}).items() if key != "server"
+    },
+    "server": lambda record: record.get("details", {}).get("server"),
+    "coldStart": lambda record: record.get("coldStart"),
+}
+INSTALLED_FIELD_PRESETS = {
+    "minimal": ("method",),
+    "standard": ("method", "registryName", "title", "version", "details", "coldStart"),
+    "full": None,  # the stored record, unprojected
+}
+
+
+def resolve_fields(
+    spec: Any,
+    presets: dict[str, Any],
+    known: Any,
+    default: str = "standard",
+    required: tuple[str, ...] = (),
+) -> Optional[tuple[str, ...]]:
+    """Turn a preset name, comma-separated string, or list into a field tuple.
+
+    Explicit field lists always start with the `required` identifying fields.
+    Returns None for presets that mean "the whole record".
+    """
+    if spec is None or spec == "":
+        spec = default
+    if isinstance(spec, str) and spec in presets:
+        return presets[spec]
+    names = spec.split(",") if isinstance(spec, str) else list(spec)
+    requested = [str(name).strip() for name in names if str(name).strip()]
+    unknown = [field for field in requested if field not in known]
+    if unknown or not requested:
+        choices = ", ".join([*presets, *known])
+        raise InvalidArgumentError(
+            f"Unknown field(s): {', '.join(unknown) or '(none)'}. Use one of: {choices}"
+        )
+    return tuple(dict.fromkeys([*required, *requested]))
+
+
+def page_limit(value: Any) -> int:
+    """Clamp a requested page size, falling back to DESCRIBE_PAGE_SIZE."""
+    default = min(_safe_int(os.environ.get("DESCRIBE_PAGE_SIZE"), DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+    try:
+        limit = int(value) if value is not None else default
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+class RegistryBreaker:
+    """Per-URL circuit breaker for registry endpoints, persisted across processes.
+
+    After a failed request the URL is skipped for a backoff window that doubles
+    with each consecutive failure (with jitter, capped) and never ends before a
+    server-sent ``Retry-After``. Callers serve cached or built-in data instead
+    of waiting out the network timeout again. One success closes the circuit.
+    """
+
+    def __init__(self, path: Path, base_seconds: float = BREAKER_BASE_SECONDS):
+        self.path = path
+        self.base_seconds = base_seconds
+        self._state: Optional[dict[str, dict[str, Any]]] = None
+        # Saves run on the I/O pool; a slower, older save must not replace a newer one.
+        self._saves = 0
+        self._saved = 0
+        self._save_lock = threading.Lock()
+
+    @classmethod
+    def for_cache(cls, cache_dir: Path) -> "RegistryBreaker":
+        base = _safe_float(os.environ.get("DESCRIBE_REGISTRY_BACKOFF"), BREAKER_BASE_SECONDS)
+        return cls(cache_dir / "breaker.json", base)
+
+    async def load(self) -> dict[str, dict[str, Any]]:
+        if self._state is None:
+
+            def read() -> Any:
+                try:
+                    return json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    return {}
+
+            loaded = await run_io(read)
+            if self._state is None:
+                self._state = loaded if isinstance(loaded, dict) else {}
+        return self._state
+
+    async def retry_in(self, url: str) -> float:
+        """Seconds until `url` may be tried again; 0 when the circuit is closed."""
+        if self.base_seconds <= 0:
+            return 0.0
+        entry = (await self.load()).get(url)
+        if not entry:
+            return 0.0
+        return max(0.0, float(entry.get("openUntil", 0)) - _now())
+
+    async def record_failure(self, url: str, exc: BaseException) -> float:
+        import random
+
+        state = await self.load()
+        entry = state.get(url) or {}
+        failures = int(entry.get("failures", 0)) + 1
+        window = min(BREAKER_MAX_SECONDS, self.base_seconds * 2 ** (failures - 1))
+        # Equal jitter: hosts that failed together do not all retry together.
+        window = random.uniform(window / 2, window)
+        window = max(window, _retry_after(exc) or 0.0)
+        state[url] = {
+            "failures": failures,
+            "openUntil": _now() + window,
+            "error": str(exc) or type(exc).__name__,
+        }
+        METRICS.incr("registry.breaker_trips")
+        await self._save(state)
+        return window
+
+    async def record_success(self, url: str) -> None:
+        state = await self.load()
+        if state.pop(url, None) is not None:
+            await self._save(state)
+
+    async def _save(self, state: dict[str, dict[str, Any]]) -> None:
+        self._saves += 1
+        version, text = self._saves, _json_dumps(state)
+
+        def write() -> None:
+            with self._save_lock:
+                if version < self._saved:
+                    return
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(text, encoding="utf-8")
+                os.replace(tmp_path, self.path)
+                self._saved = version
+
+        try:
+            await run_io(write)
+        except OSError as exc:
+            logger.debug("Failed to save registry breaker state: %s", exc)
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds requested by an HTTP error's Retry-After header (delta or HTTP date)."""
+    headers = getattr(exc, "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - _now())
+    except (TypeError, ValueError):
+        return None
+
+
+# Fields _finish_index and the tools read from every indexed record, with their types.
+INDEX_RECORD_FIELDS = {
+    "name": str,
+    "shortName": str,
+    "title": str,
+    "description": str,
+    "version": str,
+    "status": str,
+    "isLatest": bool,
+    "packages": list,
+    "remotes": list,
+    "installMethods": list,
+    "aliases": list,
+}
+
+
+def _valid_index(index: Any, servers: list[dict[str, Any]]) -> bool:
+    """Whether a saved index is well-formed and fits the servers it was saved with."""
+    if not isinstance(index, dict):
+        return False
+    registry, aliases, versions = (index.get(part) for part in ("registry", "aliases", "versions"))
+    if not (
+        isinstance(registry, dict) and isinstance(aliases, dict) and isinstance(versions, dict)
+    ):
+        return False
+    for record in registry.values():
+        if not isinstance(record, dict) or not all(
+            isinstance(record.get(field), kind) for field, kind in INDEX_RECORD_FIELDS.items()
+        ):
+            return False
+        if not all(isinstance(alias, str) for alias in record["aliases"]):
+            return False
+    if not all(isinstance(key, str) and key in registry for key in aliases.values()):
+        return False
+    return all(
+        isinstance(table, dict)
+        and all(
+            isinstance(position, int) and 0 <= position < len(servers)
+            for position in table.values()
+        )
+        for table in versions.values()
+    )
+
+
 class MCPPackageManager:
     def __init__(
         self,
@@ -171,6 +792,10 @@ class MCPPackageManager:
         self.installed_db = self.home / "installed.json"
         self.cache_dir = self.home / "cache"
         self.registry_cache = self.cache_dir / "registry.json"
+        # The last imported snapshot; with several sources it stands in for unreachable ones.
+        self.snapshot_cache = self.cache_dir / "registry-snapshot.json"
+        self.bench_cache = self.cache_dir / "bench.json"
+        self.breaker = RegistryBreaker.for_cache(self.cache_dir)
         self.registry_url = registry_url or os.environ.get("DESCRIBE_REGISTRY", REGISTRY_URL)
         self.cache_ttl_seconds = cache_ttl_seconds or _safe_int(
             os.environ.get("DESCRIBE_CACHE_TTL_SECONDS"), DEFAULT_CACHE_TTL_SECONDS
@@ -178,11 +803,35 @@ class MCPPackageManager:
         self.registry_limit = registry_limit or _safe_int(
             os.environ.get("DESCRIBE_REGISTRY_LIMIT"), DEFAULT_REGISTRY_LIMIT
         )
+        self.registry_sources = self._parse_registry_sources()
+        if len(self.registry_sources) == 1:
+            self.registry_url = self.registry_sources[0]["url"]
+            self.cache_ttl_seconds = self.registry_sources[0]["ttl"]
+        elif self.registry_sources:
+            # The merged cache is only as fresh as its most short-lived source.
+            self.cache_ttl_seconds = min(source["ttl"] for source in self.registry_sources)
         self.session = None
         self.registry: dict[str, dict[str, Any]] = {}
         self.aliases: dict[str, str] = {}
+        # Visible (latest, not deleted) servers in listing order, as parallel
+        # lists of (shortName, name) sort positions and registry keys.
+        self.listing: list[tuple[str, str]] = []
+        self.listing_keys: list[str] = []
+        self.haystacks: dict[str, str] = {}
+        # Registry key -> (encoded detail resource, etag), filled on first read.
+        self.detail_cache: dict[str, tuple[str, str]] = {}
         self.installed: dict[str, Any] = {}
         self.registry_source = "unloaded"
+        self.raw_servers: list[dict[str, Any]] = []
+        self.indexed_at = 0.0
+        self._registry_load: Optional[asyncio.Future] = None
+        self._warm_up: Optional[asyncio.Future] = None
+        # MCP clients found on this host, re-detected once CLIENT_DETECTION_TTL_SECONDS old.
+        self.config_clients: Optional[list[str]] = None
+        self._clients_detected_at = 0.0
+        # Registry name -> {version: index into raw_servers}, for servers with
+        # more than one published version.
+        self.versions: dict[str, dict[str, int]] = {}
         self._ensure_dirs()
 
     def _ensure_dirs(self) -> None:
@@ -193,43 +842,131 @@ class MCPPackageManager:
             self.installed_db.write_text("{}", encoding="utf-8")
 
     async def _load_installed(self) -> None:
-        try:
-            self.installed = json.loads(self.installed_db.read_text(encoding="utf-8"))
-        except Exception:
-            self.installed = {}
+        with METRICS.span("installed.load"):
+            try:
+                text = await run_io(self.installed_db.read_text, encoding="utf-8")
+                self.installed = json.loads(text)
+            except Exception:
+                self.installed = {}
 
     async def _save_installed(self) -> None:
-        self.installed_db.write_text(_json_dumps(self.installed), encoding="utf-8")
-
-    def _cache_is_fresh(self) -> bool:
-        if self.cache_ttl_seconds <= 0 or not self.registry_cache.exists():
+        text = _json_dumps(self.installed)
+        with METRICS.span("installed.save"):
+            await run_io(self.installed_db.write_text, text, encoding="utf-8")
+
+    async def _cache_is_fresh(self, path: Optional[Path] = None, ttl: Optional[int] = None) -> bool:
+        path = path or self.registry_cache
+        ttl = self.cache_ttl_seconds if ttl is None else ttl
+        if ttl <= 0:
+            return False
+        try:
+            modified = (await run_io(path.stat)).st_mtime
+        except OSError:
             return False
-        return (_now() - self.registry_cache.stat().st_mtime) <= self.cache_ttl_seconds
+        return (_now() - modified) <= ttl
+
+    async def _load_cache(self, path: Optional[Path] = None) -> Optional[dict[str, Any]]:
+        """A registry cache file: its servers, plus the index it was saved with, if any."""
+        path = path or self.registry_cache
+
+        def read() -> Any:
+            return json.loads(path.read_text(encoding="utf-8"))
 
-    def _load_cached_registry(self) -> Optional[list[dict[str, Any]]]:
-        if not self.registry_cache.exists():
-            return None
         try:
-            payload = json.loads(self.registry_cache.read_text(encoding="utf-8"))
-            servers = payload.get("servers", [])
-            if isinstance(servers, list):
-                return servers
+            with METRICS.span("cache.load"):
+                payload = await run_io(read)
+            if isinstance(payload.get("servers", []), list):
+                return {"servers": [], **payload}
+        except FileNotFoundError:
+            return None
         except Exception as exc:
             logger.debug("Failed to read registry cache: %s", exc)
         return None
 
-    def _save_cached_registry(self, servers: list[dict[str, Any]], source: str) -> None:
+    async def _load_cached_registry(
+        self, path: Optional[Path] = None
+    ) -> Optional[list[dict[str, Any]]]:
+        payload = await self._load_cache(path)
+        return payload["servers"] if payload else None
+
+    async def _save_cached_registry(
+        self,
+        servers: list[dict[str, Any]],
+        source: str,
+        path: Optional[Path] = None,
+        index: Optional[dict[str, Any]] = None,
+    ) -> None:
         payload = {
             "fetchedAt": int(_now()),
             "source": source,
             "servers": servers,
         }
-        self.registry_cache.write_text(_json_dumps(payload), encoding="utf-8")
+        if index is not None:
+            # Only a describe of the same version may skip re-normalizing these servers.
+            payload["describeVersion"] = VERSION
+            payload["index"] = index
+        target = path or self.registry_cache
+
+        def write() -> None:
+            target.write_text(_json_dumps(payload), encoding="utf-8")
+
+        with METRICS.span("cache.save"):
+            await run_io(write)
+
+    def _parse_registry_sources(self) -> list[dict[str, Any]]:
+        """Split DESCRIBE_REGISTRY into ordered sources, highest priority first.
+
+        Sources are comma-separated. Each may carry per-source settings in its
+        fragment, which is never sent to the server: `URL#ttl=600&timeout=5&total=60`.
+        `timeout` bounds each page request; `total` bounds the whole paginated
+        listing and defaults to `timeout` times the most pages `registry_limit`
+        can take, so a healthy but large registry is not cut off mid-listing.
+        """
+        pages = max(1, -(-self.registry_limit // 100))
+        if "," not in self.registry_url and "#" not in self.registry_url:
+            return [
+                {
+                    "url": self.registry_url,
+                    "ttl": self.cache_ttl_seconds,
+                    "timeout": DEFAULT_SOURCE_TIMEOUT,
+                    "total": DEFAULT_SOURCE_TIMEOUT * pages,
+                    "cache": self.registry_cache,
+                }
+            ]
+        from hashlib import blake2b
+
+        sources = []
+        for entry in self.registry_url.split(","):
+            url, _, fragment = entry.strip().partition("#")
+            if not url:
+                continue
+            settings = dict(item.partition("=")[::2] for item in fragment.split("&") if "=" in item)
+            digest = blake2b(url.encode(), digest_size=6).hexdigest()
+            timeout = _safe_float(settings.get("timeout"), DEFAULT_SOURCE_TIMEOUT)
+            sources.append(
+                {
+                    "url": url,
+                    "ttl": _safe_int(settings.get("ttl"), self.cache_ttl_seconds),
+                    "timeout": timeout,
+                    "total": _safe_float(settings.get("total"), timeout * pages),
+                    "cache": self.cache_dir / f"registry-{digest}.json",
+                }
+            )
+        if len(sources) == 1:
+            sources[0]["cache"] = self.registry_cache
+        return sources
+
+    async def _fetch_registry_page(
+        self, params: dict[str, Any], url: Optional[str] = None, timeout: float = 20
+    ) -> dict[str, Any]:
+        base_url = url or self.registry_url
 
-    async def _fetch_registry_page(self, params: dict[str, Any]) -> dict[str, Any]:
         def read_json() -> dict[str, Any]:
-            separator = "&" if "?" in self.registry_url else "?"
-            url = f"{self.registry_url}{separator}{urlencode(params)}"
+            from urllib.parse import urlencode
+            from urllib.request import Request, urlopen
+
+            separator = "&" if "?" in base_url else "?"
+            url = f"{base_url}{separator}{urlencode(params)}"
             request = Request(
                 url,
                 headers={
@@ -237,14 +974,26 @@ class MCPPackageManager:
                     "User-Agent": f"describe/{VERSION}",
                 },
             )
-            with urlopen(request, timeout=20) as response:
+            with urlopen(request, timeout=timeout) as response:
                 charset = response.headers.get_content_charset() or "utf-8"
-                return json.loads(response.read().decode(charset))
+                body = response.read()
+            METRICS.incr("network.requests")
+            METRICS.incr("network.bytes", len(body))
+            return json.loads(body.decode(charset))
 
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, read_json)
-
-    async def _fetch_remote_registry(self) -> list[dict[str, Any]]:
+        with METRICS.span("registry.fetch_page", search="search" in params):
+            try:
+                payload = await asyncio.wait_for(loop.run_in_executor(None, read_json), timeout)
+            except Exception as exc:
+                await self.breaker.record_failure(base_url, exc)
+                raise
+        await self.breaker.record_success(base_url)
+        return payload
+
+    async def _fetch_remote_registry(
+        self, url: Optional[str] = None, timeout: float = 20
+    ) -> list[dict[str, Any]]:
         servers: list[dict[str, Any]] = []
         cursor: Optional[str] = None
 
@@ -254,7 +1003,7 @@ class MCPPackageManager:
             if cursor:
                 params["cursor"] = cursor
 
-            payload = await self._fetch_registry_page(params)
+            payload = await self._fetch_registry_page(params, url, timeout)
 
             if isinstance(payload, dict) and isinstance(payload.get("servers"), list):
                 servers.extend(payload["servers"])
@@ -279,11 +1028,30 @@ class MCPPackageManager:
         return servers
 
     async def _search_remote_registry(self, query: str) -> list[dict[str, Any]]:
-        if self.registry_url.lower() == "builtin":
-            return []
+        sources = [source for source in self.registry_sources if source["url"].lower() != "builtin"]
+        if len(sources) == 1:
+            return await self._search_source(sources[0], query)
+        # Results keep source priority order; search() keeps the first hit per name.
+        results = await asyncio.gather(
+            *(self._search_source(source, query) for source in sources), return_exceptions=True
+        )
+        hits = []
+        for source, result in zip(sources, results):
+            if isinstance(result, BaseException):
+                logger.debug("Registry search failed for %s: %s", source["url"], result)
+                continue
+            hits.extend(result)
+        return hits
 
+    async def _search_source(self, source: dict[str, Any], query: str) -> list[dict[str, Any]]:
+        if await self.breaker.retry_in(source["url"]):
+            METRICS.incr("registry.breaker_skips")
+            return []
+        # The page fetch applies the timeout itself, so a hang reaches the breaker.
         payload = await self._fetch_registry_page(
-            {"limit": min(100, self.registry_limit), "search": query}
+            {"limit": min(100, self.registry_limit), "search": query},
+            source["url"],
+            source["timeout"],
         )
         if isinstance(payload, dict) and isinstance(payload.get("servers"), list):
             return [
@@ -320,48 +1088,207 @@ class MCPPackageManager:
 
     async def _fetch_registry(self, force: bool = False) -> None:
         """Load MCP server registry data from cache, the official API, or fallback."""
-        if self.registry and not force:
+        # Long-lived (shared) managers rebuild the index once it outlives the cache TTL.
+        expired = 0 < self.cache_ttl_seconds < _now() - self.indexed_at
+        if self.registry and not force and not expired:
             return
 
-        if not force and self._cache_is_fresh():
-            cached = self._load_cached_registry()
-            if cached:
-                self._index_registry(cached, "cache")
+        # Concurrent requests on a shared manager wait on one load instead of each starting one.
+        if force or self._registry_load is None or self._registry_load.done():
+            self._registry_load = asyncio.ensure_future(self._load_registry(force))
+        await asyncio.shield(self._registry_load)
+
+    async def _load_registry(self, force: bool) -> None:
+        if not force and await self._cache_is_fresh():
+            cached = await self._load_cache()
+            if cached and cached["servers"]:
+                METRICS.incr("cache.hit")
+                self._index_cached(cached, "cache")
                 return
+        METRICS.incr("cache.miss")
+
+        if len(self.registry_sources) > 1:
+            await self._fetch_sources(force)
+            return
 
         if self.registry_url.lower() == "builtin":
-            self._index_registry(list(FALLBACK_REGISTRY.values()), "built-in")
+            # Offline hosts keep using an imported snapshot after its TTL.
+            cached = await self._load_cache()
+            if cached and cached["servers"]:
+                self._index_cached(cached, "stale-cache")
+            else:
+                self._index_registry(list(_fallback_registry().values()), "built-in")
             return
 
+        retry_in = 0.0 if force else await self.breaker.retry_in(self.registry_url)
         try:
-            servers = await self._fetch_remote_registry()
-            self._save_cached_registry(servers, self.registry_url)
+            if retry_in:
+                METRICS.incr("registry.breaker_skips")
+                raise RuntimeError(f"registry unavailable; retrying in {retry_in:.0f}s")
+            with METRICS.span("registry.fetch"):
+                servers = await self._fetch_remote_registry()
+            await self._save_cached_registry(servers, self.registry_url)
             self._index_registry(servers, "official-registry")
             return
         except Exception as exc:
+            METRICS.incr("registry.fetch_failures")
             logger.warning("Registry fetch failed; using fallback data: %s", exc)
 
-        cached = self._load_cached_registry()
-        if cached:
-            self._index_registry(cached, "stale-cache")
+        cached = await self._load_cache()
+        if cached and cached["servers"]:
+            self._index_cached(cached, "stale-cache")
             return
 
-        self._index_registry(list(FALLBACK_REGISTRY.values()), "built-in")
+        self._index_registry(list(_fallback_registry().values()), "built-in")
+
+    async def _fetch_source(self, source: dict[str, Any], force: bool) -> list[dict[str, Any]]:
+        """One source's servers: its fresh cache, a fetch bounded by its timeout, or stale cache."""
+        if source["url"].lower() == "builtin":
+            return list(_fallback_registry().values())
+        if not force and await self._cache_is_fresh(source["cache"], source["ttl"]):
+            cached = await self._load_cached_registry(source["cache"])
+            if cached:
+                return cached
+        retry_in = 0.0 if force else await self.breaker.retry_in(source["url"])
+        try:
+            if retry_in:
+                METRICS.incr("registry.breaker_skips")
+                raise RuntimeError(f"unavailable; retrying in {retry_in:.0f}s")
+            with METRICS.span("registry.fetch", source=source["url"]):
+                servers = await asyncio.wait_for(
+                    self._fetch_remote_registry(source["url"], source["timeout"]),
+                    source["total"],
+                )
+            await self._save_cached_registry(servers, source["url"], source["cache"])
+            return servers
+        except Exception as exc:
+            timed_out = isinstance(exc, asyncio.TimeoutError)
+            if timed_out and not await self.breaker.retry_in(source["url"]):
+                # The total bound fired (cancelling the page fetch) before any page timed out.
+                await self.breaker.record_failure(source["url"], exc)
+            METRICS.incr("registry.fetch_failures")
+            logger.warning("Registry source %s failed: %s", source["url"], str(exc) or "timed out")
+        return await self._load_cached_registry(source["cache"]) or []
+
+    async def _fetch_sources(self, force: bool) -> None:
+        """Fetch every source concurrently and merge them, earlier sources winning conflicts."""
+        results = await asyncio.gather(
+            *(self._fetch_source(source, force) for source in self.registry_sources)
+        )
+        if not all(results):
+            # An imported snapshot ranks below every source and only fills in for failed ones.
+            snapshot = await self._load_cached_registry(self.snapshot_cache)
+            if snapshot:
+                results.append(snapshot)
+        merged: list[dict[str, Any]] = []
+        claimed: set[str] = set()
+        for servers in results:
+            names = set()
+            for server in servers:
+                record = server["server"] if isinstance(server.get("server"), dict) else server
+                name = str(record.get("name") or record.get("id") or "")
+                if name and name in claimed:
+                    continue
+                names.add(name)
+                merged.append(server)
+            claimed |= names
+
+        if not merged:
+            self._index_registry(list(_fallback_registry().values()), "built-in")
+            return
+        await self._save_cached_registry(merged, self.registry_url)
+        self._index_registry(merged, "merged")
 
     def _index_registry(self, servers: list[dict[str, Any]], source: str) -> None:
+        with METRICS.span("registry.index", source=source, servers=len(servers)):
+            self._build_index(servers, source)
+
+    def _build_index(self, servers: list[dict[str, Any]], source: str) -> None:
         self.registry = {}
         self.aliases = {}
+        self.detail_cache = {}
         self.registry_source = source
+        self.raw_servers = servers
+        self.versions = {}
+        self.indexed_at = _now()
 
+        # One entry per server name: the isLatest record, else the first seen.
+        # Every version's position in raw_servers goes to the versions table.
+        keys_by_name: dict[str, str] = {}
         for index, server in enumerate(servers):
             fallback_key = str(server.get("_meta", {}).get("describe/fallbackAlias") or index)
             normalized = self._normalize_server(fallback_key, server, source)
-            key = normalized["shortName"]
-            if key in self.registry:
-                key = normalized["name"]
+            name = normalized["name"]
+            self.versions.setdefault(name, {}).setdefault(normalized["version"], index)
+            key = keys_by_name.get(name)
+            if key is None:
+                key = normalized["shortName"]
+                if key in self.registry:
+                    key = name
+                keys_by_name[name] = key
+            elif self.registry[key]["isLatest"] or not normalized["isLatest"]:
+                continue
             self.registry[key] = normalized
             for alias in normalized["aliases"]:
                 self.aliases.setdefault(alias.lower(), key)
+        self.versions = {name: table for name, table in self.versions.items() if len(table) > 1}
+        self._finish_index()
+
+    def _index_cached(self, payload: dict[str, Any], source: str) -> None:
+        """Index a snapshot or cache payload, reusing the index saved with it when valid."""
+        servers = payload["servers"]
+        if payload.get("describeVersion") == VERSION and _valid_index(
+            payload.get("index"), servers
+        ):
+            self._adopt_index(servers, payload["index"], source)
+        else:
+            self._index_registry(servers, source)
+
+    def _adopt_index(
+        self, servers: list[dict[str, Any]], index: dict[str, Any], source: str
+    ) -> None:
+        """Load an index saved by this describe version instead of rebuilding it."""
+        with METRICS.span("registry.index", source=source, servers=len(servers), adopted=True):
+            self.registry = {
+                key: {**record, "source": source} for key, record in index["registry"].items()
+            }
+            self.aliases = index["aliases"]
+            self.versions = index["versions"]
+            self.detail_cache = {}
+            self.registry_source = source
+            self.raw_servers = servers
+            self.indexed_at = _now()
+            self._finish_index()
+
+    def _finish_index(self) -> None:
+        self.haystacks = {
+            key: " ".join(
+                [
+                    server["name"],
+                    server["shortName"],
+                    server["title"],
+                    server["description"],
+                    " ".join(server["aliases"]),
+                ]
+            ).lower()
+            for key, server in self.registry.items()
+        }
+        visible = sorted(
+            (server["shortName"], server["name"], key)
+            for key, server in self.registry.items()
+            if server["status"] != "deleted" and server["isLatest"]
+        )
+        self.listing = [(short_name, name) for short_name, name, _key in visible]
+        self.listing_keys = [key for _short_name, _name, key in visible]
+
+    def _listing_start(self, cursor: Optional[str]) -> int:
+        """Index of the first listing entry after a cursor's position."""
+        if not cursor:
+            return 0
+        position = decode_cursor(cursor)
+        if not (isinstance(position, list) and len(position) == 2):
+            raise InvalidCursorError(f"Invalid cursor: {cursor}")
+        return bisect.bisect_right(self.listing, tuple(position))
 
     def _normalize_server(
         self, fallback_key: str, server: dict[str, Any], source: str
@@ -516,111 +1443,175 @@ class MCPPackageManager:
             return self.registry[self.aliases[query]]
 
         matches = [
-            server
-            for server in self.registry.values()
-            if query
-            in " ".join(
-                [
-                    server["name"].lower(),
-                    server["shortName"].lower(),
-                    server["title"].lower(),
-                    server["description"].lower(),
-                    " ".join(server["aliases"]),
-                ]
-            )
+            self.registry[key] for key, haystack in self.haystacks.items() if query in haystack
         ]
         if len(matches) == 1:
             return matches[0]
         return None
 
-    async def list_available(self) -> list[dict[str, Any]]:
+    async def server_detail(self, name: str) -> Optional[tuple[str, str]]:
+        """Encoded detail resource and etag for one server, by exact name or alias."""
         await self._fetch_registry()
+        query = name.strip().lower()
+        key = query if query in self.registry else self.aliases.get(query)
+        if key is None:
+            return None
+        if key not in self.detail_cache:
+            server = self.registry[key]
+            self.detail_cache[key] = _etagged(server, server.get("version") or "latest")
+        return self.detail_cache[key]
+
+    async def installed_detail(self, name: str) -> Optional[tuple[str, str]]:
+        """Encoded detail resource and etag for one installed server."""
         await self._load_installed()
-        installed_names = {
+        key = name.strip().lower()
+        if key not in self.installed:
+            return None
+        record = self.installed[key]
+        return _etagged({"name": key, **record}, record.get("method", "unknown"))
+
+    def _resolve_version(self, spec: str) -> tuple[Optional[dict[str, Any]], Optional[str]]:
+        """Resolve `name` or `name@version` to a registry entry, or return an error message."""
+        server = self._resolve_server(spec)
+        base, _, version = spec.rpartition("@")
+        if server is not None or not base or not version:
+            return server, None if server else f"Server '{spec}' not found in registry"
+
+        server = self._resolve_server(base)
+        if server is None:
+            return None, f"Server '{base}' not found in registry"
+        if version in {"latest", server["version"]}:
+            return server, None
+        table = self.versions.get(server["name"], {})
+        if version not in table:
+            known = ", ".join(sorted(table)) or server["version"] or "unknown"
+            return None, f"Version '{version}' of '{server['name']}' not found (known: {known})"
+        index = table[version]
+        return self._normalize_server(str(index), self.raw_servers[index], server["source"]), None
+
+    def _installed_names(self) -> set[str]:
+        return {
             str(value.get("server", {}).get("name") or key).lower()
             for key, value in self.installed.items()
-        }
-        servers = [
-            {
-                "name": server["shortName"],
-                "registryName": server["name"],
-                "title": server["title"],
-                "description": server["description"],
-                "version": server["version"],
-                "status": server["status"],
-                "source": server["source"],
-                "installMethods": server["installMethods"],
-                "installed": server["name"].lower() in installed_names
-                or server["shortName"].lower() in self.installed,
-            }
-            for server in self.registry.values()
-            if server["status"] != "deleted" and server["isLatest"]
-        ]
-        return sorted(servers, key=lambda item: item["name"])
+        } | set(self.installed)
+
+    @staticmethod
+    def _project(
+        server: dict[str, Any],
+        fields: tuple[str, ...],
+        installed_names: Optional[set[str]] = None,
+    ) -> dict[str, Any]:
+        entry = {}
+        for field in fields:
+            if field == "installed":
+                entry["installed"] = (
+                    server["name"].lower() in installed_names
+                    or server["shortName"].lower() in installed_names
+                )
+            else:
+                entry[field] = REGISTRY_FIELDS[field](server)
+        return entry
 
-    async def search(self, query: str) -> list[dict[str, Any]]:
+    async def list_available(self, fields: Any = None) -> list[dict[str, Any]]:
+        return (await self.list_available_page(limit=None, fields=fields))["servers"]
+
+    async def list_available_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_SIZE,
+        fields: Any = None,
+    ) -> dict[str, Any]:
+        """One page of the pre-sorted listing; costs O(page), not O(registry)."""
+        selected = resolve_fields(fields, LIST_FIELD_PRESETS, REGISTRY_FIELDS, required=("name",))
         await self._fetch_registry()
+        installed_names = None
+        if "installed" in selected:
+            await self._load_installed()
+            installed_names = self._installed_names()
+        start = self._listing_start(cursor)
+        end = len(self.listing) if limit is None else min(start + limit, len(self.listing))
+        page = {
+            "servers": [
+                self._project(self.registry[key], selected, installed_names)
+                for key in self.listing_keys[start:end]
+            ],
+            "total": len(self.listing),
+        }
+        if end < len(self.listing):
+            page["nextCursor"] = encode_cursor(self.listing[end - 1])
+        return page
+
+    async def search(self, query: str, fields: Any = None) -> list[dict[str, Any]]:
+        return (await self.search_page(query, limit=None, fields=fields))["servers"]
+
+    async def search_page(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_SIZE,
+        fields: Any = None,
+    ) -> dict[str, Any]:
+        """One page of search results in listing order.
+
+        Local matches are read from the pre-sorted listing starting at the cursor
+        and stop once the page is full. Registry search results for cache misses
+        are merged into the same order.
+        """
         query = query.lower().strip()
         if not query:
-            return await self.list_available()
-
-        results = []
-        for server in self.registry.values():
-            if not server["isLatest"]:
-                continue
-            haystack = " ".join(
-                [
-                    server["name"],
-                    server["shortName"],
-                    server["title"],
-                    server["description"],
-                    " ".join(server["aliases"]),
-                ]
-            ).lower()
-            if query in haystack:
-                results.append(
-                    {
-                        "name": server["shortName"],
-                        "registryName": server["name"],
-                        "title": server["title"],
-                        "description": server["description"],
-                        "version": server["version"],
-                        "status": server["status"],
-                        "installMethods": server["installMethods"],
-                    }
-                )
+            return await self.list_available_page(cursor, limit, fields)
+        selected = resolve_fields(fields, SEARCH_FIELD_PRESETS, REGISTRY_FIELDS, required=("name",))
+        await self._fetch_registry()
+        installed_names = None
+        if "installed" in selected:
+            await self._load_installed()
+            installed_names = self._installed_names()
+
+        start = self._listing_start(cursor)
+        after = self.listing[start - 1] if start else None
+        wanted = None if limit is None else limit + 1
+        matches: list[tuple[tuple[str, str], dict[str, Any]]] = []
+        for index in range(start, len(self.listing)):
+            key = self.listing_keys[index]
+            if query in self.haystacks[key]:
+                server = self.registry[key]
+                matches.append((self.listing[index], server))
+                if wanted is not None and len(matches) >= wanted:
+                    break
 
         if self.registry_url.lower() != "builtin":
             try:
-                known_names = {result["registryName"] for result in results}
+                known_names = {server["name"] for _position, server in matches}
                 for server in await self._search_remote_registry(query):
                     if not server["isLatest"]:
                         continue
                     if server["name"] in known_names:
                         continue
                     known_names.add(server["name"])
-                    results.append(
-                        {
-                            "name": server["shortName"],
-                            "registryName": server["name"],
-                            "title": server["title"],
-                            "description": server["description"],
-                            "version": server["version"],
-                            "status": server["status"],
-                            "installMethods": server["installMethods"],
-                        }
-                    )
+                    position = (server["shortName"], server["name"])
+                    if after is None or position > after:
+                        matches.append((position, server))
             except Exception as exc:
                 logger.debug("Registry search failed; using local cache only: %s", exc)
-        return sorted(results, key=lambda item: item["name"])
+
+        matches.sort(key=lambda match: match[0])
+        page: dict[str, Any] = {
+            "servers": [
+                self._project(server, selected, installed_names)
+                for _position, server in matches[:limit]
+            ]
+        }
+        if limit is not None and len(matches) > limit:
+            page["nextCursor"] = encode_cursor(matches[limit - 1][0])
+        return page
 
     async def install(self, name: str, method: Optional[str] = None) -> dict[str, Any]:
         await self._fetch_registry()
         await self._load_installed()
 
-        server = self._resolve_server(name)
+        server, error = self._resolve_version(name)
         if server is None:
-            return {"error": f"Server '{name}' not found in registry"}
+            return {"error": error}
 
         installed_key = server["shortName"]
         if installed_key in self.installed:
@@ -641,20 +1632,22 @@ class MCPPackageManager:
             }
 
         candidate = candidates[0]
-        if candidate["method"] == "npm":
-            result = await self._install_npm(candidate["package"])
-        elif candidate["method"] == "docker":
-            result = await self._install_docker(candidate["image"])
-        elif candidate["method"] == "pypi":
-            result = await self._install_pypi(candidate["package"])
-        else:
-            result = {
-                "method": "remote",
-                "url": candidate["url"],
-                "transport": candidate.get("transport", {}),
-                "status": "configured",
-                "note": "Remote MCP servers do not require a local package install.",
+        if (
+            server["version"]
+            and name.endswith(f"@{server['version']}")
+            and candidate.get("version")
+        ):
+            # An explicitly requested version pins the package manager install too.
+            separator = "==" if candidate["method"] == "pypi" else "@"
+            candidate = {
+                **candidate,
+                "package": f"{candidate['package']}{separator}{candidate['version']}",
             }
+        with METRICS.span(f"install.{candidate['method']}", server=installed_key):
+            result = await self._run_install(candidate)
+        METRICS.incr("install.failures" if "error" in result else "install.successes")
+        if result.get("method") in {"npm", "pypi"} and "error" not in result:
+            result = {**result, **await self._resolve_entry_point(result)}
 
         if "error" not in result:
             details = {
@@ -669,6 +1662,21 @@ class MCPPackageManager:
 
         return result
 
+    async def _run_install(self, candidate: dict[str, Any]) -> dict[str, Any]:
+        if candidate["method"] == "npm":
+            return await self._install_npm(candidate["package"])
+        if candidate["method"] == "docker":
+            return await self._install_docker(candidate["image"])
+        if candidate["method"] == "pypi":
+            return await self._install_pypi(candidate["package"])
+        return {
+            "method": "remote",
+            "url": candidate["url"],
+            "transport": candidate.get("transport", {}),
+            "status": "configured",
+            "note": "Remote MCP servers do not require a local package install.",
+        }
+
     async def _install_npm(self, package: str) -> dict[str, Any]:
         try:
             proc = await asyncio.create_subprocess_exec(
@@ -676,8 +1684,8 @@ class MCPPackageManager:
                 "install",
                 "-g",
                 package,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
             _stdout, stderr = await proc.communicate()
             if proc.returncode == 0:
@@ -692,8 +1700,8 @@ class MCPPackageManager:
                 "docker",
                 "pull",
                 image,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
             _stdout, stderr = await proc.communicate()
             if proc.returncode == 0:
@@ -711,8 +1719,8 @@ class MCPPackageManager:
                 "install",
                 "--user",
                 package,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
             _stdout, stderr = await proc.communicate()
             if proc.returncode == 0:
@@ -721,6 +1729,146 @@ class MCPPackageManager:
         except Exception as exc:
             return {"error": str(exc)}
 
+    async def _command_output(self, *command: str) -> Optional[str]:
+        """Stdout of a short helper command, or None when it cannot run or fails."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _stderr = await proc.communicate()
+        except OSError as exc:
+            logger.debug("Cannot run %s: %s", command[0], exc)
+            return None
+        return stdout.decode(errors="replace").strip() if proc.returncode == 0 else None
+
+    async def _resolve_entry_point(self, details: dict[str, Any]) -> dict[str, Any]:
+        """Installed version and executable of an npm or PyPI install, for direct launches."""
+        from config_manager import split_package_version
+
+        package, _version = split_package_version(details.get("package", ""))
+        if details.get("method") == "npm":
+            prefix = await self._command_output("npm", "prefix", "-g")
+            if not prefix:
+                return {}
+            return await run_io(self._npm_entry_point, Path(prefix), package)
+        if details.get("method") == "pypi":
+            output = await self._command_output(sys.executable, "-c", PYPI_ENTRY_PROBE, package)
+            try:
+                probe = json.loads(output or "")
+            except ValueError:
+                return {}
+            resolved: dict[str, Any] = {"installedVersion": probe["version"]}
+            scripts = probe["scripts"]
+            script = package.lower() if package.lower() in scripts else None
+            if script is None and len(scripts) == 1:
+                script = scripts[0]
+            suffix = ".exe" if os.name == "nt" else ""
+            if script and (Path(probe["bin"]) / f"{script}{suffix}").is_file():
+                resolved["entryPoint"] = {"command": str(Path(probe["bin"]) / f"{script}{suffix}")}
+            return resolved
+        return {}
+
+    @staticmethod
+    def _npm_entry_point(prefix: Path, package: str) -> dict[str, Any]:
+        modules = prefix / "node_modules" if os.name == "nt" else prefix / "lib" / "node_modules"
+        try:
+            manifest = json.loads((modules / package / "package.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        resolved: dict[str, Any] = {"installedVersion": str(manifest.get("version") or "")}
+        bins = manifest.get("bin") or {}
+        if isinstance(bins, str):
+            bins = {package.rpartition("/")[2]: bins}
+        short_name = package.rpartition("/")[2]
+        command = short_name if short_name in bins else next(iter(bins), None)
+        if command and len(bins) > 1 and command != short_name:
+            command = None
+        if command:
+            path = prefix / f"{command}.cmd" if os.name == "nt" else prefix / "bin" / command
+            if path.is_file():
+                resolved["entryPoint"] = {"command": str(path)}
+        return resolved
+
+    async def _load_bench(self) -> dict[str, Any]:
+        try:
+            return json.loads(await run_io(self.bench_cache.read_text, encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    async def launch_configs(self, include_configured: bool = True) -> dict[str, dict[str, Any]]:
+        """Launch configs for installed servers, plus servers only found in the client config."""
+        from config_manager import MCPConfigManager
+
+        await self._load_installed()
+        config_mgr = MCPConfigManager(home=self.home)
+        targets = {}
+        for name, record in self.installed.items():
+            details = record.get("details", {})
+            version = details.get("installedVersion") or details.get("server", {}).get("version")
+            targets[name] = {**config_mgr.generate_server_config(details), "version": version}
+        if not include_configured:
+            return targets
+        try:
+            configured = await config_mgr.list_configured()
+        except Exception as exc:
+            logger.debug("Cannot read client config for benchmarking: %s", exc)
+            configured = []
+        for server in configured:
+            targets.setdefault(server["name"].lower(), server)
+        return targets
+
+    async def bench_servers(
+        self,
+        names: Optional[list[str]] = None,
+        refresh: bool = False,
+        timeout: float = BENCH_TIMEOUT_SECONDS,
+        concurrency: int = BENCH_CONCURRENCY,
+    ) -> dict[str, Any]:
+        """Measure cold start (initialize + tools/list) of installed and configured servers.
+
+        Results are cached per launch command and version, so unchanged servers
+        are not relaunched unless refresh is set.
+        """
+        targets = await self.launch_configs()
+        if names:
+            wanted = {name.lower() for name in names}
+            missing = sorted(wanted - set(targets))
+            if missing:
+                return {"error": f"Not installed or configured: {', '.join(missing)}"}
+            targets = {name: config for name, config in targets.items() if name in wanted}
+
+        cache = await self._load_bench()
+        limiter = asyncio.Semaphore(max(1, concurrency))
+
+        async def measure(name: str, config: dict[str, Any]) -> dict[str, Any]:
+            if "command" not in config or not config["command"]:
+                return {"status": "skipped", "reason": "remote servers have no local cold start"}
+            key = _compact_dumps([config["command"], config.get("args", []), config.get("version")])
+            cached = cache.get(name)
+            if not refresh and cached and cached.get("key") == key:
+                return {**cached, "cached": True}
+            async with limiter:
+                with METRICS.span("bench.server", server=name):
+                    result = await probe_server(config, timeout)
+            result["key"] = key
+            result["measuredAt"] = int(_now())
+            if "readyMs" in result:
+                result["slow"] = result["readyMs"] >= _safe_int(
+                    os.environ.get("DESCRIBE_SLOW_START_MS"), SLOW_START_MS
+                )
+            cache[name] = result
+            return result
+
+        results = await asyncio.gather(
+            *(measure(name, config) for name, config in sorted(targets.items()))
+        )
+        await run_io(self.bench_cache.write_text, _json_dumps(cache), encoding="utf-8")
+        servers = [
+            {"name": name, **{key: value for key, value in result.items() if key != "key"}}
+            for name, result in zip(sorted(targets), results)
+        ]
+        return {"servers": servers, "count": len(servers)}
+
     async def uninstall(self, name: str) -> dict[str, Any]:
         await self._load_installed()
 
@@ -734,15 +1882,33 @@ class MCPPackageManager:
             path = Path(details["path"]).expanduser().resolve()
             home = self.home.resolve()
             if path.exists() and (path == home or home in path.parents):
+                import shutil
+
                 shutil.rmtree(path)
 
         del self.installed[key]
         await self._save_installed()
         return {"status": "uninstalled", "name": key}
 
-    async def list_installed(self) -> list[dict[str, Any]]:
+    async def list_installed(self, fields: Any = "full") -> list[dict[str, Any]]:
+        selected = resolve_fields(fields, INSTALLED_FIELD_PRESETS, INSTALLED_FIELDS, "full")
         await self._load_installed()
-        return [{"name": key, **value} for key, value in sorted(self.installed.items())]
+        bench = {}
+        if selected is None or "coldStart" in selected:
+            bench = await self._load_bench()
+        records = [
+            (
+                key,
+                {**value, "coldStart": _cold_start_summary(bench[key])} if key in bench else value,
+            )
+            for key, value in sorted(self.installed.items())
+        ]
+        if selected is None:
+            return [{"name": key, **value} for key, value in records]
+        return [
+            {"name": key, **{field: INSTALLED_FIELDS[field](value) for field in selected}}
+            for key, value in records
+        ]
 
     async def refresh_registry(self) -> dict[str, Any]:
         await self._fetch_registry(force=True)
@@ -753,25 +1919,192 @@ class MCPPackageManager:
             "cache": str(self.registry_cache),
         }
 
-    async def cleanup(self) -> None:
-        return None
+    async def export_registry(self, path: Union[Path, str]) -> dict[str, Any]:
+        """Write the loaded registry to a gzip-compressed, versioned snapshot file."""
+        import gzip
+        from datetime import datetime, timezone
 
+        await self._fetch_registry()
+        created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        snapshot = {
+            "format": SNAPSHOT_FORMAT,
+            "formatVersion": SNAPSHOT_FORMAT_VERSION,
+            "describeVersion": VERSION,
+            "createdAt": created_at,
+            "source": self.registry_source,
+            "count": len(self.raw_servers),
+            "servers": self.raw_servers,
+            # Hosts on the same describe version load this instead of re-normalizing every record.
+            "index": {
+                "registry": self.registry,
+                "aliases": self.aliases,
+                "versions": self.versions,
+            },
+        }
+        target = Path(path).expanduser()
+        text = _compact_dumps(snapshot)
 
-def tool_definitions() -> list[dict[str, Any]]:
-    def string_arg(description: str) -> dict[str, str]:
-        return {"type": "string", "description": description}
+        def write() -> int:
+            partial = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            try:
+                with gzip.open(partial, "wt", encoding="utf-8") as stream:
+                    stream.write(text)
+                os.replace(partial, target)
+            except OSError:
+                partial.unlink(missing_ok=True)
+                raise
+            return target.stat().st_size
 
-    return [
-        {
-            "name": "list",
-            "title": "List MCP Servers",
-            "description": "List servers available from the official MCP Registry cache.",
-            "inputSchema": {"type": "object", "properties": {}},
-            "outputSchema": {
-                "type": "object",
-                "properties": {"servers": {"type": "array"}, "count": {"type": "integer"}},
-                "required": ["servers", "count"],
+        try:
+            size = await run_io(write)
+        except OSError as exc:
+            return {"error": f"Cannot write snapshot: {exc}"}
+        return {
+            "status": "exported",
+            "path": str(target),
+            "count": snapshot["count"],
+            "source": self.registry_source,
+            "bytes": size,
+        }
+
+    async def import_registry(self, path: Union[Path, str]) -> dict[str, Any]:
+        """Seed the registry cache from a snapshot written by export_registry.
+
+        With several registry sources the snapshot is also kept as a lowest-priority
+        source, so it still fills in for unreachable ones after the cache TTL.
+        """
+        import gzip
+
+        source = Path(path).expanduser()
+
+        def read() -> Any:
+            data = source.read_bytes()
+            if data[:2] == b"\x1f\x8b":
+                data = gzip.decompress(data)
+            return json.loads(data)
+
+        try:
+            snapshot = await run_io(read)
+        except (OSError, ValueError) as exc:
+            return {"error": f"Cannot read snapshot {source}: {exc}"}
+
+        if not isinstance(snapshot, dict) or snapshot.get("format") != SNAPSHOT_FORMAT:
+            return {"error": f"{source} is not a describe registry snapshot"}
+        if not isinstance(snapshot.get("formatVersion"), int) or (
+            snapshot["formatVersion"] > SNAPSHOT_FORMAT_VERSION
+        ):
+            return {
+                "error": f"Unsupported snapshot format version: {snapshot.get('formatVersion')}"
+            }
+        servers = snapshot.get("servers")
+        if not isinstance(servers, list) or not all(isinstance(item, dict) for item in servers):
+            return {"error": f"{source} has no server list"}
+
+        self._index_cached(snapshot, "snapshot")
+        # Later starts adopt the saved index too, rather than only this process.
+        index = {"registry": self.registry, "aliases": self.aliases, "versions": self.versions}
+        label = f"snapshot:{snapshot.get('createdAt', 'unknown')}"
+        await self._save_cached_registry(servers, label, index=index)
+        await self._save_cached_registry(servers, label, self.snapshot_cache)
+        return {
+            "status": "imported",
+            "count": len(self.registry),
+            "createdAt": snapshot.get("createdAt"),
+            "cache": str(self.registry_cache),
+        }
+
+    def warm_up(self) -> "asyncio.Future[None]":
+        """Start building the registry index and detecting MCP clients in the background.
+
+        Idempotent. Requests that need the registry meanwhile join the same
+        in-flight load instead of starting their own. installed.json is not
+        preloaded: every use re-reads it, since other processes may change it.
+        """
+        if self._warm_up is None:
+            self._warm_up = asyncio.ensure_future(self._warm())
+        return self._warm_up
+
+    async def _warm(self) -> None:
+        with METRICS.span("warm_up"):
+            outcomes = await asyncio.gather(
+                self._fetch_registry(), self.detect_clients(), return_exceptions=True
+            )
+        for step, outcome in zip(("registry", "clients"), outcomes):
+            if isinstance(outcome, BaseException):
+                logger.debug("Warm-up of %s failed: %s", step, outcome)
+
+    async def detect_clients(self) -> list[str]:
+        """MCP clients on this host; a long-lived server notices clients installed later."""
+        from config_manager import MultiClientConfigManager
+
+        age = time.monotonic() - self._clients_detected_at
+        if self.config_clients is None or age > CLIENT_DETECTION_TTL_SECONDS:
+            self.config_clients = await run_io(MultiClientConfigManager.discover_clients)
+            self._clients_detected_at = time.monotonic()
+        return self.config_clients
+
+    async def cleanup(self) -> None:
+        if self._warm_up is not None and not self._warm_up.done():
+            self._warm_up.cancel()
+
+
+def tool_definitions() -> list[dict[str, Any]]:
+    from config_manager import CLIENT_ADAPTERS
+
+    def string_arg(description: str) -> dict[str, str]:
+        return {"type": "string", "description": description}
+
+    page_args = {
+        "cursor": string_arg("nextCursor from the previous page."),
+        "limit": {
+            "type": "integer",
+            "minimum": 1,
+            "maximum": MAX_PAGE_SIZE,
+            "description": f"Page size. Default: {DEFAULT_PAGE_SIZE}.",
+        },
+    }
+
+    def fields_arg(presets: dict[str, Any], known: Any, default: str) -> dict[str, Any]:
+        return {
+            "description": (
+                f"Preset ({', '.join(presets)}; default {default}) or a list of fields: "
+                f"{', '.join(field for field in known if field != 'name')}."
+            ),
+            "anyOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}],
+        }
+
+    page_output = {
+        "type": "object",
+        "properties": {
+            "servers": {"type": "array"},
+            "count": {"type": "integer"},
+            "nextCursor": {"type": "string"},
+        },
+        "required": ["servers", "count"],
+    }
+
+    client_list_arg = {
+        "type": "array",
+        "items": {"type": "string", "enum": sorted(CLIENT_ADAPTERS)},
+        "description": "MCP clients to update. Defaults to every client found on this machine.",
+    }
+
+    return [
+        {
+            "name": "list",
+            "title": "List MCP Servers",
+            "description": (
+                "List servers available from the official MCP Registry cache, one page at a "
+                "time. Pass nextCursor back as cursor for the next page."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    **page_args,
+                    "fields": fields_arg(LIST_FIELD_PRESETS, REGISTRY_FIELDS, "standard"),
+                },
             },
+            "outputSchema": page_output,
             "annotations": {"readOnlyHint": True, "openWorldHint": True},
         },
         {
@@ -780,14 +2113,14 @@ def tool_definitions() -> list[dict[str, Any]]:
             "description": "Search registry servers by name, package, capability, or description.",
             "inputSchema": {
                 "type": "object",
-                "properties": {"query": string_arg("Search query.")},
+                "properties": {
+                    "query": string_arg("Search query."),
+                    **page_args,
+                    "fields": fields_arg(SEARCH_FIELD_PRESETS, REGISTRY_FIELDS, "standard"),
+                },
                 "required": ["query"],
             },
-            "outputSchema": {
-                "type": "object",
-                "properties": {"servers": {"type": "array"}, "count": {"type": "integer"}},
-                "required": ["servers", "count"],
-            },
+            "outputSchema": page_output,
             "annotations": {"readOnlyHint": True, "openWorldHint": True},
         },
         {
@@ -797,7 +2130,10 @@ def tool_definitions() -> list[dict[str, Any]]:
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "name": string_arg("Server short name, registry name, or package name."),
+                    "name": string_arg(
+                        "Server short name, registry name, or package name. "
+                        "Append @version to install a specific registry version."
+                    ),
                     "method": string_arg("Optional method: npm, docker, pypi, or remote."),
                 },
                 "required": ["name"],
@@ -829,19 +2165,25 @@ def tool_definitions() -> list[dict[str, Any]]:
             "name": "installed",
             "title": "List Installed Servers",
             "description": "List MCP servers currently tracked by describe.",
-            "inputSchema": {"type": "object", "properties": {}},
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "fields": fields_arg(INSTALLED_FIELD_PRESETS, INSTALLED_FIELDS, "full"),
+                },
+            },
             "annotations": {"readOnlyHint": True, "openWorldHint": False},
         },
         {
             "name": "config-add",
             "title": "Add Server Config",
-            "description": "Add an installed server to the MCP client configuration.",
+            "description": "Add an installed server to every detected MCP client configuration.",
             "inputSchema": {
                 "type": "object",
                 "properties": {
                     "name": string_arg("Installed server name."),
                     "command": string_arg("Optional command override."),
                     "args": {"type": "array", "items": {"type": "string"}},
+                    "clients": client_list_arg,
                 },
                 "required": ["name"],
             },
@@ -855,10 +2197,13 @@ def tool_definitions() -> list[dict[str, Any]]:
         {
             "name": "config-remove",
             "title": "Remove Server Config",
-            "description": "Remove a server from the MCP client configuration.",
+            "description": "Remove a server from every detected MCP client configuration.",
             "inputSchema": {
                 "type": "object",
-                "properties": {"name": string_arg("Configured server name.")},
+                "properties": {
+                    "name": string_arg("Configured server name."),
+                    "clients": client_list_arg,
+                },
                 "required": ["name"],
             },
             "annotations": {
@@ -903,6 +2248,36 @@ def tool_definitions() -> list[dict[str, Any]]:
                 "openWorldHint": False,
             },
         },
+        {
+            "name": "bench-servers",
+            "title": "Benchmark Server Cold Start",
+            "description": (
+                "Launch installed and configured stdio servers, run initialize and tools/list, "
+                "and report time-to-ready, memory, and tool count. Results are cached per "
+                "version; slow servers are flagged in installed output."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Servers to measure. Defaults to all.",
+                    },
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "Measure again even if a cached result exists.",
+                    },
+                    "timeout": {"type": "number", "description": "Seconds per server."},
+                },
+            },
+            "annotations": {
+                "readOnlyHint": False,
+                "destructiveHint": False,
+                "idempotentHint": True,
+                "openWorldHint": True,
+            },
+        },
         {
             "name": "registry-refresh",
             "title": "Refresh Registry",
@@ -924,7 +2299,10 @@ def resource_definitions() -> list[dict[str, Any]]:
             "uri": "describe://registry/available",
             "name": "available_servers",
             "title": "Available MCP Servers",
-            "description": "Registry servers currently visible to describe.",
+            "description": (
+                "Registry servers currently visible to describe, one page per read. "
+                "Read nextUri for the next page. Add ?fields=minimal for smaller pages."
+            ),
             "mimeType": "application/json",
             "annotations": {"audience": ["assistant"], "priority": 0.9},
         },
@@ -944,6 +2322,38 @@ def resource_definitions() -> list[dict[str, Any]]:
             "mimeType": "text/markdown",
             "annotations": {"audience": ["assistant", "user"], "priority": 0.7},
         },
+        {
+            "uri": "describe://metrics",
+            "name": "metrics",
+            "title": "describe Metrics",
+            "description": "Span timings and counters collected by this describe process.",
+            "mimeType": "application/json",
+            "annotations": {"audience": ["user"], "priority": 0.2},
+        },
+    ]
+
+
+def resource_template_definitions() -> list[dict[str, Any]]:
+    return [
+        {
+            "uriTemplate": "describe://registry/server/{name}",
+            "name": "registry_server",
+            "title": "Registry Server",
+            "description": (
+                "One registry server by name or alias, with an etag that changes when "
+                "its entry does. Much smaller than reading the whole registry."
+            ),
+            "mimeType": "application/json",
+            "annotations": {"audience": ["assistant"], "priority": 0.8},
+        },
+        {
+            "uriTemplate": "describe://servers/installed/{name}",
+            "name": "installed_server",
+            "title": "Installed Server",
+            "description": "One installed server's install record, with an etag.",
+            "mimeType": "application/json",
+            "annotations": {"audience": ["assistant"], "priority": 0.7},
+        },
     ]
 
 
@@ -970,20 +2380,160 @@ def prompt_definitions() -> list[dict[str, Any]]:
     ]
 
 
+class _FrozenDict(dict):
+    """A dict that rejects mutation; shared definitions are handed to every request."""
+
+    def _readonly(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise TypeError("describe definitions are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+class _EncodedResult(dict):
+    """A JSON-RPC result that carries its own serialized form."""
+
+    text = ""
+
+
+class _CachedResult(_FrozenDict, _EncodedResult):
+    """A frozen, pre-serialized result shared across requests."""
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+STATIC_LIST_METHODS = {
+    "tools/list": ("tools", tool_definitions),
+    "resources/list": ("resources", resource_definitions),
+    "resources/templates/list": ("resourceTemplates", resource_template_definitions),
+    "prompts/list": ("prompts", prompt_definitions),
+}
+
+
+# Transports that run WATCHER and can push notifications/resources/updated.
+SUBSCRIPTION_TRANSPORTS = frozenset({"stdio"})
+
+# Methods that never change describe's state; batches run these concurrently.
+READ_ONLY_METHODS = frozenset(
+    {"initialize", "ping", "resources/read", "prompts/get", *STATIC_LIST_METHODS}
+)
+
+
+@functools.cache
+def _read_only_tools() -> frozenset[str]:
+    return frozenset(
+        tool["name"]
+        for tool in tool_definitions()
+        if tool.get("annotations", {}).get("readOnlyHint")
+    )
+
+
+def is_read_only_request(request: dict[str, Any]) -> bool:
+    """Whether a request only reads state and may run alongside other requests."""
+    method = request.get("method")
+    if method == "tools/call":
+        return (request.get("params") or {}).get("name") in _read_only_tools()
+    return method in READ_ONLY_METHODS
+
+
+@functools.cache
+def _static_result(method: str) -> _CachedResult:
+    """Build a list method's result once, frozen and pre-serialized."""
+    key, build = STATIC_LIST_METHODS[method]
+    result = _CachedResult({key: _freeze(build())})
+    result.text = json.dumps(result)
+    return result
+
+
+def _static_page(method: str, cursor: Optional[str]) -> dict[str, Any]:
+    """Page through a static list; the common single-page case is fully cached."""
+    result = _static_result(method)
+    key = STATIC_LIST_METHODS[method][0]
+    limit = page_limit(None)
+    if not cursor and len(result[key]) <= limit:
+        return result
+    offset = decode_cursor(cursor) if cursor else 0
+    if not isinstance(offset, int) or offset < 0:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    page: dict[str, Any] = {key: result[key][offset : offset + limit]}
+    if offset + limit < len(result[key]):
+        page["nextCursor"] = encode_cursor(offset + limit)
+    return page
+
+
+@functools.cache
+def _prompt_index() -> dict[str, dict[str, Any]]:
+    return {prompt["name"]: prompt for prompt in _static_result("prompts/list")["prompts"]}
+
+
+REGISTRY_SERVER_URI = "describe://registry/server/"
+INSTALLED_SERVER_URI = "describe://servers/installed/"
+
+
+def _split_resource_uri(uri: str) -> tuple[str, dict[str, str]]:
+    """Split `describe://path?cursor=...&limit=...` into the base URI and its parameters."""
+    base, _, query = uri.partition("?")
+    if not query:
+        return base, {}
+    from urllib.parse import parse_qsl
+
+    return base, dict(parse_qsl(query))
+
+
 async def read_resource(uri: str, manager: MCPPackageManager) -> dict[str, Any]:
-    if uri == "describe://registry/available":
-        servers = await manager.list_available()
-        text = _json_dumps(
-            {
-                "source": manager.registry_source,
-                "count": len(servers),
-                "servers": servers,
-            }
-        )
+    base_uri, query = _split_resource_uri(uri)
+    if base_uri == "describe://registry/available":
+        try:
+            page = await manager.list_available_page(
+                query.get("cursor"), page_limit(query.get("limit")), query.get("fields")
+            )
+        except InvalidArgumentError as exc:
+            return {"error": str(exc)}
+        body = {"source": manager.registry_source, "count": len(page["servers"]), **page}
+        if "nextCursor" in page:
+            from urllib.parse import urlencode
+
+            next_query = {**query, "cursor": page["nextCursor"]}
+            body["nextUri"] = f"{base_uri}?{urlencode(next_query, safe=',')}"
+        text = _compact_dumps(body)
         mime_type = "application/json"
-    elif uri == "describe://servers/installed":
-        installed = await manager.list_installed()
-        text = _json_dumps({"count": len(installed), "servers": installed})
+    elif base_uri == "describe://servers/installed":
+        try:
+            installed = await manager.list_installed(query.get("fields") or "full")
+        except InvalidArgumentError as exc:
+            return {"error": str(exc)}
+        text = _compact_dumps({"count": len(installed), "servers": installed})
+        mime_type = "application/json"
+    elif base_uri.startswith((REGISTRY_SERVER_URI, INSTALLED_SERVER_URI)):
+        from urllib.parse import unquote
+
+        if base_uri.startswith(REGISTRY_SERVER_URI):
+            name = unquote(base_uri[len(REGISTRY_SERVER_URI) :])
+            detail = await manager.server_detail(name)
+        else:
+            name = unquote(base_uri[len(INSTALLED_SERVER_URI) :])
+            detail = await manager.installed_detail(name)
+        if detail is None:
+            return {"error": f"Server '{name}' not found"}
+        text, etag = detail
+        return {
+            "contents": [
+                {
+                    "uri": uri,
+                    "mimeType": "application/json",
+                    "text": text,
+                    "_meta": {"describe/etag": etag},
+                }
+            ]
+        }
+    elif uri == "describe://metrics":
+        text = _compact_dumps(METRICS.snapshot())
         mime_type = "application/json"
     elif uri == "describe://guide/agent-stack":
         text = (
@@ -1005,6 +2555,101 @@ async def read_resource(uri: str, manager: MCPPackageManager) -> dict[str, Any]:
     return {"contents": [{"uri": uri, "mimeType": mime_type, "text": text}]}
 
 
+def _installed_digest(data: bytes) -> Any:
+    return hash(data)
+
+
+def _registry_digest(data: bytes) -> Any:
+    # Every refresh rewrites fetchedAt; only the server list is resource content.
+    try:
+        return hash(_compact_dumps(json.loads(data).get("servers")))
+    except (ValueError, AttributeError):
+        return hash(data)
+
+
+class ResourceWatcher:
+    """Track resources/subscribe state and report subscribed resources whose content changed.
+
+    Backing files are stat-polled; a changed (mtime, size) triggers a re-read,
+    and a notification is sent only if the content digest differs too. Stats,
+    reads, and digests (the registry cache is megabytes of JSON) run on the I/O pool.
+    """
+
+    WATCHED = {
+        "describe://servers/installed": ("installed_db", _installed_digest),
+        "describe://registry/available": ("registry_cache", _registry_digest),
+    }
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval or float(os.environ.get("DESCRIBE_WATCH_INTERVAL") or 1.0)
+        # uri -> [path, digest function, (mtime_ns, size), content digest]
+        self.subscriptions: dict[str, list[Any]] = {}
+
+    async def subscribe(self, uri: str, manager: MCPPackageManager) -> None:
+        base_uri, _query = _split_resource_uri(uri)
+        if base_uri not in self.WATCHED:
+            raise InvalidArgumentError(f"Resource does not support subscriptions: {uri}")
+        attribute, digest = self.WATCHED[base_uri]
+        path = getattr(manager, attribute)
+        stat_key, content = await run_io(self._fingerprint, path, digest)
+        self.subscriptions[uri] = [path, digest, stat_key, content]
+
+    def unsubscribe(self, uri: str) -> None:
+        self.subscriptions.pop(uri, None)
+
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _fingerprint(self, path: Path, digest: Any) -> tuple[Any, Any]:
+        stat_key = self._stat_key(path)
+        if stat_key is None:
+            return None, None
+        try:
+            return stat_key, digest(path.read_bytes())
+        except OSError:
+            return None, None
+
+    def _refingerprint(self, path: Path, digest: Any, stat_key: Any) -> Optional[tuple[Any, Any]]:
+        """A new fingerprint, or None when the file's (mtime, size) has not moved."""
+        if self._stat_key(path) == stat_key:
+            return None
+        return self._fingerprint(path, digest)
+
+    async def poll(self) -> list[str]:
+        """Return subscribed URIs whose content changed since the last poll."""
+        changed = []
+        for uri, state in list(self.subscriptions.items()):
+            path, digest, stat_key, content = state
+            fingerprint = await run_io(self._refingerprint, path, digest, stat_key)
+            if fingerprint is None or self.subscriptions.get(uri) is not state:
+                continue  # unchanged, or unsubscribed/replaced while it was read
+            state[2], state[3] = fingerprint
+            if state[3] != content:
+                changed.append(uri)
+        return changed
+
+    async def run(self, send: Any) -> None:
+        """Poll until cancelled, passing resources/updated notifications to send."""
+        while True:
+            await asyncio.sleep(self.interval)
+            for uri in await self.poll():
+                send(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "notifications/resources/updated",
+                        "params": {"uri": uri},
+                    }
+                )
+
+
+WATCHER = ResourceWatcher()
+
+
 def get_prompt(name: str, arguments: Optional[dict[str, str]] = None) -> dict[str, Any]:
     arguments = arguments or {}
     if name == "compose-agent-stack":
@@ -1027,9 +2672,7 @@ def get_prompt(name: str, arguments: Optional[dict[str, str]] = None) -> dict[st
         return {"error": f"Unknown prompt: {name}"}
 
     return {
-        "description": next(
-            prompt["description"] for prompt in prompt_definitions() if prompt["name"] == name
-        ),
+        "description": _prompt_index()[name]["description"],
         "messages": [{"role": "user", "content": {"type": "text", "text": text}}],
     }
 
@@ -1042,33 +2685,89 @@ def jsonrpc_error(request_id: Any, code: int, message: str) -> dict[str, Any]:
     return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
 
 
+def encode_response(response: Union[dict[str, Any], list[dict[str, Any]]]) -> str:
+    """Serialize a JSON-RPC response or batch, splicing in pre-serialized results."""
+    if isinstance(response, list):
+        return f"[{', '.join(encode_response(item) for item in response)}]"
+    result = response.get("result")
+    if isinstance(result, _EncodedResult):
+        return f'{{"jsonrpc": "2.0", "id": {json.dumps(response["id"])}, "result": {result.text}}}'
+    return json.dumps(response)
+
+
+def _text_summary(payload: Any, size: int) -> str:
+    """Stand-in text content for payloads too large to repeat outside structuredContent."""
+    if isinstance(payload, dict):
+        summary = {
+            key: f"[{len(value)} items in structuredContent]" if isinstance(value, list) else value
+            for key, value in payload.items()
+            if not isinstance(value, dict)
+        }
+    else:
+        summary = {"result": f"[{size} characters in structuredContent]"}
+    return _compact_dumps(summary)
+
+
 def tool_call_result(payload: Any) -> dict[str, Any]:
+    """Wrap a tool payload, encoding it once for both text and structured content."""
     structured = payload if isinstance(payload, dict) else {"result": payload}
-    result = {
-        "content": [{"type": "text", "text": _json_dumps(payload)}],
-        "structuredContent": structured,
-    }
-    if isinstance(payload, dict) and "error" in payload:
+    payload_json = _compact_dumps(payload)
+    text = payload_json
+    if TEXT_CONTENT_LIMIT and len(payload_json) > TEXT_CONTENT_LIMIT:
+        text = _text_summary(payload, len(payload_json))
+    structured_json = payload_json if structured is payload else f'{{"result":{payload_json}}}'
+
+    result = _EncodedResult(
+        {"content": [{"type": "text", "text": text}], "structuredContent": structured}
+    )
+    is_error = isinstance(payload, dict) and "error" in payload
+    if is_error:
         result["isError"] = True
+    error_flag = ', "isError": true' if is_error else ""
+    result.text = (
+        f'{{"content": [{{"type": "text", "text": {json.dumps(text)}}}], '
+        f'"structuredContent": {structured_json}{error_flag}}}'
+    )
     return result
 
 
 async def call_tool(tool: str, args: dict[str, Any], manager: MCPPackageManager) -> Any:
+    if tool.startswith("config-"):
+        from config_manager import MCPConfigManager, MultiClientConfigManager, client_for_backup
+
     if tool == "list":
-        servers = await manager.list_available()
-        return {"servers": servers, "count": len(servers), "source": manager.registry_source}
+        try:
+            page = await manager.list_available_page(
+                args.get("cursor"), page_limit(args.get("limit")), args.get("fields")
+            )
+        except InvalidArgumentError as exc:
+            return {"error": str(exc)}
+        return {**page, "count": len(page["servers"]), "source": manager.registry_source}
     if tool == "search":
-        servers = await manager.search(str(args.get("query", "")))
-        return {"servers": servers, "count": len(servers)}
+        try:
+            page = await manager.search_page(
+                str(args.get("query", "")),
+                args.get("cursor"),
+                page_limit(args.get("limit")),
+                args.get("fields"),
+            )
+        except InvalidArgumentError as exc:
+            return {"error": str(exc)}
+        return {**page, "count": len(page["servers"])}
     if tool == "install":
         return await manager.install(args.get("name", ""), args.get("method"))
     if tool == "uninstall":
         return await manager.uninstall(args.get("name", ""))
     if tool == "installed":
-        servers = await manager.list_installed()
+        try:
+            servers = await manager.list_installed(args.get("fields") or "full")
+        except InvalidArgumentError as exc:
+            return {"error": str(exc)}
         return {"servers": servers, "count": len(servers)}
     if tool == "config-add":
-        config_mgr = MCPConfigManager(home=manager.home)
+        config_mgr = MultiClientConfigManager(
+            home=manager.home, clients=args.get("clients") or await manager.detect_clients()
+        )
         server_name = str(args.get("name", "")).lower()
 
         await manager._load_installed()
@@ -1076,7 +2775,16 @@ async def call_tool(tool: str, args: dict[str, Any], manager: MCPPackageManager)
             return {"error": f"Server '{server_name}' not installed. Install it first."}
 
         server_info = manager.installed[server_name]
-        server_config = config_mgr.generate_server_config(server_info["details"])
+        details = server_info["details"]
+        if details.get("method") in {"npm", "pypi"} and "installedVersion" not in details:
+            # Installs recorded before entry points were resolved; resolve once and keep.
+            resolved = await manager._resolve_entry_point(details)
+            if resolved:
+                details.update(resolved)
+                await manager._save_installed()
+        server_config = MCPConfigManager(home=manager.home).generate_server_config(
+            server_info["details"]
+        )
 
         if "command" in args:
             server_config["command"] = args["command"]
@@ -1085,7 +2793,9 @@ async def call_tool(tool: str, args: dict[str, Any], manager: MCPPackageManager)
 
         return await config_mgr.add_server(server_name, server_config)
     if tool == "config-remove":
-        config_mgr = MCPConfigManager(home=manager.home)
+        config_mgr = MultiClientConfigManager(
+            home=manager.home, clients=args.get("clients") or await manager.detect_clients()
+        )
         return await config_mgr.remove_server(args.get("name", ""))
     if tool == "config-list":
         config_mgr = MCPConfigManager(home=manager.home)
@@ -1096,30 +2806,114 @@ async def call_tool(tool: str, args: dict[str, Any], manager: MCPPackageManager)
         backup_path = await config_mgr.backup_config()
         return {"backup": backup_path}
     if tool == "config-restore":
-        config_mgr = MCPConfigManager(home=manager.home)
-        return await config_mgr.restore_backup(args.get("backup", ""))
+        backup = args.get("backup", "")
+        config_mgr = MCPConfigManager(home=manager.home, client=client_for_backup(backup))
+        return await config_mgr.restore_backup(backup)
+    if tool == "bench-servers":
+        return await manager.bench_servers(
+            args.get("names"),
+            bool(args.get("refresh")),
+            float(args.get("timeout") or BENCH_TIMEOUT_SECONDS),
+        )
     if tool == "registry-refresh":
         return await manager.refresh_registry()
     return {"error": f"Unknown tool: {tool}"}
 
 
-async def handle_request(request: dict[str, Any]) -> Optional[dict[str, Any]]:
-    """Dispatch one JSON-RPC MCP request."""
-    manager = MCPPackageManager()
+async def handle_request(
+    request: dict[str, Any],
+    manager: Optional[MCPPackageManager] = None,
+    transport: str = "stdio",
+) -> Optional[dict[str, Any]]:
+    """Dispatch one JSON-RPC MCP request.
+
+    Without a manager, one is created for the request; long-lived transports
+    pass a shared manager so the registry index is built once per process.
+    Resource subscriptions are only offered on transports in
+    SUBSCRIPTION_TRANSPORTS, which can deliver the update notifications.
+    """
+    method = request.get("method", "")
+    with PROFILER.profile(f"rpc.{method}"), METRICS.span(f"rpc.{method}"):
+        return await _dispatch_request(request, manager, transport)
+
+
+async def handle_batch(
+    requests: list[Any], manager: Optional[MCPPackageManager] = None, transport: str = "stdio"
+) -> Optional[Union[dict[str, Any], list[dict[str, Any]]]]:
+    """Dispatch a JSON-RPC batch on one manager.
+
+    Runs of consecutive read-only members execute concurrently; anything that
+    writes state runs alone, in batch order. Returns None for all-notification
+    batches, as JSON-RPC requires.
+    """
+    if not requests:
+        return jsonrpc_error(None, -32600, "Invalid Request: empty batch")
+
+    shared = manager or MCPPackageManager()
+    responses: list[Optional[dict[str, Any]]] = []
+    pending: list[dict[str, Any]] = []
+
+    async def flush() -> None:
+        responses.extend(
+            await asyncio.gather(*(handle_request(r, shared, transport) for r in pending))
+        )
+        pending.clear()
+
+    try:
+        with METRICS.span("rpc.batch", size=len(requests)):
+            for request in requests:
+                if isinstance(request, dict) and is_read_only_request(request):
+                    pending.append(request)
+                    continue
+                await flush()
+                if isinstance(request, dict):
+                    responses.append(await handle_request(request, shared, transport))
+                else:
+                    responses.append(jsonrpc_error(None, -32600, "Invalid Request"))
+            await flush()
+    finally:
+        if manager is None:
+            await shared.cleanup()
+    # Notifications never get a response, even an error.
+    return [
+        response
+        for request, response in zip(requests, responses)
+        if response is not None and (not isinstance(request, dict) or "id" in request)
+    ] or None
+
+
+async def _dispatch_request(
+    request: dict[str, Any], shared: Optional[MCPPackageManager] = None, transport: str = "stdio"
+) -> Optional[dict[str, Any]]:
     request_id = request.get("id")
+    method = request.get("method", "")
+
+    # List responses never change within a process; skip manager setup entirely.
+    if method in STATIC_LIST_METHODS:
+        cursor = (request.get("params") or {}).get("cursor")
+        try:
+            return jsonrpc_result(request_id, _static_page(method, cursor))
+        except InvalidCursorError as exc:
+            return jsonrpc_error(request_id, -32602, str(exc))
 
+    manager = shared or MCPPackageManager()
     try:
-        method = request.get("method", "")
         params = request.get("params", {}) or {}
 
         if method == "initialize":
+            if shared is not None:
+                # Load state for the session's first real call without delaying this reply.
+                manager.warm_up()
             return jsonrpc_result(
                 request_id,
                 {
                     "protocolVersion": MCP_PROTOCOL_VERSION,
                     "capabilities": {
                         "tools": {"listChanged": True},
-                        "resources": {"listChanged": True},
+                        "resources": {
+                            "subscribe": transport in SUBSCRIPTION_TRANSPORTS,
+                            "listChanged": True,
+                        },
                         "prompts": {"listChanged": True},
                     },
                     "serverInfo": {
@@ -1136,26 +2930,33 @@ async def handle_request(request: dict[str, Any]) -> Optional[dict[str, Any]]:
                 },
             )
 
-        if method == "initialized":
+        if method in ("initialized", "notifications/initialized"):
             return None
 
-        if method == "tools/list":
-            return jsonrpc_result(request_id, {"tools": tool_definitions()})
-
         if method == "tools/call":
-            payload = await call_tool(
-                params.get("name", ""), params.get("arguments", {}) or {}, manager
-            )
+            tool = params.get("name", "")
+            with METRICS.span(f"tool.{tool}"):
+                payload = await call_tool(tool, params.get("arguments", {}) or {}, manager)
             return jsonrpc_result(request_id, tool_call_result(payload))
 
-        if method == "resources/list":
-            return jsonrpc_result(request_id, {"resources": resource_definitions()})
-
         if method == "resources/read":
             return jsonrpc_result(request_id, await read_resource(params.get("uri", ""), manager))
 
-        if method == "prompts/list":
-            return jsonrpc_result(request_id, {"prompts": prompt_definitions()})
+        subscription = method in ("resources/subscribe", "resources/unsubscribe")
+        if subscription and transport not in SUBSCRIPTION_TRANSPORTS:
+            # Nothing would ever deliver the updates, and WATCHER is shared by all sessions.
+            return jsonrpc_error(request_id, -32601, "Method not found")
+
+        if method == "resources/subscribe":
+            try:
+                await WATCHER.subscribe(params.get("uri", ""), manager)
+            except InvalidArgumentError as exc:
+                return jsonrpc_error(request_id, -32602, str(exc))
+            return jsonrpc_result(request_id, {})
+
+        if method == "resources/unsubscribe":
+            WATCHER.unsubscribe(params.get("uri", ""))
+            return jsonrpc_result(request_id, {})
 
         if method == "prompts/get":
             return jsonrpc_result(
@@ -1169,20 +2970,33 @@ async def handle_request(request: dict[str, Any]) -> Optional[dict[str, Any]]:
         logger.exception("Error handling request")
         return jsonrpc_error(request_id, -32603, str(exc))
     finally:
-        await manager.cleanup()
+        if shared is None:
+            await manager.cleanup()
 
 
 async def main() -> None:
     """Run describe as an MCP stdio server."""
-    async for line in async_stdin():
-        try:
-            request = json.loads(line)
-            response = await handle_request(request)
-            if response is not None:
+    watcher = asyncio.create_task(
+        WATCHER.run(lambda message: print(json.dumps(message), flush=True))
+    )
+    # One manager per session, so the index built once (warmed on initialize) is reused.
+    manager = MCPPackageManager()
+    try:
+        async for line in async_stdin():
+            try:
+                request = json.loads(line)
+                if isinstance(request, list):
+                    response = await handle_batch(request, manager)
+                else:
+                    response = await handle_request(request, manager)
+                if response is not None:
+                    print(encode_response(response), flush=True)
+            except json.JSONDecodeError as exc:
+                response = jsonrpc_error(None, -32700, f"Parse error: {exc}")
                 print(json.dumps(response), flush=True)
-        except json.JSONDecodeError as exc:
-            response = jsonrpc_error(None, -32700, f"Parse error: {exc}")
-            print(json.dumps(response), flush=True)
+    finally:
+        watcher.cancel()
+        await manager.cleanup()
 
 
 async def async_stdin():
@@ -1195,7 +3009,72 @@ async def async_stdin():
         yield line.strip()
 
 
-def build_parser() -> argparse.ArgumentParser:
+async def serve_proxy(manager: MCPPackageManager, idle_seconds: float, cache_ttl: str = "") -> int:
+    """Run the aggregating proxy over stdio until the client disconnects."""
+    from proxy import AggregatingProxy, ResultCache, parse_cache_ttls, run_proxy
+
+    default_ttl, server_ttls = parse_cache_ttls(cache_ttl)
+    cache = None
+    if default_ttl > 0 or any(ttl > 0 for ttl in server_ttls.values()):
+        cache = ResultCache(default_ttl, server_ttls)
+
+    proxy = AggregatingProxy(
+        await manager.launch_configs(include_configured=False),
+        manager.cache_dir / "proxy-tools.json",
+        send=lambda message: print(json.dumps(message), flush=True),
+        server_info={"name": "describe", "title": "describe proxy", "version": VERSION},
+        protocol_version=MCP_PROTOCOL_VERSION,
+        idle_seconds=idle_seconds,
+        cache=cache,
+    )
+    await run_proxy(proxy, async_stdin())
+    return 0
+
+
+def http_handler(manager: MCPPackageManager) -> Any:
+    """The serve-http message handler: one shared manager, HTTP transport semantics."""
+    # Read-only requests run concurrently; anything that writes state takes turns.
+    write_lock = asyncio.Lock()
+
+    async def handle(message: Union[dict[str, Any], list[Any]]) -> Any:
+        if isinstance(message, list):
+            members = [item for item in message if isinstance(item, dict)]
+            if all(is_read_only_request(item) for item in members):
+                return await handle_batch(message, manager, "http")
+            async with write_lock:
+                return await handle_batch(message, manager, "http")
+        if is_read_only_request(message) or "id" not in message:
+            return await handle_request(message, manager, "http")
+        async with write_lock:
+            return await handle_request(message, manager, "http")
+
+    return handle
+
+
+async def serve_http(
+    manager: MCPPackageManager, host: str, port: int, socket_path: Optional[str] = None
+) -> int:
+    """Serve MCP over streamable HTTP, sharing one manager across all sessions."""
+    from http_transport import StreamableHTTPServer
+
+    transport = StreamableHTTPServer(http_handler(manager), encode_response)
+    server = await transport.start(host, port, socket_path)
+    if socket_path:
+        address = f"unix:{socket_path}"
+    else:
+        bound_host, bound_port = server.sockets[0].getsockname()[:2]
+        address = f"http://{bound_host}:{bound_port}{transport.path}"
+    print(f"describe listening on {address}", file=sys.stderr, flush=True)
+    async with server:
+        await server.serve_forever()
+    return 0
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    import argparse
+
+    from config_manager import CLIENT_ADAPTERS
+
     parser = argparse.ArgumentParser(
         prog="describe",
         description="Discover, install, and configure MCP servers for AI-native workflows.",
@@ -1203,13 +3082,28 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--version", action="store_true", help="Show describe version and exit.")
     parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON.")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging.")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Save a cProfile of this command under DESCRIBE_HOME/profiles.",
+    )
 
     subparsers = parser.add_subparsers(dest="command")
-    subparsers.add_parser("list", help="List available MCP servers.")
+    list_parser = subparsers.add_parser("list", help="List available MCP servers.")
 
     search_parser = subparsers.add_parser("search", help="Search MCP servers.")
     search_parser.add_argument("query")
 
+    for paged_parser in (list_parser, search_parser):
+        paged_parser.add_argument("--cursor", help="Continue from a previous page's cursor.")
+        paged_parser.add_argument(
+            "--limit", type=int, help="Page size. Without --limit or --cursor, print everything."
+        )
+        paged_parser.add_argument(
+            "--fields",
+            help="minimal, standard, full, or comma-separated field names. Default: standard.",
+        )
+
     install_parser = subparsers.add_parser("install", help="Install or register an MCP server.")
     install_parser.add_argument("name")
     install_parser.add_argument("--method", choices=["npm", "docker", "pypi", "remote"])
@@ -1217,17 +3111,34 @@ def build_parser() -> argparse.ArgumentParser:
     uninstall_parser = subparsers.add_parser("uninstall", help="Remove an installed server.")
     uninstall_parser.add_argument("name")
 
-    subparsers.add_parser("installed", help="List installed servers.")
+    installed_parser = subparsers.add_parser("installed", help="List installed servers.")
+    installed_parser.add_argument(
+        "--fields",
+        default="full",
+        help="minimal, standard, full, or comma-separated field names. Default: full.",
+    )
 
     config_add_parser = subparsers.add_parser(
         "config-add", help="Add an installed server to MCP config."
     )
     config_add_parser.add_argument("name")
+    config_add_parser.add_argument(
+        "--client",
+        action="append",
+        choices=sorted(CLIENT_ADAPTERS),
+        help="MCP client to update; repeat for several. Defaults to every detected client.",
+    )
 
     config_remove_parser = subparsers.add_parser(
         "config-remove", help="Remove a server from MCP config."
     )
     config_remove_parser.add_argument("name")
+    config_remove_parser.add_argument(
+        "--client",
+        action="append",
+        choices=sorted(CLIENT_ADAPTERS),
+        help="MCP client to update; repeat for several. Defaults to every detected client.",
+    )
 
     subparsers.add_parser("config-list", help="List configured MCP servers.")
     subparsers.add_parser("config-backup", help="Back up MCP configuration.")
@@ -1239,6 +3150,78 @@ def build_parser() -> argparse.ArgumentParser:
 
     subparsers.add_parser("registry-refresh", help="Refresh the MCP Registry cache.")
 
+    proxy_parser = subparsers.add_parser(
+        "proxy",
+        help="Serve all installed servers' tools over stdio, starting each on first use.",
+    )
+    proxy_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=_safe_float(os.environ.get("DESCRIBE_PROXY_IDLE_SECONDS"), 300.0),
+        help="Seconds before an unused downstream server is stopped. Default: 300.",
+    )
+    proxy_parser.add_argument(
+        "--cache-ttl",
+        default=os.environ.get("DESCRIBE_PROXY_CACHE_TTL", ""),
+        help=(
+            "Cache read-only tool results: a default TTL in seconds and/or per-server "
+            "overrides, e.g. 60,github=300,filesystem=0. Default: off."
+        ),
+    )
+
+    http_parser = subparsers.add_parser(
+        "serve-http",
+        help="Serve MCP over streamable HTTP so many local clients share one process.",
+    )
+    http_parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to bind. Default: 127.0.0.1."
+    )
+    http_parser.add_argument(
+        "--port",
+        type=int,
+        default=int(_safe_float(os.environ.get("DESCRIBE_HTTP_PORT"), 8765)),
+        help="Port to bind; 0 picks a free port. Default: 8765.",
+    )
+    http_parser.add_argument("--socket", help="Listen on this Unix socket instead of TCP.")
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run many commands or JSON-RPC lines in one process, printing NDJSON.",
+    )
+    batch_parser.add_argument("file", help="File with one command per line, or - for stdin.")
+    batch_parser.add_argument(
+        "--stop-on-error", action="store_true", help="Stop at the first failed line."
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench-servers", help="Measure cold start of installed and configured servers."
+    )
+    bench_parser.add_argument("names", nargs="*", help="Servers to measure. Default: all.")
+    bench_parser.add_argument(
+        "--refresh", action="store_true", help="Ignore cached results and measure again."
+    )
+    bench_parser.add_argument(
+        "--timeout", type=float, default=BENCH_TIMEOUT_SECONDS, help="Seconds per server."
+    )
+    bench_parser.add_argument(
+        "--concurrency", type=int, default=BENCH_CONCURRENCY, help="Servers launched at once."
+    )
+
+    export_parser = subparsers.add_parser(
+        "registry-export", help="Write the registry to a compressed snapshot file."
+    )
+    export_parser.add_argument("path")
+
+    import_parser = subparsers.add_parser(
+        "registry-import", help="Seed the registry cache from a snapshot file."
+    )
+    import_parser.add_argument("path")
+
+    stats_parser = subparsers.add_parser(
+        "stats", help="Summarize span timings from a DESCRIBE_TRACE file."
+    )
+    stats_parser.add_argument("--trace", help="Trace file to read. Default: $DESCRIBE_TRACE.")
+
     return parser
 
 
@@ -1270,6 +3253,8 @@ def _print_result(result: Any, as_json: bool) -> None:
 
     if isinstance(result, dict) and "servers" in result:
         _print_result(result["servers"], as_json=False)
+        if result.get("nextCursor"):
+            print(f"Next cursor: {result['nextCursor']}")
         return
 
     print(_json_dumps(result))
@@ -1290,49 +3275,217 @@ async def cli_main(argv: Optional[list[str]] = None) -> int:
         parser.print_help()
         return 0
 
+    if args.profile and not PROFILER.enabled:
+        PROFILER.threshold_ms = 0.0
+    with PROFILER.profile(f"cli.{args.command}"):
+        status = await _run_command(parser, args)
+    if args.profile and PROFILER.last_path:
+        print(f"Profile saved to {PROFILER.last_path}", file=sys.stderr)
+    return status
+
+
+async def _run_command(parser: "argparse.ArgumentParser", args: "argparse.Namespace") -> int:
+    if args.command == "stats":
+        trace = args.trace or METRICS.trace_path
+        if not trace:
+            result = {"error": "No trace file. Pass --trace or set DESCRIBE_TRACE."}
+        else:
+            try:
+                result = summarize_trace(trace)
+            except OSError as exc:
+                result = {"error": f"Cannot read trace file: {exc}"}
+        _print_result(result, args.json)
+        return 1 if "error" in result else 0
+
     manager = MCPPackageManager()
     try:
-        if args.command == "list":
-            result = await manager.list_available()
-        elif args.command == "search":
-            result = await manager.search(args.query)
-        elif args.command == "install":
-            result = await manager.install(args.name, args.method)
-        elif args.command == "uninstall":
-            result = await manager.uninstall(args.name)
-        elif args.command == "installed":
-            result = await manager.list_installed()
-        elif args.command == "config-add":
-            result = await call_tool("config-add", {"name": args.name}, manager)
-        elif args.command == "config-remove":
-            result = await call_tool("config-remove", {"name": args.name}, manager)
-        elif args.command == "config-list":
-            result = await call_tool("config-list", {}, manager)
-        elif args.command == "config-backup":
-            result = await call_tool("config-backup", {}, manager)
-        elif args.command == "config-restore":
-            result = await call_tool("config-restore", {"backup": args.backup}, manager)
-        elif args.command == "registry-refresh":
-            result = await manager.refresh_registry()
-        else:
+        if args.command == "proxy":
+            return await serve_proxy(manager, args.idle_timeout, args.cache_ttl)
+        if args.command == "serve-http":
+            return await serve_http(manager, args.host, args.port, args.socket)
+        if args.command == "batch":
+            return await run_batch(parser, args.file, manager, args.stop_on_error)
+        if args.command not in BATCH_COMMANDS:
             parser.print_help()
             return 1
 
+        result = await _command_result(args, manager)
         _print_result(result, args.json)
         return 1 if isinstance(result, dict) and "error" in result else 0
+    except InvalidArgumentError as exc:
+        _print_result({"error": str(exc)}, args.json)
+        return 1
     finally:
         await manager.cleanup()
 
 
+# CLI commands that return one result from a manager; `describe batch` runs these.
+BATCH_COMMANDS = frozenset(
+    {
+        "list",
+        "search",
+        "install",
+        "uninstall",
+        "installed",
+        "config-add",
+        "config-remove",
+        "config-list",
+        "config-backup",
+        "config-restore",
+        "registry-refresh",
+        "bench-servers",
+        "registry-export",
+        "registry-import",
+    }
+)
+
+
+async def _command_result(args: "argparse.Namespace", manager: MCPPackageManager) -> Any:
+    """Run one manager-backed CLI command and return its result."""
+    paged = args.command in {"list", "search"} and (args.cursor or args.limit)
+    if args.command == "list" and paged:
+        return await call_tool(
+            "list",
+            {"cursor": args.cursor, "limit": args.limit, "fields": args.fields},
+            manager,
+        )
+    if args.command == "list":
+        return await manager.list_available(args.fields)
+    if args.command == "search" and paged:
+        return await call_tool(
+            "search",
+            {
+                "query": args.query,
+                "cursor": args.cursor,
+                "limit": args.limit,
+                "fields": args.fields,
+            },
+            manager,
+        )
+    if args.command == "search":
+        return await manager.search(args.query, args.fields)
+    if args.command == "install":
+        return await manager.install(args.name, args.method)
+    if args.command == "uninstall":
+        return await manager.uninstall(args.name)
+    if args.command == "installed":
+        return await manager.list_installed(args.fields)
+    if args.command == "config-add":
+        return await call_tool("config-add", {"name": args.name, "clients": args.client}, manager)
+    if args.command == "config-remove":
+        return await call_tool(
+            "config-remove", {"name": args.name, "clients": args.client}, manager
+        )
+    if args.command == "config-list":
+        return await call_tool("config-list", {}, manager)
+    if args.command == "config-backup":
+        return await call_tool("config-backup", {}, manager)
+    if args.command == "config-restore":
+        return await call_tool("config-restore", {"backup": args.backup}, manager)
+    if args.command == "registry-refresh":
+        return await manager.refresh_registry()
+    if args.command == "bench-servers":
+        return await manager.bench_servers(args.names, args.refresh, args.timeout, args.concurrency)
+    if args.command == "registry-export":
+        return await manager.export_registry(args.path)
+    if args.command == "registry-import":
+        return await manager.import_registry(args.path)
+    return {"error": f"Unsupported command: {args.command}"}
+
+
+async def run_batch(
+    parser: "argparse.ArgumentParser",
+    source: str,
+    manager: MCPPackageManager,
+    stop_on_error: bool = False,
+) -> int:
+    """Run CLI-style commands and JSON-RPC lines on one warm manager, streaming NDJSON.
+
+    JSON lines (objects or batch arrays) are answered with their JSON-RPC
+    response; other lines are parsed as `describe` commands and answered with
+    ``{"line", "command", "result"}``. Blank lines and ``#`` comments are skipped.
+    """
+    failed = False
+    line_number = 0
+    async for line in _batch_lines(source):
+        line_number += 1
+        if not line or line.startswith("#"):
+            continue
+        if line[0] in "[{":
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError as exc:
+                response: Any = jsonrpc_error(None, -32700, f"Parse error: {exc}")
+            else:
+                if isinstance(message, list):
+                    response = await handle_batch(message, manager, "batch")
+                else:
+                    response = await handle_request(message, manager, "batch")
+            if response is not None:
+                print(encode_response(response), flush=True)
+            responses = response if isinstance(response, list) else [response]
+            ok = not any(_response_failed(item) for item in responses if item)
+        else:
+            result = await _batch_command(parser, line, manager)
+            print(json.dumps({"line": line_number, "command": line, "result": result}), flush=True)
+            ok = not (isinstance(result, dict) and "error" in result)
+        failed = failed or not ok
+        if failed and stop_on_error:
+            break
+    return 1 if failed else 0
+
+
+async def _batch_lines(source: str):
+    if source == "-":
+        async for line in async_stdin():
+            yield line
+        return
+    text = await run_io(Path(source).expanduser().read_text, encoding="utf-8")
+    for line in text.splitlines():
+        yield line.strip()
+
+
+async def _batch_command(
+    parser: "argparse.ArgumentParser", line: str, manager: MCPPackageManager
+) -> Any:
+    import io
+    import shlex
+
+    usage = io.StringIO()
+    try:
+        argv = shlex.split(line)
+        if argv[:1] == ["describe"]:
+            argv = argv[1:]
+        # argparse reports bad input on stderr and exits; fold it into the result.
+        with contextlib.redirect_stderr(usage):
+            args = parser.parse_args(argv)
+    except (ValueError, SystemExit) as exc:
+        reason = usage.getvalue().strip().splitlines()[-1:] or [str(exc)]
+        return {"error": f"Invalid command: {reason[0]}"}
+    if args.command not in BATCH_COMMANDS:
+        return {"error": f"{args.command or 'A bare option'} cannot run in a batch"}
+    try:
+        return await _command_result(args, manager)
+    except Exception as exc:
+        logger.debug("Batch command failed: %s", line, exc_info=True)
+        return {"error": str(exc)}
+
+
+def _response_failed(response: dict[str, Any]) -> bool:
+    return "error" in response or bool((response.get("result") or {}).get("isError"))
+
+
 def cli_entrypoint() -> None:
+    _configure_logging()
     sys.exit(asyncio.run(cli_main()))
 
 
 def server_entrypoint() -> None:
+    _configure_logging()
     asyncio.run(main())
 
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        sys.exit(asyncio.run(cli_main()))
-    asyncio.run(main())
+        cli_entrypoint()
+    server_entrypoint()
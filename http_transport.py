@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+MCP HTTP Transport - Streamable HTTP for local clients, stdlib only
+Copyright 2024 James Dominguez
+Licensed under the Apache License, Version 2.0
+"""
+
+import asyncio
+import json
+import secrets
+import time
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MCP_PATH = "/mcp"
+MAX_BODY_BYTES = 4 * 1024 * 1024
+SESSION_IDLE_SECONDS = 60 * 60
+LOCAL_ORIGIN_HOSTS = {"localhost", "127.0.0.1", "[::1]"}
+
+REASONS = {
+    200: "OK",
+    202: "Accepted",
+    204: "No Content",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+}
+
+# Takes one JSON-RPC message or a batch list; returns the response, or None.
+Handler = Callable[[Any], Awaitable[Any]]
+
+
+class StreamableHTTPServer:
+    """Serve MCP's streamable HTTP transport (JSON responses only) on one endpoint.
+
+    Every POST carries one JSON-RPC message or batch. ``initialize`` opens a session whose
+    id is returned in ``Mcp-Session-Id`` and must accompany later requests;
+    DELETE ends it. Server-initiated SSE streams are not offered, so GET
+    answers 405 as the specification allows.
+    """
+
+    def __init__(
+        self,
+        handle: Handler,
+        encode: Callable[[Any], str] = json.dumps,
+        path: str = MCP_PATH,
+        session_idle_seconds: float = SESSION_IDLE_SECONDS,
+    ):
+        self.handle = handle
+        self.encode = encode
+        self.path = path
+        self.session_idle_seconds = session_idle_seconds
+        # session id -> last activity (monotonic seconds)
+        self.sessions: dict[str, float] = {}
+
+    async def start(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, socket_path: Optional[str] = None
+    ) -> asyncio.AbstractServer:
+        if socket_path:
+            return await asyncio.start_unix_server(self.serve_connection, path=socket_path)
+        return await asyncio.start_server(self.serve_connection, host=host, port=port)
+
+    async def serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                status, headers, body = await self.dispatch(*request)
+                keep_alive = request[2].get("connection", "").lower() != "close"
+                self._write_response(writer, status, headers, body, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except _BadRequest as exc:
+            self._write_response(writer, exc.status, {}, exc.body, keep_alive=False)
+        finally:
+            writer.close()
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> Optional[tuple[str, str, dict[str, str], bytes]]:
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        try:
+            method, target, _version = request_line.decode("latin-1").split()
+        except ValueError as exc:
+            raise _BadRequest(400) from exc
+
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise _BadRequest(411)
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError as exc:
+            raise _BadRequest(400) from exc
+        if length > MAX_BODY_BYTES:
+            raise _BadRequest(413)
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+        keep_alive: bool,
+    ) -> None:
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}"]
+        if body:
+            headers = {"Content-Type": "application/json", **headers}
+        headers = {
+            **headers,
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+        }
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+
+    def _expire_sessions(self) -> None:
+        cutoff = time.monotonic() - self.session_idle_seconds
+        for session_id in [key for key, seen in self.sessions.items() if seen < cutoff]:
+            del self.sessions[session_id]
+
+    async def dispatch(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        if target.split("?", 1)[0] != self.path:
+            return 404, {}, b""
+        if not _is_local_origin(headers.get("origin")):
+            # Guards against DNS rebinding from browser pages.
+            return 403, {}, b""
+        if method == "DELETE":
+            session_id = headers.get("mcp-session-id", "")
+            if self.sessions.pop(session_id, None) is None:
+                return 404, {}, b""
+            return 204, {}, b""
+        if method != "POST":
+            return 405, {"Allow": "POST, DELETE"}, b""
+
+        try:
+            message = json.loads(body)
+        except ValueError as exc:
+            return 400, {}, _error_body(None, -32700, f"Parse error: {exc}")
+        members = message if isinstance(message, list) else [message]
+        if not members or not isinstance(message, (dict, list)):
+            return 400, {}, _error_body(None, -32600, "Invalid Request")
+        members = [item for item in members if isinstance(item, dict)]
+        request_id = message.get("id") if isinstance(message, dict) else None
+
+        self._expire_sessions()
+        response_headers: dict[str, str] = {}
+        if any(item.get("method") == "initialize" for item in members):
+            session_id = secrets.token_hex(16)
+            response_headers["Mcp-Session-Id"] = session_id
+        else:
+            session_id = headers.get("mcp-session-id", "")
+            if not session_id:
+                return 400, {}, _error_body(request_id, -32600, "Missing Mcp-Session-Id")
+            if session_id not in self.sessions:
+                return 404, {}, _error_body(request_id, -32600, "Unknown session")
+        self.sessions[session_id] = time.monotonic()
+
+        if members and not any("method" in item and "id" in item for item in members):
+            # Notifications and client responses are acknowledged without a body.
+            if any("method" in item for item in members):
+                await self.handle(message)
+            return 202, response_headers, b""
+
+        response = await self.handle(message)
+        if response is None:
+            return 202, response_headers, b""
+        return 200, response_headers, self.encode(response).encode()
+
+
+class _BadRequest(Exception):
+    def __init__(self, status: int, body: bytes = b""):
+        super().__init__(status)
+        self.status = status
+        self.body = body
+
+
+def _is_local_origin(origin: Optional[str]) -> bool:
+    if not origin:
+        return True  # non-browser clients do not send Origin
+    host = origin.split("://", 1)[-1].split("/", 1)[0]
+    # Strip the port, keeping bracketed IPv6 literals intact.
+    host = host.split("]", 1)[0] + "]" if host.startswith("[") else host.split(":", 1)[0]
+    return host.lower() in LOCAL_ORIGIN_HOSTS
+
+
+def _error_body(request_id: Any, code: int, message: str) -> bytes:
+    error = {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+    return json.dumps(error).encode()
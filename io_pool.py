@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+MCP I/O Pool - Bounded thread pool for describe's blocking file I/O
+Copyright 2024 James Dominguez
+Licensed under the Apache License, Version 2.0
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+# Kept apart from the loop's default executor, which also carries registry
+# HTTP requests and the stdin reader, so slow disks and slow networks do not
+# queue behind each other.
+DEFAULT_IO_WORKERS = 4
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def io_executor() -> ThreadPoolExecutor:
+    """The process-wide file I/O pool, sized by DESCRIBE_IO_WORKERS."""
+    global _executor
+    if _executor is None:
+        try:
+            workers = int(os.environ.get("DESCRIBE_IO_WORKERS") or DEFAULT_IO_WORKERS)
+        except ValueError:
+            workers = DEFAULT_IO_WORKERS
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="describe-io"
+        )
+    return _executor
+
+
+async def run_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking filesystem call on the I/O pool without stalling the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(io_executor(), functools.partial(func, *args, **kwargs))
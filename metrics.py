@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+MCP Metrics - Process-wide span timings and counters for describe
+Copyright 2024 James Dominguez
+Licensed under the Apache License, Version 2.0
+"""
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from io_pool import io_executor
+
+# Shared by describe and config_manager, which cannot import describe.
+logger = logging.getLogger("describe")
+
+
+class Metrics:
+    """Process-wide span timings and counters.
+
+    Spans wrap coarse phases (registry fetches, cache I/O, indexing, installs,
+    requests), so recording costs a couple of clock reads per phase. Set
+    DESCRIBE_METRICS=0 to turn collection off; span() then returns a shared
+    no-op context manager. DESCRIBE_TRACE=<path> also appends every span and
+    counter update to a JSONL file that `describe stats` can summarize.
+    """
+
+    _disabled_span = contextlib.nullcontext()
+
+    def __init__(self, enabled: bool = True, trace_path: Optional[str] = None):
+        self.enabled = enabled
+        self.trace_path = trace_path
+        self.started = time.time()
+        self.counters: dict[str, float] = {}
+        self.spans: dict[str, dict[str, float]] = {}
+        # Counters are also bumped from executor threads (network bytes in registry fetches).
+        self._lock = threading.Lock()
+        # Trace lines are appended on the I/O pool in batches, never on the caller's thread.
+        self._trace_pending: list[str] = []
+        self._trace_draining = False
+        self._trace_lock = threading.Lock()
+        self._trace_write_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "Metrics":
+        return cls(
+            enabled=os.environ.get("DESCRIBE_METRICS", "1") not in {"0", "false", "off"},
+            trace_path=os.environ.get("DESCRIBE_TRACE") or None,
+        )
+
+    def incr(self, name: str, value: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        if self.trace_path:
+            self._trace({"counter": name, "value": value})
+
+    def span(self, name: str, **attributes: Any) -> Any:
+        if not self.enabled:
+            return self._disabled_span
+        return _Span(self, name, attributes)
+
+    def record(self, name: str, elapsed_ms: float, attributes: dict[str, Any], error: bool) -> None:
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = {"count": 0, "errors": 0, "totalMs": 0.0, "maxMs": 0.0}
+            stats["count"] += 1
+            stats["errors"] += int(error)
+            stats["totalMs"] += elapsed_ms
+            stats["maxMs"] = max(stats["maxMs"], elapsed_ms)
+        if self.trace_path:
+            record = {"span": name, "ms": round(elapsed_ms, 3), **attributes}
+            if error:
+                record["error"] = True
+            self._trace(record)
+
+    def _trace(self, record: dict[str, Any]) -> None:
+        record = {"ts": round(time.time(), 3), "pid": os.getpid(), **record}
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._trace_lock:
+            self._trace_pending.append(line)
+            if self._trace_draining:
+                return
+            self._trace_draining = True
+        try:
+            io_executor().submit(self._drain_trace)
+        except RuntimeError:
+            self._drain_trace()  # the pool is gone at interpreter shutdown
+
+    def _drain_trace(self) -> None:
+        while True:
+            self.flush()
+            with self._trace_lock:
+                if not self._trace_pending:
+                    self._trace_draining = False
+                    return
+
+    def flush(self) -> None:
+        """Append queued trace records to the trace file now, in the order they were made."""
+        with self._trace_write_lock:
+            with self._trace_lock:
+                lines, self._trace_pending = self._trace_pending, []
+            if not lines:
+                return
+            try:
+                with open(self.trace_path, "a", encoding="utf-8") as trace:
+                    trace.write("".join(lines))
+            except OSError as exc:
+                logger.debug("Cannot write trace records to %s: %s", self.trace_path, exc)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+            spans = {name: dict(stats) for name, stats in self.spans.items()}
+        return {
+            "enabled": self.enabled,
+            "uptimeSeconds": round(time.time() - self.started, 3),
+            "trace": self.trace_path,
+            "counters": counters,
+            "spans": {
+                name: {
+                    "count": int(stats["count"]),
+                    "errors": int(stats["errors"]),
+                    "totalMs": round(stats["totalMs"], 3),
+                    "avgMs": round(stats["totalMs"] / stats["count"], 3),
+                    "maxMs": round(stats["maxMs"], 3),
+                }
+                for name, stats in sorted(spans.items())
+            },
+        }
+
+
+class _Span:
+    __slots__ = ("metrics", "name", "attributes", "started")
+
+    def __init__(self, metrics: Metrics, name: str, attributes: dict[str, Any]):
+        self.metrics = metrics
+        self.name = name
+        self.attributes = attributes
+        self.started = 0.0
+
+    def __enter__(self) -> "_Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, _exc: Any, _tb: Any) -> None:
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        self.metrics.record(self.name, elapsed_ms, self.attributes, exc_type is not None)
+
+
+METRICS = Metrics.from_env()
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+MCP Proxy - Serves every installed MCP server through one lazily started endpoint
+Copyright 2024 James Dominguez
+Licensed under the Apache License, Version 2.0
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from io_pool import run_io
+
+logger = logging.getLogger("describe.proxy")
+
+# Proxied tool names are "<server>__<tool>", so tools from different servers
+# cannot collide.
+TOOL_SEPARATOR = "__"
+DEFAULT_IDLE_SECONDS = 300
+DEFAULT_START_TIMEOUT = 60.0
+DEFAULT_CALL_TIMEOUT = 300.0
+DEFAULT_CACHE_ENTRIES = 512
+INVALIDATE_TOOL = "cache-invalidate"
+
+
+class DownstreamError(Exception):
+    """A downstream server could not be started or answered with an error."""
+
+
+def launch_key(config: dict[str, Any]) -> str:
+    """Identity of a launch config; a changed command or version invalidates cached tools."""
+    return json.dumps([config.get("command"), config.get("args", []), config.get("version")])
+
+
+def parse_cache_ttls(spec: str) -> tuple[float, dict[str, float]]:
+    """Parse `60,github=300,filesystem=0` into a default TTL and per-server TTLs."""
+    default = 0.0
+    per_server: dict[str, float] = {}
+    for item in spec.split(","):
+        server, separator, value = item.strip().rpartition("=")
+        if not value:
+            continue
+        try:
+            ttl = float(value)
+        except ValueError:
+            logger.warning("Ignoring invalid cache TTL: %s", item)
+            continue
+        if separator:
+            per_server[server.strip().lower()] = ttl
+        else:
+            default = ttl
+    return default, per_server
+
+
+class ResultCache:
+    """LRU cache of read-only tool results, keyed by server, tool, and canonical arguments."""
+
+    def __init__(
+        self,
+        default_ttl: float,
+        server_ttls: Optional[dict[str, float]] = None,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+    ):
+        from collections import OrderedDict
+
+        self.default_ttl = default_ttl
+        self.server_ttls = server_ttls or {}
+        self.max_entries = max_entries
+        self.entries: OrderedDict[tuple[str, str, str], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def ttl(self, server: str) -> float:
+        return self.server_ttls.get(server, self.default_ttl)
+
+    @staticmethod
+    def key(server: str, tool: str, arguments: dict[str, Any]) -> tuple[str, str, str]:
+        canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"))
+        return server, tool, canonical
+
+    def get(self, key: tuple[str, str, str]) -> Optional[dict[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: tuple[str, str, str], result: dict[str, Any]) -> None:
+        ttl = self.ttl(key[0])
+        if ttl <= 0:
+            return
+        self.entries[key] = (time.monotonic() + ttl, result)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, server: Optional[str] = None, tool: Optional[str] = None) -> int:
+        stale = [
+            key
+            for key in self.entries
+            if (server is None or key[0] == server) and (tool is None or key[1] == tool)
+        ]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+
+
+class DownstreamServer:
+    """One stdio MCP server, started on first use and stopped when idle."""
+
+    def __init__(
+        self,
+        name: str,
+        config: dict[str, Any],
+        client_info: dict[str, Any],
+        protocol_version: str,
+        on_tools_changed: Optional[Callable[[str], Any]] = None,
+    ):
+        self.name = name
+        self.config = config
+        self.client_info = client_info
+        self.protocol_version = protocol_version
+        self.on_tools_changed = on_tools_changed
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.pending: dict[int, asyncio.Future] = {}
+        self.next_id = 0
+        self.last_used = time.monotonic()
+        self._reader: Optional[asyncio.Task] = None
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def ensure_started(self, timeout: float = DEFAULT_START_TIMEOUT) -> None:
+        async with self._start_lock:
+            if self.running:
+                return
+            try:
+                await asyncio.wait_for(self._start(), timeout)
+            except asyncio.TimeoutError as exc:
+                await self.stop()
+                raise DownstreamError(f"{self.name} did not initialize in {timeout:g}s") from exc
+            except (OSError, DownstreamError) as exc:
+                await self.stop()
+                raise DownstreamError(f"{self.name} failed to start: {exc}") from exc
+
+    async def _start(self) -> None:
+        logger.info("Starting %s", self.name)
+        self.proc = await asyncio.create_subprocess_exec(
+            self.config["command"],
+            *self.config.get("args", []),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env={**os.environ, **self.config.get("env", {})},
+        )
+        self._reader = asyncio.create_task(self._read_loop(self.proc))
+        await self._send_request(
+            "initialize",
+            {
+                "protocolVersion": self.protocol_version,
+                "capabilities": {},
+                "clientInfo": self.client_info,
+            },
+        )
+        self._write({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    async def request(
+        self, method: str, params: dict[str, Any], timeout: float = DEFAULT_CALL_TIMEOUT
+    ) -> dict[str, Any]:
+        await self.ensure_started()
+        self.last_used = time.monotonic()
+        try:
+            return await asyncio.wait_for(self._send_request(method, params), timeout)
+        finally:
+            self.last_used = time.monotonic()
+
+    async def _send_request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        self.next_id += 1
+        request_id = self.next_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        try:
+            self._write({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+            return await future
+        finally:
+            self.pending.pop(request_id, None)
+
+    def _write(self, message: dict[str, Any]) -> None:
+        if not self.running or self.proc.stdin is None:
+            raise DownstreamError(f"{self.name} is not running")
+        self.proc.stdin.write((json.dumps(message) + "\n").encode())
+
+    async def _read_loop(self, proc: asyncio.subprocess.Process) -> None:
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue  # servers that log to stdout
+            if not isinstance(message, dict):
+                continue
+            if "method" in message and "id" in message:
+                # Server-to-client requests (sampling, roots) are not proxied.
+                with contextlib.suppress(DownstreamError):
+                    self._write(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": message["id"],
+                            "error": {"code": -32601, "message": "Not supported by describe proxy"},
+                        }
+                    )
+            elif message.get("method") == "notifications/tools/list_changed":
+                if self.on_tools_changed:
+                    self.on_tools_changed(self.name)
+            elif message.get("id") in self.pending:
+                future = self.pending[message["id"]]
+                if future.done():
+                    continue
+                if "error" in message:
+                    error = message["error"] or {}
+                    future.set_exception(DownstreamError(error.get("message", "error response")))
+                else:
+                    future.set_result(message.get("result") or {})
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(DownstreamError(f"{self.name} exited"))
+
+    async def stop(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is not None and proc.returncode is None:
+            logger.info("Stopping %s", self.name)
+            proc.terminate()
+            try:
+                await asyncio.wait_for(proc.wait(), 5)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+
+
+class AggregatingProxy:
+    """Advertise the union of installed servers' tools and start each server on first call.
+
+    Tool lists come from a snapshot cached on disk, so answering tools/list
+    never starts a server. Servers missing from the snapshot are started once
+    in the background to fill it in, then stopped when idle like any other.
+    """
+
+    def __init__(
+        self,
+        configs: dict[str, dict[str, Any]],
+        snapshot_path: Path,
+        send: Callable[[dict[str, Any]], Any],
+        server_info: dict[str, Any],
+        protocol_version: str,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        cache: Optional[ResultCache] = None,
+    ):
+        self.snapshot_path = snapshot_path
+        self.cache = cache
+        self.send = send
+        self.server_info = server_info
+        self.protocol_version = protocol_version
+        self.idle_seconds = idle_seconds
+        client_info = {"name": f"{server_info['name']}-proxy", "version": server_info["version"]}
+        self.servers = {
+            name: DownstreamServer(name, config, client_info, protocol_version, self._tools_changed)
+            for name, config in configs.items()
+            if config.get("command")
+        }
+        # Read from disk on the I/O pool by load_snapshot(), before the first request.
+        self.snapshot: dict[str, Any] = {}
+        self._snapshot_loaded = False
+        # Saves run on the I/O pool; a slower, older save must not replace a newer one.
+        self._saves = 0
+        self._saved = 0
+        self._save_lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load_snapshot(self) -> None:
+        if self._snapshot_loaded:
+            return
+
+        def read() -> Any:
+            try:
+                return json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return {}
+
+        snapshot = await run_io(read)
+        if self._snapshot_loaded:
+            return
+        self._snapshot_loaded = True
+        if not isinstance(snapshot, dict):
+            return
+        self.snapshot = {
+            name: entry
+            for name, entry in snapshot.items()
+            if name in self.servers and entry.get("key") == launch_key(self.servers[name].config)
+        }
+
+    async def _save_snapshot(self) -> None:
+        self._saves += 1
+        version, text = self._saves, json.dumps(self.snapshot, indent=2)
+
+        def write() -> None:
+            with self._save_lock:
+                if version < self._saved:
+                    return
+                self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+                self.snapshot_path.write_text(text, encoding="utf-8")
+                self._saved = version
+
+        try:
+            await run_io(write)
+        except OSError as exc:
+            logger.warning("Cannot save proxy tool snapshot: %s", exc)
+
+    def _spawn(self, coroutine: Any) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _tools_changed(self, name: str) -> None:
+        self.snapshot.pop(name, None)
+        if self.cache:
+            self.cache.invalidate(name)
+        self._spawn(self._refresh_tools(name))
+
+    async def _refresh_tools(self, name: str) -> None:
+        server = self.servers[name]
+        try:
+            result = await server.request("tools/list", {})
+        except (DownstreamError, asyncio.TimeoutError) as exc:
+            logger.warning("Cannot list tools for %s: %s", name, exc)
+            return
+        self.snapshot[name] = {"key": launch_key(server.config), "tools": result.get("tools", [])}
+        await self._save_snapshot()
+        self.send({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+
+    def list_tools(self) -> list[dict[str, Any]]:
+        tools = []
+        for name in sorted(self.snapshot):
+            for tool in self.snapshot[name]["tools"]:
+                description = tool.get("description") or ""
+                tools.append(
+                    {
+                        **tool,
+                        "name": f"{name}{TOOL_SEPARATOR}{tool['name']}",
+                        "description": f"[{name}] {description}".rstrip(),
+                    }
+                )
+        if self.cache:
+            tools.append(
+                {
+                    "name": INVALIDATE_TOOL,
+                    "title": "Invalidate Cached Results",
+                    "description": (
+                        "Drop cached read-only tool results, optionally only for one server "
+                        "or one of its tools, so the next call reaches the server."
+                    ),
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "server": {"type": "string", "description": "Server name."},
+                            "tool": {"type": "string", "description": "Tool name on that server."},
+                        },
+                    },
+                    "annotations": {"readOnlyHint": False, "idempotentHint": True},
+                }
+            )
+        return tools
+
+    def _is_read_only(self, server: str, tool: str) -> bool:
+        for definition in self.snapshot.get(server, {}).get("tools", []):
+            if definition.get("name") == tool:
+                return bool((definition.get("annotations") or {}).get("readOnlyHint"))
+        return False
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        await self.load_snapshot()
+        if name == INVALIDATE_TOOL and self.cache:
+            server = arguments.get("server")
+            count = self.cache.invalidate(server and server.lower(), arguments.get("tool"))
+            text = json.dumps(
+                {"invalidated": count, "hits": self.cache.hits, "misses": self.cache.misses}
+            )
+            return {"content": [{"type": "text", "text": text}]}
+
+        server_name, _, tool = name.partition(TOOL_SEPARATOR)
+        server = self.servers.get(server_name)
+        if server is None or not tool:
+            return _error_result(f"Unknown tool: {name}")
+
+        key = None
+        if self.cache and self.cache.ttl(server_name) > 0 and self._is_read_only(server_name, tool):
+            key = self.cache.key(server_name, tool, arguments)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        try:
+            result = await server.request("tools/call", {"name": tool, "arguments": arguments})
+        except (DownstreamError, asyncio.TimeoutError) as exc:
+            return _error_result(str(exc) or f"{server_name} timed out")
+        if key is not None and not result.get("isError"):
+            self.cache.put(key, result)
+        return result
+
+    async def handle_request(self, request: dict[str, Any]) -> Optional[dict[str, Any]]:
+        request_id = request.get("id")
+        method = request.get("method", "")
+        params = request.get("params") or {}
+        if "id" not in request:
+            return None
+        await self.load_snapshot()
+        if method == "initialize":
+            for name in self.servers:
+                if name not in self.snapshot:
+                    self._spawn(self._refresh_tools(name))
+            result: dict[str, Any] = {
+                "protocolVersion": self.protocol_version,
+                "capabilities": {"tools": {"listChanged": True}},
+                "serverInfo": self.server_info,
+            }
+        elif method == "ping":
+            result = {}
+        elif method == "tools/list":
+            result = {"tools": self.list_tools()}
+        elif method == "tools/call":
+            result = await self.call_tool(params.get("name", ""), params.get("arguments") or {})
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": -32601, "message": "Method not found"},
+            }
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    async def reap_idle(self) -> None:
+        """Stop servers that have not been used for idle_seconds; runs until cancelled."""
+        while True:
+            await asyncio.sleep(max(1.0, min(30.0, self.idle_seconds / 2)))
+            cutoff = time.monotonic() - self.idle_seconds
+            for server in self.servers.values():
+                if server.running and not server.pending and server.last_used < cutoff:
+                    await server.stop()
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*(server.stop() for server in self.servers.values()))
+
+
+def _error_result(message: str) -> dict[str, Any]:
+    return {"content": [{"type": "text", "text": message}], "isError": True}
+
+
+async def run_proxy(proxy: AggregatingProxy, lines: Any) -> None:
+    """Serve JSON-RPC lines; each request runs as its own task so slow calls do not block."""
+    await proxy.load_snapshot()
+    reaper = asyncio.create_task(proxy.reap_idle())
+
+    async def answer(request: dict[str, Any]) -> None:
+        response = await proxy.handle_request(request)
+        if response is not None:
+            proxy.send(response)
+
+    try:
+        async for line in lines:
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as exc:
+                proxy.send(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {"code": -32700, "message": f"Parse error: {exc}"},
+                    }
+                )
+                continue
+            if not isinstance(request, dict):
+                # Batches are not proxied: each member may go to a different server.
+                proxy.send(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {"code": -32600, "message": "Invalid Request"},
+                    }
+                )
+                continue
+            proxy._spawn(answer(request))
+        await asyncio.gather(*list(proxy._tasks), return_exceptions=True)
+    finally:
+        reaper.cancel()
+        await proxy.close()
@@ -6,6 +6,7 @@ Copyright 2024 James Dominguez
 Licensed under the Apache License, Version 2.0
 """
 
+import asyncio
 import json
 import os
 import subprocess
@@ -16,8 +17,11 @@ import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config_manager import MCPConfigManager
-from describe import MCPPackageManager, handle_request
+import config_manager
+import describe
+from config_manager import MCPConfigManager, MultiClientConfigManager
+from describe import MCPPackageManager, encode_response, handle_request
+from metrics import Metrics
 
 
 @pytest.fixture
@@ -39,7 +43,7 @@ async def test_initialize_advertises_modern_mcp_surface(monkeypatch, tmp_path):
     assert response["result"]["protocolVersion"] == "2025-11-25"
     assert response["result"]["capabilities"] == {
         "tools": {"listChanged": True},
-        "resources": {"listChanged": True},
+        "resources": {"subscribe": True, "listChanged": True},
         "prompts": {"listChanged": True},
     }
     assert response["result"]["serverInfo"]["version"] == "1.1.0"
@@ -65,6 +69,7 @@ async def test_list_tools(monkeypatch, tmp_path):
         "config-list",
         "config-backup",
         "config-restore",
+        "bench-servers",
         "registry-refresh",
     }
     assert all("inputSchema" in tool for tool in tools)
@@ -147,7 +152,7 @@ async def test_install_npm_package(manager):
     assert result["method"] == "npm"
     assert result["package"] == "@test/package"
     assert result["status"] == "installed"
-    mock_exec.assert_called_once_with(
+    mock_exec.assert_any_call(
         "npm",
         "install",
         "-g",
@@ -155,6 +160,9 @@ async def test_install_npm_package(manager):
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
+    mock_exec.assert_called_with(
+        "npm", "prefix", "-g", stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
 
 
 @pytest.mark.asyncio
@@ -380,5 +388,960 @@ async def test_config_list_includes_remote_type_and_url(tmp_path):
     ]
 
 
+@pytest.mark.asyncio
+async def test_config_add_fans_out_to_detected_clients(monkeypatch, tmp_path):
+    home = tmp_path / "home"
+    (home / ".cursor").mkdir(parents=True)
+    (home / ".config" / "Code" / "User").mkdir(parents=True)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("DESCRIBE_HOME", str(tmp_path / "describe"))
+    monkeypatch.setenv("DESCRIBE_REGISTRY", "builtin")
+    monkeypatch.delenv("DESCRIBE_MCP_CONFIG", raising=False)
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+
+    assert MultiClientConfigManager.discover_clients() == ["cursor", "vscode"]
+
+    package_manager = MCPPackageManager(home=tmp_path / "describe", registry_url="builtin")
+    package_manager.installed = {
+        "demo": {"method": "npm", "details": {"method": "npm", "package": "@test/demo"}}
+    }
+    await package_manager._save_installed()
+
+    response = await handle_request(
+        {
+            "jsonrpc": "2.0",
+            "id": 8,
+            "method": "tools/call",
+            "params": {"name": "config-add", "arguments": {"name": "demo"}},
+        }
+    )
+
+    result = response["result"]["structuredContent"]
+    assert result["status"] == "added"
+    assert set(result["clients"]) == {"cursor", "vscode"}
+    cursor = json.loads((home / ".cursor" / "mcp.json").read_text(encoding="utf-8"))
+    assert cursor["mcpServers"]["demo"] == {"command": "npx", "args": ["-y", "@test/demo"]}
+    vscode_path = home / ".config" / "Code" / "User" / "mcp.json"
+    vscode = json.loads(vscode_path.read_text(encoding="utf-8"))
+    assert vscode["servers"]["demo"]["type"] == "stdio"
+
+    again = await MultiClientConfigManager(home=tmp_path, clients=["cursor"]).add_server(
+        "demo", {"command": "npx"}
+    )
+    assert "already exists" in again["error"]
+    assert list(again["clients"]) == ["cursor"]
+
+
+@pytest.mark.asyncio
+async def test_config_save_is_atomic_and_lists_client_shape(tmp_path):
+    config_path = tmp_path / "mcp_config.json"
+    config_mgr = MCPConfigManager(home=tmp_path, config_path=config_path, client="windsurf")
+
+    result = await config_mgr.add_server(
+        "remote-demo", {"type": "sse", "url": "https://x.test/sse"}
+    )
+
+    assert result["config"] == {"serverUrl": "https://x.test/sse"}
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".tmp"] == []
+    servers = await config_mgr.list_configured()
+    assert servers[0]["url"] == "https://x.test/sse"
+
+
+def test_import_defers_heavy_modules(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = (
+        "import sys, describe\n"
+        "deferred = ['argparse', 'urllib.request', 'config_manager', 'shutil']\n"
+        "print([name for name in deferred if name in sys.modules])\n"
+        "print(len(describe.FALLBACK_REGISTRY))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=root,
+        env={**os.environ, "DESCRIBE_HOME": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    loaded, fallback_count = result.stdout.splitlines()
+    assert loaded == "[]"
+    assert int(fallback_count) > 0
+
+
+@pytest.mark.asyncio
+async def test_list_responses_are_cached_and_preserialized():
+    first = await handle_request({"jsonrpc": "2.0", "id": 9, "method": "tools/list"})
+    second = await handle_request({"jsonrpc": "2.0", "id": "b", "method": "tools/list"})
+
+    assert first["result"] is second["result"]
+    with pytest.raises(TypeError):
+        first["result"]["tools"][0]["name"] = "changed"
+    assert json.loads(encode_response(second)) == json.loads(json.dumps(second))
+    assert encode_response(second) == json.dumps(second)
+
+
+def test_tool_call_result_encodes_once_and_caps_text(monkeypatch):
+    payload = {"servers": [{"name": "a"}, {"name": "b"}], "count": 2}
+    response = {"jsonrpc": "2.0", "id": 1, "result": describe.tool_call_result(payload)}
+
+    assert json.loads(encode_response(response)) == json.loads(json.dumps(response))
+    assert (
+        response["result"]["content"][0]["text"]
+        == '{"servers":[{"name":"a"},{"name":"b"}],"count":2}'
+    )
+
+    monkeypatch.setattr(describe, "TEXT_CONTENT_LIMIT", 10)
+    capped = describe.tool_call_result({"error": "x" * 20})
+    assert capped["isError"] is True
+    assert json.loads(capped.text)["isError"] is True
+    summary = json.loads(describe.tool_call_result(payload)["content"][0]["text"])
+    assert summary == {"servers": "[2 items in structuredContent]", "count": 2}
+
+
+@pytest.mark.asyncio
+async def test_list_and_search_paginate_with_cursors(manager):
+    manager._index_registry(
+        [{"name": f"io.test/tool-{index:02d}", "description": "paged"} for index in range(25)],
+        "test",
+    )
+
+    names, cursor = [], None
+    while True:
+        result = await describe.call_tool("list", {"cursor": cursor, "limit": 10}, manager)
+        names.extend(server["name"] for server in result["servers"])
+        cursor = result.get("nextCursor")
+        if not cursor:
+            break
+    assert names == [f"tool-{index:02d}" for index in range(25)]
+    assert result["total"] == 25
+
+    first = await manager.search_page("paged", limit=20)
+    second = await manager.search_page("paged", cursor=first["nextCursor"], limit=20)
+    assert len(first["servers"]) == 20
+    assert [server["name"] for server in second["servers"]] == [
+        f"tool-{index:02d}" for index in range(20, 25)
+    ]
+    assert "nextCursor" not in second
+
+    bad = await describe.call_tool("search", {"query": "paged", "cursor": "nope"}, manager)
+    assert "Invalid cursor" in bad["error"]
+
+
+@pytest.mark.asyncio
+async def test_registry_resource_reads_one_page(manager):
+    page = await describe.read_resource("describe://registry/available?limit=5", manager)
+    body = json.loads(page["contents"][0]["text"])
+
+    assert body["count"] == 5
+    assert body["total"] == len(describe.FALLBACK_REGISTRY)
+    rest = await describe.read_resource(body["nextUri"], manager)
+    rest_body = json.loads(rest["contents"][0]["text"])
+    assert rest_body["servers"][0]["name"] > body["servers"][-1]["name"]
+
+
+@pytest.mark.asyncio
+async def test_field_projection_presets_and_lists(manager):
+    minimal = await manager.list_available(fields="minimal")
+    assert set(minimal[0]) == {"name", "title"}
+
+    full = await manager.search("github", fields="full")
+    assert {"packages", "aliases", "installed"} <= set(full[0])
+
+    custom = await describe.call_tool(
+        "search", {"query": "github", "fields": ["description"]}, manager
+    )
+    assert set(custom["servers"][0]) == {"name", "description"}
+
+    bad = await describe.call_tool("list", {"fields": "bogus"}, manager)
+    assert "Unknown field" in bad["error"]
+
+    manager.installed = {
+        "demo": {
+            "method": "npm",
+            "details": {"package": "@x/demo", "server": {"name": "io.x/demo"}},
+        }
+    }
+    await manager._save_installed()
+    installed = await manager.list_installed("standard")
+    assert installed[0]["registryName"] == "io.x/demo"
+    assert "server" not in installed[0]["details"]
+    assert (await manager.list_installed())[0]["details"]["server"] == {"name": "io.x/demo"}
+
+
+@pytest.mark.asyncio
+async def test_metrics_spans_counters_and_trace_summary(monkeypatch, tmp_path, manager):
+    trace = tmp_path / "trace.jsonl"
+    metrics = Metrics(trace_path=str(trace))
+    monkeypatch.setattr(describe, "METRICS", metrics)
+    monkeypatch.setattr(config_manager, "METRICS", metrics)
+    config_path = tmp_path / "mcp.json"
+    config_path.write_text(json.dumps({"mcpServers": {"git": {"command": "git"}}}))
+    monkeypatch.setenv("DESCRIBE_MCP_CONFIG", str(config_path))
+
+    await manager.list_available()
+    await describe.call_tool("install", {"name": "filesystem", "method": "remote"}, manager)
+    await describe.call_tool("config-remove", {"name": "git"}, manager)
+    resource = await describe.read_resource("describe://metrics", manager)
+    snapshot = json.loads(resource["contents"][0]["text"])
+
+    assert snapshot["spans"]["registry.index"]["count"] == 1
+    assert snapshot["spans"]["installed.load"]["count"] >= 1
+    assert {"config.load", "config.backup", "config.save"} <= set(snapshot["spans"])
+    metrics.flush()
+    summary = describe.summarize_trace(trace)
+    assert summary["spans"]["registry.index"]["p95Ms"] >= 0
+    assert set(summary["counters"]) == set(snapshot["counters"])
+
+    # Registry fetches bump network counters from executor threads.
+    threaded = Metrics()
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # make lost read-modify-write updates likely
+    try:
+        await asyncio.gather(
+            *(
+                asyncio.get_running_loop().run_in_executor(
+                    None, lambda: [threaded.incr("network.bytes") for _ in range(20000)]
+                )
+                for _ in range(4)
+            )
+        )
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert threaded.snapshot()["counters"]["network.bytes"] == 80000
+
+    disabled = Metrics(enabled=False)
+    with disabled.span("noop"):
+        disabled.incr("noop")
+    assert disabled.snapshot()["spans"] == {} and disabled.counters == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_requests_are_profiled_and_pruned(monkeypatch, tmp_path):
+    monkeypatch.setenv("DESCRIBE_HOME", str(tmp_path))
+    monkeypatch.setenv("DESCRIBE_REGISTRY", "builtin")
+    profiles = tmp_path / "profiles"
+    monkeypatch.setattr(
+        describe, "PROFILER", describe.Profiler(threshold_ms=0, keep=2, directory=profiles)
+    )
+
+    for request_id in range(3):
+        await handle_request({"jsonrpc": "2.0", "id": request_id, "method": "ping"})
+    with describe.PROFILER.profile("outer"), describe.PROFILER.profile("nested"):
+        pass
+
+    saved = sorted(path.name for path in profiles.glob("*.prof"))
+    assert len(saved) == 2
+    assert describe.PROFILER.last_path.name.endswith("-outer.prof")
+
+    monkeypatch.setenv("DESCRIBE_PROFILE", "off")
+    assert not describe.Profiler.from_env().enabled
+    monkeypatch.setenv("DESCRIBE_PROFILE", "1500")
+    assert describe.Profiler.from_env().threshold_ms == 1500
+
+
+@pytest.mark.asyncio
+async def test_resource_subscriptions_notify_only_on_content_change(monkeypatch, manager):
+    watcher = describe.ResourceWatcher(interval=0.01)
+    monkeypatch.setattr(describe, "WATCHER", watcher)
+    monkeypatch.setenv("DESCRIBE_HOME", str(manager.home))
+    monkeypatch.setenv("DESCRIBE_REGISTRY", "builtin")
+    uri = "describe://servers/installed"
+
+    response = await handle_request(
+        {"jsonrpc": "2.0", "id": 1, "method": "resources/subscribe", "params": {"uri": uri}}
+    )
+    assert response["result"] == {}
+    assert await watcher.poll() == []
+
+    manager.installed_db.write_text("{}", encoding="utf-8")
+    os.utime(manager.installed_db, ns=(0, 0))
+    assert await watcher.poll() == []
+
+    sent = []
+    task = asyncio.create_task(watcher.run(sent.append))
+    manager.installed = {"demo": {"method": "remote", "details": {}}}
+    await manager._save_installed()
+    await asyncio.sleep(0.05)
+    task.cancel()
+    assert sent == [
+        {"jsonrpc": "2.0", "method": "notifications/resources/updated", "params": {"uri": uri}}
+    ]
+
+    bad = await handle_request(
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "resources/subscribe",
+            "params": {"uri": "describe://metrics"},
+        }
+    )
+    assert bad["error"]["code"] == -32602
+
+
+@pytest.mark.asyncio
+async def test_per_server_resource_templates(manager):
+    templates = await handle_request(
+        {"jsonrpc": "2.0", "id": 1, "method": "resources/templates/list"}
+    )
+    uri_templates = {item["uriTemplate"] for item in templates["result"]["resourceTemplates"]}
+    assert "describe://registry/server/{name}" in uri_templates
+
+    first = await describe.read_resource("describe://registry/server/github", manager)
+    content = first["contents"][0]
+    body = json.loads(content["text"])
+    assert body["server"]["shortName"] == "github"
+    assert body["etag"] == content["_meta"]["describe/etag"]
+    registry_name = body["server"]["name"]
+    by_name = await describe.read_resource(f"describe://registry/server/{registry_name}", manager)
+    assert by_name["contents"][0]["text"] is content["text"]
+
+    missing = await describe.read_resource("describe://registry/server/nope", manager)
+    assert "not found" in missing["error"]
+
+    manager.installed = {"filesystem": {"method": "remote", "details": {}}}
+    await manager._save_installed()
+    installed = await describe.read_resource("describe://servers/installed/filesystem", manager)
+    assert json.loads(installed["contents"][0]["text"])["server"]["method"] == "remote"
+
+
+@pytest.mark.asyncio
+async def test_registry_snapshot_export_and_import(tmp_path, manager):
+    bundle = tmp_path / "registry.json.gz"
+    exported = await manager.export_registry(bundle)
+    assert exported["status"] == "exported"
+    assert bundle.read_bytes()[:2] == b"\x1f\x8b"
+
+    host = MCPPackageManager(home=tmp_path / "host", registry_url="builtin")
+    with patch.object(host, "_normalize_server", side_effect=AssertionError("re-indexed")):
+        imported = await host.import_registry(bundle)
+    assert imported["count"] == len(manager.registry)
+    assert host.registry["git"]["source"] == "snapshot"
+    assert host.listing == manager.listing
+
+    # Later starts on the host adopt the saved index as well.
+    restarted = MCPPackageManager(home=tmp_path / "host", registry_url="builtin")
+    with patch.object(restarted, "_normalize_server", side_effect=AssertionError("re-indexed")):
+        await restarted._fetch_registry()
+    assert restarted.registry_source == "cache"
+    assert restarted.listing == manager.listing
+
+    # A damaged index is rebuilt from the servers instead of failing.
+    cache = json.loads(restarted.registry_cache.read_text(encoding="utf-8"))
+    del cache["index"]["registry"]["git"]["shortName"]
+    restarted.registry_cache.write_text(json.dumps(cache), encoding="utf-8")
+    rebuilt = MCPPackageManager(home=tmp_path / "host", registry_url="builtin")
+    await rebuilt._fetch_registry()
+    assert rebuilt.listing == manager.listing
+
+    # Several sources, all unreachable and past the TTL: the snapshot still fills in.
+    sources = "https://a.example.test/v0.1/servers,https://b.example.test/v0.1/servers"
+    multi = MCPPackageManager(home=tmp_path / "multi", registry_url=sources, cache_ttl_seconds=-1)
+    await multi.import_registry(bundle)
+    with patch.object(multi, "_fetch_remote_registry", side_effect=OSError("offline")):
+        await multi._fetch_registry(force=True)
+    assert multi.registry_source == "merged"
+    assert set(multi.registry) == set(manager.registry)
+
+    offline = MCPPackageManager(
+        home=tmp_path / "host", registry_url="builtin", cache_ttl_seconds=-1
+    )
+    await offline._fetch_registry()
+    assert offline.registry_source == "stale-cache"
+    assert set(offline.registry) == set(manager.registry)
+
+    (tmp_path / "bogus.json").write_text('{"format": "other"}', encoding="utf-8")
+    assert (
+        "not a describe registry snapshot"
+        in (await host.import_registry(tmp_path / "bogus.json"))["error"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_multiple_registry_sources_merge_by_priority(tmp_path):
+    internal = "https://internal.example.test/v0.1/servers#ttl=60"
+    public = "https://registry.example.test/v0.1/servers"
+    dead = "https://dead.example.test/v0.1/servers#timeout=0.05"
+    package_manager = MCPPackageManager(home=tmp_path, registry_url=f"{internal},{public},{dead}")
+    assert package_manager.cache_ttl_seconds == 60
+
+    async def fetch(url, _timeout):
+        if url.startswith("https://dead"):
+            await asyncio.sleep(10)
+        owner = "internal" if url.startswith("https://internal") else "public"
+        return [
+            {"name": "io.example/shared", "description": f"{owner} build"},
+            {"name": f"io.example/{owner}-only", "description": owner},
+        ]
+
+    with patch.object(package_manager, "_fetch_remote_registry", side_effect=fetch):
+        await package_manager._fetch_registry()
+
+    assert package_manager.registry_source == "merged"
+    assert package_manager.registry["shared"]["description"] == "internal build"
+    assert {"internal-only", "public-only"} <= set(package_manager.registry)
+    assert len(list(tmp_path.glob("cache/registry-*.json"))) == 2
+    assert await package_manager.breaker.retry_in("https://dead.example.test/v0.1/servers") > 0
+
+    cached = MCPPackageManager(home=tmp_path, registry_url=f"{internal},{public},{dead}")
+    await cached._fetch_registry()
+    assert cached.registry_source == "cache"
+
+
+@pytest.mark.asyncio
+async def test_slow_paginated_source_is_bounded_per_page_not_per_listing(tmp_path):
+    slow = "https://slow.example.test/v0.1/servers#timeout=0.1"
+    package_manager = MCPPackageManager(
+        home=tmp_path, registry_url=f"{slow},builtin", registry_limit=300
+    )
+    assert package_manager.registry_sources[0]["total"] == pytest.approx(0.3)
+
+    async def page(params, _url, _timeout):
+        await asyncio.sleep(0.06)  # each page is well inside its timeout
+        number = int(params.get("cursor") or 0)
+        servers = [{"name": f"io.example/slow-{number}-{index}"} for index in range(100)]
+        more = {"nextCursor": str(number + 1)} if number < 2 else {}
+        return {"servers": servers, "metadata": more}
+
+    with patch.object(package_manager, "_fetch_registry_page", side_effect=page):
+        await package_manager._fetch_registry()
+
+    assert "slow-2-99" in package_manager.registry
+    assert await package_manager.breaker.retry_in(slow.partition("#")[0]) == 0
+
+    bounded = MCPPackageManager(home=tmp_path / "b", registry_url=f"{slow}&total=0.1,builtin")
+    assert bounded.registry_sources[0]["total"] == 0.1
+
+
+@pytest.mark.asyncio
+async def test_index_keeps_latest_version_and_installs_pinned_versions(manager):
+    def release(version, latest):
+        return {
+            "server": {
+                "name": "io.example/weather",
+                "description": "Weather lookups",
+                "version": version,
+                "packages": [
+                    {"registryType": "npm", "identifier": "@example/weather", "version": version}
+                ],
+            },
+            "_meta": {"io.modelcontextprotocol.registry/official": {"isLatest": latest}},
+        }
+
+    manager._index_registry(
+        [release("1.0.0", False), release("2.0.0", True), release("1.5.0", False)],
+        "official-registry",
+    )
+
+    assert list(manager.registry) == ["weather"]
+    assert manager.registry["weather"]["version"] == "2.0.0"
+    assert set(manager.versions["io.example/weather"]) == {"1.0.0", "1.5.0", "2.0.0"}
+    assert [server["name"] for server in await manager.search("weather")] == ["weather"]
+
+    missing = await manager.install("weather@9.9.9")
+    assert "known: 1.0.0, 1.5.0, 2.0.0" in missing["error"]
+
+    with patch.object(manager, "_install_npm", new_callable=AsyncMock) as mock_install:
+        mock_install.return_value = {"method": "npm", "status": "installed"}
+        await manager.install("weather@1.5.0")
+
+    mock_install.assert_awaited_once_with("@example/weather@1.5.0")
+    assert manager.installed["weather"]["details"]["server"]["version"] == "1.5.0"
+
+
+@pytest.mark.asyncio
+async def test_installed_npm_binary_is_launched_directly(tmp_path, manager):
+    prefix = tmp_path / "npm-global"
+    package_dir = prefix / "lib" / "node_modules" / "@example" / "weather"
+    package_dir.mkdir(parents=True)
+    (package_dir / "package.json").write_text(
+        json.dumps({"version": "2.1.0", "bin": {"weather": "dist/index.js"}}), encoding="utf-8"
+    )
+    (prefix / "bin").mkdir()
+    (prefix / "bin" / "weather").write_text("#!/usr/bin/env node\n", encoding="utf-8")
+
+    with patch.object(manager, "_command_output", new_callable=AsyncMock) as mock_output:
+        mock_output.return_value = str(prefix)
+        resolved = await manager._resolve_entry_point(
+            {"method": "npm", "package": "@example/weather"}
+        )
+
+    assert resolved == {
+        "installedVersion": "2.1.0",
+        "entryPoint": {"command": str(prefix / "bin" / "weather")},
+    }
+    config_mgr = MCPConfigManager(home=tmp_path)
+    details = {"method": "npm", "package": "@example/weather", **resolved}
+    assert config_mgr.generate_server_config(details)["command"] == str(prefix / "bin" / "weather")
+
+    (prefix / "bin" / "weather").unlink()
+    assert config_mgr.generate_server_config(details)["args"] == ["-y", "@example/weather@2.1.0"]
+    pypi = {"method": "pypi", "package": "mcp-weather==1.0", "installedVersion": "1.0"}
+    assert config_mgr.generate_server_config(pypi)["args"] == ["mcp-weather@1.0"]
+
+
+FAKE_MCP_SERVER = """
+import json, sys
+for line in sys.stdin:
+    message = json.loads(line)
+    if "id" not in message:
+        continue
+    tools = [{"name": "a"}, {"name": "b"}]
+    result = {"tools": tools} if message["method"] == "tools/list" else {}
+    print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}), flush=True)
+"""
+
+
+@pytest.mark.asyncio
+async def test_bench_servers_measures_and_caches_cold_start(monkeypatch, tmp_path, manager):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("DESCRIBE_MCP_CONFIG", str(tmp_path / "mcp.json"))
+    script = tmp_path / "fake_server.py"
+    script.write_text(FAKE_MCP_SERVER, encoding="utf-8")
+    manager.installed = {
+        "fake": {
+            "method": "npm",
+            "details": {
+                "method": "npm",
+                "package": "fake",
+                "installedVersion": "1.0.0",
+                "entryPoint": {"command": sys.executable, "args": [str(script)]},
+            },
+        }
+    }
+    await manager._save_installed()
+
+    first = await manager.bench_servers(timeout=30)
+    result = first["servers"][0]
+    assert result["status"] == "ok"
+    assert result["tools"] == 2
+    assert result["readyMs"] >= result["initializeMs"] > 0
+
+    again = await describe.call_tool("bench-servers", {"names": ["fake"]}, manager)
+    assert again["servers"][0]["cached"] is True
+    installed = await manager.list_installed("standard")
+    assert installed[0]["coldStart"]["tools"] == 2
+    assert "slow" in installed[0]["coldStart"]
+
+
+WRAPPED_MCP_SERVER = """
+import signal, subprocess, sys
+child = [sys.executable, "-c", "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(60)"]
+with open(sys.argv[1], "w") as pid_file:
+    pid_file.write(str(subprocess.Popen(child).pid))
+exec(open(sys.argv[2]).read())
+"""
+
+
+def _running(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return False
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+async def test_probe_server_stops_the_whole_process_tree(tmp_path):
+    server = tmp_path / "fake_server.py"
+    server.write_text(FAKE_MCP_SERVER, encoding="utf-8")
+    wrapper = tmp_path / "wrapper.py"
+    wrapper.write_text(WRAPPED_MCP_SERVER, encoding="utf-8")
+    pid_file = tmp_path / "child.pid"
+    config = {"command": sys.executable, "args": [str(wrapper), str(pid_file), str(server)]}
+
+    result = await describe.probe_server(config, timeout=30)
+
+    assert result["status"] == "ok"
+    assert result["tools"] == 2
+    child = int(pid_file.read_text())
+    assert result["rssKb"] > 0
+    for _ in range(50):
+        if not _running(child):
+            break
+        await asyncio.sleep(0.02)
+    assert not _running(child)
+
+
+@pytest.mark.asyncio
+async def test_proxy_serves_cached_tools_and_starts_servers_lazily(tmp_path):
+    from proxy import AggregatingProxy, run_proxy
+
+    script = tmp_path / "fake_server.py"
+    script.write_text(FAKE_MCP_SERVER, encoding="utf-8")
+    configs = {"fake": {"command": sys.executable, "args": [str(script)], "version": "1"}}
+    snapshot = tmp_path / "proxy-tools.json"
+    sent = []
+
+    def make_proxy():
+        return AggregatingProxy(
+            configs,
+            snapshot,
+            send=sent.append,
+            server_info={"name": "describe", "version": describe.VERSION},
+            protocol_version=describe.MCP_PROTOCOL_VERSION,
+        )
+
+    first = make_proxy()
+    await first.handle_request({"jsonrpc": "2.0", "id": 1, "method": "initialize"})
+    await asyncio.gather(*first._tasks)
+    assert sent[-1]["method"] == "notifications/tools/list_changed"
+    await first.close()
+
+    proxy = make_proxy()
+    listed = await proxy.handle_request({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+    assert [tool["name"] for tool in listed["result"]["tools"]] == ["fake__a", "fake__b"]
+    assert not proxy.servers["fake"].running
+
+    called = await proxy.handle_request(
+        {"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": {"name": "fake__a"}}
+    )
+    assert called["result"] == {}
+    assert proxy.servers["fake"].running
+    unknown = await proxy.call_tool("other__a", {})
+    assert unknown["isError"] is True
+    await proxy.close()
+    assert not proxy.servers["fake"].running
+
+    async def lines():
+        for line in ('[{"jsonrpc": "2.0", "id": 4, "method": "ping"}]', "7", '"ping"'):
+            yield line
+        yield json.dumps({"jsonrpc": "2.0", "id": 5, "method": "ping"})
+
+    sent.clear()
+    await run_proxy(make_proxy(), lines())
+    invalid = {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": "Invalid Request"},
+    }
+    assert sent == [invalid] * 3 + [{"jsonrpc": "2.0", "id": 5, "result": {}}]
+
+
+@pytest.mark.asyncio
+async def test_proxy_caches_read_only_tool_results(tmp_path):
+    from proxy import AggregatingProxy, ResultCache, launch_key, parse_cache_ttls
+
+    assert parse_cache_ttls("60,github=300,filesystem=0") == (
+        60.0,
+        {"github": 300.0, "filesystem": 0.0},
+    )
+    configs = {"fake": {"command": sys.executable, "args": [], "version": "1"}}
+    snapshot = tmp_path / "proxy-tools.json"
+    tools = [{"name": "read", "annotations": {"readOnlyHint": True}}, {"name": "write"}]
+    snapshot.write_text(
+        json.dumps({"fake": {"key": launch_key(configs["fake"]), "tools": tools}}),
+        encoding="utf-8",
+    )
+    proxy = AggregatingProxy(
+        configs,
+        snapshot,
+        send=lambda _message: None,
+        server_info={"name": "describe", "version": describe.VERSION},
+        protocol_version=describe.MCP_PROTOCOL_VERSION,
+        cache=ResultCache(60, max_entries=2),
+    )
+    downstream = AsyncMock(return_value={"content": [{"type": "text", "text": "ok"}]})
+    proxy.servers["fake"].request = downstream
+
+    await proxy.call_tool("fake__read", {"path": "a", "limit": 1})
+    await proxy.call_tool("fake__read", {"limit": 1, "path": "a"})
+    await proxy.call_tool("fake__write", {"path": "a"})
+    await proxy.call_tool("fake__write", {"path": "a"})
+    assert downstream.await_count == 3
+
+    invalidated = await proxy.call_tool("cache-invalidate", {"server": "fake"})
+    assert json.loads(invalidated["content"][0]["text"])["invalidated"] == 1
+    await proxy.call_tool("fake__read", {"path": "a", "limit": 1})
+    assert downstream.await_count == 4
+
+    for path in ("b", "c", "d"):
+        await proxy.call_tool("fake__read", {"path": path})
+    assert len(proxy.cache.entries) == 2
+    assert "cache-invalidate" in {tool["name"] for tool in proxy.list_tools()}
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_registry_load_and_keeps_write_order(manager):
+    assert encode_response([]) == "[]"
+    assert (await describe.handle_batch([]))["error"]["code"] == -32600
+
+    load = AsyncMock(wraps=manager._load_registry)
+    search = {"name": "search", "arguments": {"query": "git"}}
+    batch = [
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": search},
+        {"jsonrpc": "2.0", "id": 3, "method": "resources/read"},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        7,
+        {"jsonrpc": "2.0", "id": 4, "method": "tools/call", "params": {"name": "installed"}},
+    ]
+    batch[2]["params"] = {"uri": "describe://registry/available"}
+    with patch.object(manager, "_load_registry", load):
+        responses = await describe.handle_batch(batch, manager)
+
+    assert load.await_count == 1
+    assert [response.get("id") for response in responses] == [1, 2, 3, None, 4]
+    assert responses[1]["result"]["structuredContent"]["servers"]
+    assert responses[3]["error"]["code"] == -32600
+    assert json.loads(encode_response(responses))[0]["result"]["tools"]
+    notifications = [{"jsonrpc": "2.0", "method": "notifications/initialized"}]
+    assert await describe.handle_batch(notifications, manager) is None
+
+
+@pytest.mark.asyncio
+async def test_cli_batch_streams_ndjson_from_one_manager(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv("DESCRIBE_HOME", str(tmp_path))
+    monkeypatch.setenv("DESCRIBE_REGISTRY", "builtin")
+    script = tmp_path / "provision.txt"
+    rpc = {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": {"name": "list"}}
+    script.write_text(
+        "# provision\nsearch git\n\ndescribe installed\nproxy\n" + json.dumps(rpc) + "\n",
+        encoding="utf-8",
+    )
+    load = AsyncMock(wraps=MCPPackageManager._load_registry)
+
+    with patch.object(MCPPackageManager, "_load_registry", autospec=True, side_effect=load):
+        status = await describe.cli_main(["batch", str(script)])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert status == 1
+    assert load.await_count == 1
+    assert [record.get("line") for record in records] == [2, 4, 5, None]
+    assert records[0]["result"][0]["name"] == "git"
+    assert records[1]["result"] == []
+    assert "cannot run in a batch" in records[2]["result"]["error"]
+    assert records[3]["id"] == 7 and records[3]["result"]["structuredContent"]["servers"]
+
+
+@pytest.mark.asyncio
+async def test_registry_breaker_skips_network_after_failure(tmp_path):
+    from email.message import Message
+    from urllib.error import HTTPError
+
+    url = "https://registry.example.test/v0.1/servers"
+    headers = Message()
+    headers["Retry-After"] = "120"
+    unavailable = HTTPError(url, 503, "Service Unavailable", headers, None)
+
+    with patch("urllib.request.urlopen", side_effect=unavailable) as urlopen:
+        first = MCPPackageManager(home=tmp_path, registry_url=url)
+        await first._fetch_registry()
+        assert urlopen.call_count == 1
+        assert first.registry_source == "built-in"
+        assert 110 < await first.breaker.retry_in(url) <= 120
+
+        # A fresh manager (one per stdio request) reads the persisted circuit.
+        second = MCPPackageManager(home=tmp_path, registry_url=url)
+        await second._fetch_registry()
+        await second.search("nothing-local-matches")
+        assert urlopen.call_count == 1
+        assert second.registry_source == "built-in"
+
+    breaker = second.breaker
+    windows = [
+        await breaker.record_failure("https://other.test", OSError("down")) for _ in range(3)
+    ]
+    assert 15 <= windows[0] <= 30 and 30 <= windows[1] <= 60 and 60 <= windows[2] <= 120
+    await breaker.record_success(url)
+    assert await breaker.retry_in(url) == 0
+
+
+@pytest.mark.asyncio
+async def test_initialize_warms_shared_manager_in_background(manager):
+    original = manager._load_registry
+    release = asyncio.Event()
+    calls = []
+
+    async def slow_load(force):
+        calls.append(force)
+        await release.wait()
+        await original(force)
+
+    search = {"name": "search", "arguments": {"query": "git"}}
+    with patch.object(manager, "_load_registry", side_effect=slow_load):
+        response = await handle_request(
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize"}, manager
+        )
+        assert response["result"]["serverInfo"]["name"] == "describe"
+        await asyncio.sleep(0.01)
+        assert calls == [False] and not manager.registry
+
+        call = asyncio.ensure_future(
+            handle_request(
+                {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": search}, manager
+            )
+        )
+        await asyncio.sleep(0.01)
+        assert not call.done()
+        release.set()
+        result = await call
+        await manager.warm_up()
+
+    assert calls == [False]
+    assert result["result"]["structuredContent"]["servers"]
+    detected = manager.config_clients
+    assert detected
+
+    # A long-lived server picks up clients installed after it started.
+    discover = "config_manager.MultiClientConfigManager.discover_clients"
+    with patch(discover, return_value=["cursor"]):
+        assert await manager.detect_clients() == detected
+        manager._clients_detected_at -= describe.CLIENT_DETECTION_TTL_SECONDS + 1
+        assert await manager.detect_clients() == ["cursor"]
+
+
+@pytest.mark.asyncio
+async def test_slow_file_io_does_not_block_concurrent_requests(monkeypatch, tmp_path, manager):
+    import pathlib
+    import threading
+
+    config_path = tmp_path / "claude_desktop_config.json"
+    config_path.write_text(json.dumps({"mcpServers": {"git": {"command": "git"}}}))
+    monkeypatch.setenv("DESCRIBE_MCP_CONFIG", str(config_path))
+    await manager._fetch_registry()
+
+    read_text = pathlib.Path.read_text
+    read_config = MCPConfigManager._read_config
+    # A stalled network home directory: both reads block until the test releases them.
+    release = threading.Event()
+    entered = {"installed": threading.Event(), "config": threading.Event()}
+
+    def slow_read_text(path, *args, **kwargs):
+        if path.name == "installed.json":
+            entered["installed"].set()
+            release.wait(5)
+        return read_text(path, *args, **kwargs)
+
+    def slow_read_config(config_manager):
+        entered["config"].set()
+        release.wait(5)
+        return read_config(config_manager)
+
+    async def call(tool, **arguments):
+        params = {"name": tool, "arguments": arguments}
+        request = {"jsonrpc": "2.0", "id": tool, "method": "tools/call", "params": params}
+        response = await handle_request(request, manager)
+        finished.append(tool)
+        return response
+
+    async def both_entered():
+        while not all(event.is_set() for event in entered.values()):
+            await asyncio.sleep(0.005)
+
+    finished = []
+    monkeypatch.setattr(pathlib.Path, "read_text", slow_read_text)
+    monkeypatch.setattr(MCPConfigManager, "_read_config", slow_read_config)
+    slow = asyncio.gather(call("installed"), call("config-list"))
+    try:
+        # Both reads are blocked at once, so they are on the pool, not the event loop.
+        await asyncio.wait_for(both_entered(), 5)
+        fast = await call("search", query="git")
+        assert finished == ["search"]
+    finally:
+        release.set()
+    installed, configured = await slow
+
+    assert fast["result"]["structuredContent"]["servers"]
+    assert installed["result"]["structuredContent"]["count"] == 0
+    assert configured["result"]["structuredContent"]["count"] == 1
+    assert finished[0] == "search" and set(finished[1:]) == {"installed", "config-list"}
+
+
+@pytest.mark.asyncio
+async def test_registry_breaker_opens_when_a_source_hangs(tmp_path):
+    connections = []
+
+    async def hang(reader, _writer):
+        connections.append(1)
+        await reader.read()  # never answer; wait for the client to give up
+
+    server = await asyncio.start_server(hang, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/v0.1/servers"
+    try:
+        searcher = MCPPackageManager(home=tmp_path / "search", registry_url=f"{url}#timeout=0.3")
+        searcher._index_registry([{"name": "io.test/local"}], "test")
+        await searcher.search_page("nothing-local")
+        assert len(connections) == 1
+        assert await searcher.breaker.retry_in(url) > 0
+        await searcher.search_page("nothing-local")
+        assert len(connections) == 1
+
+        merged = f"{url}#timeout=0.3,builtin"
+        first = MCPPackageManager(home=tmp_path / "merge", registry_url=merged)
+        await first._fetch_registry()
+        assert len(connections) == 2
+        second = MCPPackageManager(home=tmp_path / "merge", registry_url=merged)
+        await second._fetch_registry()
+        assert len(connections) == 2
+        assert second.registry
+    finally:
+        server.close()
+
+
+async def _http(port, method, body=None, headers=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = json.dumps(body).encode() if body is not None else b""
+    lines = [f"{method} /mcp HTTP/1.1", "Host: localhost", "Connection: close"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    lines.append(f"Content-Length: {len(payload)}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + payload)
+    raw = await reader.read()
+    writer.close()
+    head, _, content = raw.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode().split("\r\n")
+    response_headers = dict(line.split(": ", 1) for line in header_lines)
+    return int(status_line.split()[1]), response_headers, json.loads(content) if content else None
+
+
+@pytest.mark.asyncio
+async def test_http_transport_shares_manager_across_sessions(manager):
+    from http_transport import StreamableHTTPServer
+
+    transport = StreamableHTTPServer(describe.http_handler(manager), encode_response)
+    server = await transport.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        status, headers, body = await _http(
+            port, "POST", {"jsonrpc": "2.0", "id": 1, "method": "initialize"}
+        )
+        assert status == 200
+        assert body["result"]["serverInfo"]["name"] == "describe"
+        # No watcher or event stream runs under HTTP, so subscriptions are not offered.
+        assert body["result"]["capabilities"]["resources"]["subscribe"] is False
+        session = headers["Mcp-Session-Id"]
+        subscribe = {"jsonrpc": "2.0", "id": 9, "method": "resources/subscribe"}
+        subscribe["params"] = {"uri": "describe://servers/installed"}
+        status, _, body = await _http(port, "POST", subscribe, {"Mcp-Session-Id": session})
+        assert body["error"]["code"] == -32601
+        assert not describe.WATCHER.subscriptions
+
+        call = {"jsonrpc": "2.0", "id": 2, "method": "tools/call"}
+        call["params"] = {"name": "search", "arguments": {"query": "git"}}
+        assert (await _http(port, "POST", call))[0] == 400
+        assert (await _http(port, "POST", call, {"Mcp-Session-Id": "nope"}))[0] == 404
+        results = await asyncio.gather(
+            *(_http(port, "POST", call, {"Mcp-Session-Id": session}) for _ in range(3))
+        )
+        assert [status for status, _, _ in results] == [200, 200, 200]
+        assert manager.registry
+
+        notification = {"jsonrpc": "2.0", "method": "initialized"}
+        assert (await _http(port, "POST", notification, {"Mcp-Session-Id": session}))[0] == 202
+        batch = [dict(call, id=3), {"jsonrpc": "2.0", "id": 4, "method": "tools/list"}]
+        status, _, body = await _http(port, "POST", batch, {"Mcp-Session-Id": session})
+        assert status == 200
+        assert [response["id"] for response in body] == [3, 4]
+        assert (await _http(port, "GET", headers={"Mcp-Session-Id": session}))[0] == 405
+        origin = {"Mcp-Session-Id": session, "Origin": "http://evil.example"}
+        assert (await _http(port, "POST", call, origin))[0] == 403
+        assert (await _http(port, "DELETE", headers={"Mcp-Session-Id": session}))[0] == 204
+        assert (await _http(port, "POST", call, {"Mcp-Session-Id": session}))[0] == 404
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])